@@ -40,6 +40,11 @@ GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE controlled.route_container TO ods_
 
 GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE controlled.route_waypoint TO ods_write_au;
 
+-- ROUTE GEOMETRY
+
+GRANT SELECT ON TABLE controlled.route_geom TO ods_write_au;
+GRANT SELECT ON TABLE controlled.route_geom TO ods_read;
+
 -- ROUTE
 GRANT SELECT, INSERT, UPDATE, DELETE ON controlled.route TO ods_write_au;
 
@@ -1,15 +1,18 @@
+import asyncio
 import logging
 from datetime import date
+from typing import Callable
 
 import ulid
 from bas_air_unit_network_dataset.models.route import Route
 from bas_air_unit_network_dataset.models.route_waypoint import RouteWaypoint
 from bas_air_unit_network_dataset.models.waypoint import Waypoint
 from bas_air_unit_network_dataset.networks.bas_air_unit import MainAirUnitNetwork
-from psycopg.sql import SQL, Identifier
+from psycopg import Connection
+from psycopg.sql import SQL, Composed, Identifier
 
 from ops_data_store.config import Config
-from ops_data_store.db import DBClient
+from ops_data_store.db import AsyncDBClient, DBClient
 
 
 class AirUnitNetworkClient:
@@ -31,20 +34,37 @@ class AirUnitNetworkClient:
         self.network = MainAirUnitNetwork(output_path=self.output_path)
 
         self.db_client = DBClient()
+        self.async_db_client = AsyncDBClient()
 
-    def _fetch_waypoints(self) -> None:
-        """Load waypoints from database into network."""
-        self.logger.info("Fetching waypoints from database.")
+        self._notify_channel = "airnet_changed"
 
+    def _waypoints_query(self) -> Composed:
+        """Query for waypoints."""
         # noinspection SqlResolve,SqlMissingColumnAliases
-        query = SQL(
+        return SQL(
             """
             SELECT
                 pid, id, st_x(geom), st_y(geom), name, colocated_with, last_accessed_at, last_accessed_by, fuel, elevation_ft, comment, category
             FROM {}.{}
             """
         ).format(Identifier(self.config.DATA_MANAGED_SCHEMA_NAME), Identifier(self.config.DATA_AIRNET_WAYPOINTS_TABLE))
-        results = self.db_client.fetch(query=query)
+
+    def _route_waypoints_query(self) -> Composed:
+        """Query for route waypoints, in route sequence."""
+        # noinspection SqlResolve,SqlMissingColumnAliases
+        return SQL("""SELECT route_pid, waypoint_pid, sequence FROM {}.{} ORDER BY route_pid, sequence""").format(
+            Identifier(self.config.DATA_MANAGED_SCHEMA_NAME), Identifier(self.config.DATA_AIRNET_ROUTE_WAYPOINTS_TABLE)
+        )
+
+    def _routes_query(self) -> Composed:
+        """Query for routes."""
+        # noinspection SqlResolve,SqlMissingColumnAliases
+        return SQL("""SELECT pid, id FROM {}.{}""").format(
+            Identifier(self.config.DATA_MANAGED_SCHEMA_NAME), Identifier(self.config.DATA_AIRNET_ROUTES_TABLE)
+        )
+
+    def _load_waypoints(self, results: list[tuple]) -> None:
+        """Load waypoints from query results into network."""
         self.logger.debug(f"query count: {len(results)}")
 
         for result in results:
@@ -73,15 +93,12 @@ class AirUnitNetworkClient:
             self.logger.debug(f"Loading: {waypoint}")
             self.network.waypoints.append(waypoint)
 
-    def _fetch_routes(self) -> None:
-        """Load route and route waypoints from database into network."""
-        self.logger.info("Fetching routes and route_waypoints from database.")
+    def _load_routes(self, route_waypoint_results: list[tuple], route_results: list[tuple]) -> None:
+        """
+        Load routes and route waypoints from query results into network.
 
-        # noinspection SqlResolve,SqlMissingColumnAliases
-        query = SQL("""SELECT route_pid, waypoint_pid, sequence FROM {}.{} ORDER BY route_pid, sequence""").format(
-            Identifier(self.config.DATA_MANAGED_SCHEMA_NAME), Identifier(self.config.DATA_AIRNET_ROUTE_WAYPOINTS_TABLE)
-        )
-        route_waypoint_results = self.db_client.fetch(query=query)
+        Waypoints must be loaded first.
+        """
         self.logger.debug(f"route waypoint query count: {len(route_waypoint_results)}")
 
         route_waypoints = {}
@@ -93,11 +110,6 @@ class AirUnitNetworkClient:
                 RouteWaypoint(waypoint=waypoint, sequence=result[2])
             )
 
-        # noinspection SqlResolve,SqlMissingColumnAliases
-        query = SQL("""SELECT pid, id FROM {}.{}""").format(
-            Identifier(self.config.DATA_MANAGED_SCHEMA_NAME), Identifier(self.config.DATA_AIRNET_ROUTES_TABLE)
-        )
-        route_results = self.db_client.fetch(query=query)
         self.logger.debug(f"route query count: {len(route_results)}")
 
         for result in route_results:
@@ -111,11 +123,74 @@ class AirUnitNetworkClient:
             self.logger.debug(f"Loading: {route}")
             self.network.routes.append(route)
 
+    def _fetch_waypoints(self) -> None:
+        """Load waypoints from database into network."""
+        self.logger.info("Fetching waypoints from database.")
+        self._load_waypoints(results=self.db_client.fetch(query=self._waypoints_query()))
+
+    def _fetch_routes(self) -> None:
+        """Load route and route waypoints from database into network."""
+        self.logger.info("Fetching routes and route_waypoints from database.")
+        route_waypoint_results = self.db_client.fetch(query=self._route_waypoints_query())
+        route_results = self.db_client.fetch(query=self._routes_query())
+        self._load_routes(route_waypoint_results=route_waypoint_results, route_results=route_results)
+
     def fetch(self) -> None:
-        """Load data from database into network."""
+        """
+        Load data from database into network.
+
+        Any previously fetched data is discarded, so the same client can be used for repeated conversions.
+        """
+        self.network = MainAirUnitNetwork(output_path=self.output_path)
         self._fetch_waypoints()
         self._fetch_routes()
 
+    async def fetch_async(self) -> None:
+        """
+        Load data from database into network, running queries concurrently.
+
+        Waypoints, route waypoints and routes are independent queries, so are fetched at the same time (using separate
+        connections), rather than one after another. Results are then loaded into the network as per `fetch()`.
+        """
+        self.logger.info("Fetching waypoints, routes and route_waypoints from database concurrently.")
+        waypoint_results, route_waypoint_results, route_results = await asyncio.gather(
+            self.async_db_client.fetch(query=self._waypoints_query()),
+            self.async_db_client.fetch(query=self._route_waypoints_query()),
+            self.async_db_client.fetch(query=self._routes_query()),
+        )
+
+        self.network = MainAirUnitNetwork(output_path=self.output_path)
+        self._load_waypoints(results=waypoint_results)
+        self._load_routes(route_waypoint_results=route_waypoint_results, route_results=route_results)
+
+    def _wait_for_changes(self, conn: Connection, debounce: float) -> set[str]:
+        """
+        Wait for changes to waypoints or routes to settle.
+
+        Blocks until a change notification is received, then until no further notifications are received for
+        `debounce` seconds. Returns the names of changed tables.
+        """
+        changed = {notify.payload for notify in conn.notifies(stop_after=1)}
+        while True:
+            notifies = list(conn.notifies(timeout=debounce, stop_after=1))
+            if not notifies:
+                return changed
+            changed.update(notify.payload for notify in notifies)
+
+    def listen(self, on_change: Callable[[], None], debounce: float = 5) -> None:
+        """
+        Call `on_change` after changes to waypoints or routes, until interrupted.
+
+        Changes are notified by database triggers. Changes are debounced, so that a series of edits (e.g. saving
+        several layers in QGIS) results in a single call once edits stop for `debounce` seconds.
+        """
+        self.logger.info("Listening for changes to waypoints and routes.")
+        with self.db_client.listen(channel=self._notify_channel) as conn:
+            while True:
+                changed = self._wait_for_changes(conn=conn, debounce=debounce)
+                self.logger.info("Changes to: %s settled.", ", ".join(sorted(changed)))
+                on_change()
+
     def export(self) -> None:
         """Convert network to output formats."""
         self.logger.info("Exporting waypoints as PDF.")
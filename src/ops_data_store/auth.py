@@ -1,15 +1,48 @@
 from __future__ import annotations
 
+import atexit
+import json
 import logging
-import weakref
-from typing import Optional
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, ClassVar, Optional, TypeVar
 
 import ldap
 import requests
-from ldap.ldapobject import SimpleLDAPObject
-from msal import ConfidentialClientApplication
+from ldap.controls import SimplePagedResultsControl
+from ldap.dn import str2dn
+from ldap.filter import escape_filter_chars
+from ldap.ldapobject import ReconnectLDAPObject
+from msal import ConfidentialClientApplication, SerializableTokenCache
+from requests.adapters import HTTPAdapter
 
 from ops_data_store.config import Config
+from ops_data_store.db import DBClient
+from ops_data_store.metrics import Metrics
+
+T = TypeVar("T")
+
+
+@dataclass
+class GroupMembersDelta:
+    """
+    Changes to members of an Azure group.
+
+    Where `full` is true, `added` contains all current members of the group (e.g. as no previous delta link was given,
+    or it had expired) and any previously known members should be discarded.
+    """
+
+    added: list[str]
+    removed: list[str]
+    delta_link: str
+    full: bool
 
 
 class AzureClient:
@@ -17,8 +50,23 @@ class AzureClient:
     Application Azure client.
 
     Used for accessing resources protected by the Microsoft Azure Entra (Active Directory).
+
+    Requests to the MS Graph API use a shared session so connections are kept alive and reused across requests,
+    including when fetching members of multiple groups concurrently.
+
+    Where information on multiple groups is needed, requests are combined using the MS Graph JSON batching API, which
+    accepts up to 20 requests per call.
+
+    Access tokens are reused for all requests until they are close to expiring. If `AUTH_AZURE_TOKEN_CACHE_PATH` is
+    set, tokens are also cached in a file (only readable by the current user) so they can be reused by later processes.
     """
 
+    max_workers = 8
+    page_size = 999
+    batch_size = 20
+    ids_size = 1000
+    token_expiry_margin = 300
+
     def __init__(self) -> None:
         """Create instance."""
         self.config = Config()
@@ -26,32 +74,155 @@ class AzureClient:
         self.logger = logging.getLogger("app")
         self.logger.info("Creating Azure client.")
 
+        self._token_cache_path: Optional[Path] = self.config.AUTH_AZURE_TOKEN_CACHE_PATH
+        self._token_cache = SerializableTokenCache()
+        self._load_token_cache()
+
         self.client = ConfidentialClientApplication(
             authority=self.config.AUTH_AZURE_AUTHORITY,
             client_id=self.config.AUTH_AZURE_CLIENT_ID,
             client_credential=self.config.AUTH_AZURE_CLIENT_SECRET,
+            token_cache=self._token_cache,
         )
 
+        self._token: Optional[str] = None
+        self._token_expires_at: float = 0
+        self._token_lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _load_token_cache(self) -> None:
+        """Load token cache from file if configured and it exists."""
+        if self._token_cache_path is None or not self._token_cache_path.exists():
+            return
+
+        self.logger.info("Loading token cache from: %s", self._token_cache_path.resolve())
+        self._token_cache.deserialize(self._token_cache_path.read_text())
+
+    def _save_token_cache(self) -> None:
+        """
+        Save token cache to file if configured and changed.
+
+        The file is replaced atomically and only readable by the current user.
+        """
+        if self._token_cache_path is None or not self._token_cache.has_state_changed:
+            return
+
+        self.logger.info("Saving token cache to: %s", self._token_cache_path.resolve())
+        tmp_path = self._token_cache_path.with_name(f"{self._token_cache_path.name}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, mode="w") as file:
+            file.write(self._token_cache.serialize())
+        tmp_path.replace(self._token_cache_path)
+        self._token_cache.has_state_changed = False
+
     def _get_token(self) -> str:
-        """Acquire Azure access token."""
-        self.logger.info("Attempting to acquire access token silently (from cache).")
-        result = self.client.acquire_token_silent(self.config.AUTH_AZURE_SCOPES, account=None)
+        """
+        Acquire Azure access token.
 
-        if not result:
-            self.logger.info("Failed to acquire token silently, attempting to request fresh token.")
-            result = self.client.acquire_token_for_client(scopes=self.config.AUTH_AZURE_SCOPES)
+        The token is reused until it is within `token_expiry_margin` seconds of expiring.
+        """
+        with self._token_lock:
+            if self._token is not None and time.monotonic() < self._token_expires_at:
+                return self._token
 
-        try:
-            self.logger.info("Access token: %s", result.get("access_token"))
-            return result["access_token"]
-        except KeyError as e:
-            self.logger.error(e, exc_info=True)
-            self.logger.info("Error: %s", result["error"])
-            self.logger.info("Error description: %s", result["error_description"])
-            self.logger.info("Correlation ID: %s", result["correlation_id"])
+            self.logger.info("Attempting to acquire access token silently (from cache).")
+            result = self.client.acquire_token_silent(self.config.AUTH_AZURE_SCOPES, account=None)
 
-            msg = "Failed to acquire Azure token."
-            raise RuntimeError(msg) from e
+            if not result:
+                self.logger.info("Failed to acquire token silently, attempting to request fresh token.")
+                result = self.client.acquire_token_for_client(scopes=self.config.AUTH_AZURE_SCOPES)
+
+            try:
+                self._token = result["access_token"]
+            except KeyError as e:
+                self.logger.error(e, exc_info=True)
+                self.logger.info("Error: %s", result["error"])
+                self.logger.info("Error description: %s", result["error_description"])
+                self.logger.info("Correlation ID: %s", result["correlation_id"])
+
+                msg = "Failed to acquire Azure token."
+                raise RuntimeError(msg) from e
+
+            self.logger.info("Access token acquired, expires in %s seconds.", result.get("expires_in"))
+            self._token_expires_at = time.monotonic() + result.get("expires_in", 0) - self.token_expiry_margin
+            self._save_token_cache()
+            return self._token
+
+    def _get(self, url: str, params: Optional[dict] = None) -> requests.Response:
+        """Make GET request to MS Graph API using shared session."""
+        headers = {"Authorization": f"Bearer {self._get_token()}"}
+        with Metrics.timed("azure.graph_get") as timing:
+            r = self.session.get(url=url, params=params, headers=headers, timeout=10)
+            timing.bytes = len(r.content)
+        return r
+
+    def _batch(self, urls: dict[str, str], bodies: Optional[dict[str, dict]] = None) -> dict[str, dict]:
+        """
+        Make multiple requests to MS Graph API using JSON batching.
+
+        `urls` are relative to the MS Graph API endpoint (e.g. `/groups/123`), indexed by an ID for each request.
+        Requests are GET requests, unless a JSON body is given in `bodies` (using the same ID), which are POST requests.
+
+        Returns the response for each request (a dict with `status` and parsed `body` keys), indexed by request ID.
+        """
+        bodies = bodies if bodies is not None else {}
+        responses = {}
+        request_ids = list(urls.keys())
+        for i in range(0, len(request_ids), self.batch_size):
+            batch = []
+            for request_id in request_ids[i : i + self.batch_size]:
+                request = {"id": request_id, "method": "GET", "url": urls[request_id]}
+                if request_id in bodies:
+                    request["method"] = "POST"
+                    request["body"] = bodies[request_id]
+                    request["headers"] = {"Content-Type": "application/json"}
+                batch.append(request)
+            self.logger.info("Sending batch of %s requests to MS Graph API.", len(batch))
+            headers = {"Authorization": f"Bearer {self._get_token()}"}
+            with Metrics.timed("azure.graph_batch") as timing:
+                r = self.session.post(
+                    url=f"{self.config.AUTH_MS_GRAPH_ENDPOINT}/$batch",
+                    json={"requests": batch},
+                    headers=headers,
+                    timeout=10,
+                )
+                timing.rows = len(batch)
+                timing.bytes = len(r.content)
+            r.raise_for_status()
+            responses.update({response["id"]: response for response in r.json()["responses"]})
+
+        return responses
+
+    @staticmethod
+    def _is_missing(status: int, body: dict) -> bool:
+        """Determine if an MS Graph API response indicates an object does not exist."""
+        if status == 404:
+            return True
+        return status == 400 and "Invalid object identifier" in body.get("error", {}).get("message", "")
+
+    def _get_members_pages(self, data: dict) -> list[str]:
+        """
+        Get User Principal Name's (UPNs) from a page of group members and any following pages.
+
+        Following pages are fetched by following `@odata.nextLink` references. Members without a UPN (e.g. nested
+        groups or devices) are skipped.
+        """
+        upns = []
+        while True:
+            upns.extend(member["userPrincipalName"] for member in data["value"] if member.get("userPrincipalName"))
+
+            # next link already includes query parameters
+            url = data.get("@odata.nextLink")
+            if url is None:
+                return upns
+
+            r = self._get(url=url)
+            r.raise_for_status()
+            data = r.json()
 
     def check_token(self) -> None:
         """
@@ -69,18 +240,9 @@ class AzureClient:
         """
         self.logger.info("Checking group ID: %s exists.", group_id)
 
-        r = requests.get(
-            url=f"{self.config.AUTH_MS_GRAPH_ENDPOINT}/groups/{group_id}",
-            headers={"Authorization": f"Bearer {self._get_token()}"},
-            timeout=10,
-        )
+        r = self._get(url=f"{self.config.AUTH_MS_GRAPH_ENDPOINT}/groups/{group_id}")
 
-        if (
-            r.status_code == 400
-            and "error" in r.json()
-            and "message" in r.json()["error"]
-            and "Invalid object identifier" in r.json()["error"]["message"]
-        ):
+        if self._is_missing(status=r.status_code, body=r.json()):
             msg = f"Group ID: {group_id} does not exist."
             self.logger.error(msg)
             raise ValueError(msg) from None
@@ -90,34 +252,293 @@ class AzureClient:
     def get_group_name(self, group_id: str) -> str:
         """Get display name of Azure group."""
         self.logger.info("Getting display name of group ID: %s.", group_id)
-        r = requests.get(
-            url=f"{self.config.AUTH_MS_GRAPH_ENDPOINT}/groups/{group_id}",
-            headers={"Authorization": f"Bearer {self._get_token()}"},
-            timeout=10,
-        )
+        r = self._get(url=f"{self.config.AUTH_MS_GRAPH_ENDPOINT}/groups/{group_id}")
         r.raise_for_status()
+        name = r.json()["displayName"]
 
-        self.logger.info("group ID: %s DisplayName is: %s", group_id, r.json()["displayName"])
-        return r.json()["displayName"]
+        self.logger.info("group ID: %s DisplayName is: %s", group_id, name)
+        return name
 
     def get_group_members(self, group_id: str) -> list[str]:
         """
         Get User Principal Name's (UPNs) of members of an Azure group.
 
         In Azure the UPN is the user's email address (e.g. conwat@bas.ac.uk).
+
+        All pages of results are fetched. Members without a UPN (e.g. nested groups or devices) are skipped.
         """
         self.logger.info("Getting members of group ID: %s from MS Graph API.", group_id)
-        r = requests.get(
+        r = self._get(
             url=f"{self.config.AUTH_MS_GRAPH_ENDPOINT}/groups/{group_id}/members",
-            headers={"Authorization": f"Bearer {self._get_token()}"},
-            timeout=10,
+            params={"$select": "userPrincipalName", "$top": self.page_size},
         )
         r.raise_for_status()
 
-        upns = [member["userPrincipalName"] for member in r.json()["value"]]
+        upns = self._get_members_pages(data=r.json())
         self.logger.info("Members (%s): %s", len(upns), ", ".join(upns))
         return upns
 
+    def get_groups(self, group_ids: list[str]) -> dict[str, Optional[dict]]:
+        """
+        Get ID and display name of multiple Azure groups.
+
+        Groups are fetched using batched requests. Returns a dictionary of group properties indexed by group ID, or
+        None where a group does not exist.
+        """
+        self.logger.info("Getting %s groups from MS Graph API.", len(group_ids))
+        responses = self._batch(urls={group_id: f"/groups/{group_id}?$select=id,displayName" for group_id in group_ids})
+
+        groups = {}
+        for group_id in group_ids:
+            response = responses[group_id]
+            if self._is_missing(status=response["status"], body=response["body"]):
+                groups[group_id] = None
+                continue
+            if response["status"] >= 400:
+                msg = f"Failed to get group ID: {group_id}."
+                self.logger.error("%s Response: %s", msg, response["body"])
+                raise RuntimeError(msg)
+            groups[group_id] = response["body"]
+
+        return groups
+
+    def check_groups(self, group_ids: list[str]) -> list[str]:
+        """
+        Check Azure groups exist.
+
+        Any groups that are found are returned.
+        """
+        self.logger.info("Checking group IDs: %s exist.", ", ".join(group_ids))
+        groups = self.get_groups(group_ids=group_ids)
+
+        found = [group_id for group_id, group in groups.items() if group is not None]
+        self.logger.info("Group IDs found: %s", found)
+        self.logger.info("Group IDs missing: %s", [group_id for group_id in group_ids if group_id not in found])
+        return found
+
+    def get_group_names(self, group_ids: list[str]) -> dict[str, str]:
+        """
+        Get display names of multiple Azure groups.
+
+        Returns a dictionary of display names indexed by group ID. Groups that do not exist are omitted.
+        """
+        groups = self.get_groups(group_ids=group_ids)
+        return {group_id: group["displayName"] for group_id, group in groups.items() if group is not None}
+
+    def get_groups_members(self, group_ids: list[str]) -> dict[str, list[str]]:
+        """
+        Get User Principal Name's (UPNs) of members of multiple Azure groups.
+
+        The first page of members for each group is fetched using batched requests, any further pages are fetched
+        concurrently. Returns a dictionary of member UPNs indexed by group ID.
+        """
+        if len(group_ids) == 0:
+            return {}
+
+        self.logger.info("Getting members of %s groups from MS Graph API.", len(group_ids))
+        query = f"$select=userPrincipalName&$top={self.page_size}"
+        responses = self._batch(urls={group_id: f"/groups/{group_id}/members?{query}" for group_id in group_ids})
+
+        for group_id in group_ids:
+            if responses[group_id]["status"] >= 400:
+                msg = f"Failed to get members of group ID: {group_id}."
+                self.logger.error("%s Response: %s", msg, responses[group_id]["body"])
+                raise RuntimeError(msg)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(group_ids))) as executor:
+            results = executor.map(
+                lambda group_id: self._get_members_pages(data=responses[group_id]["body"]), group_ids
+            )
+            members = dict(zip(group_ids, results))
+
+        for group_id, upns in members.items():
+            self.logger.info("Members of group ID: %s (%s): %s", group_id, len(upns), ", ".join(upns))
+        return members
+
+    def get_group_members_delta(self, group_id: str, delta_link: Optional[str] = None) -> GroupMembersDelta:
+        """
+        Get changes to members of an Azure group using a delta query.
+
+        Without a `delta_link`, all current members are returned as added. With a `delta_link` (from a previous call),
+        only users added or removed since that call are returned. If the delta link has expired, all current members
+        are returned instead.
+
+        Members are identified by their object ID, rather than UPN, use `get_users_upns` to convert. Members that are
+        not users (e.g. nested groups or devices) are skipped.
+        """
+        self.logger.info("Getting changes to members of group ID: %s from MS Graph API.", group_id)
+        full = delta_link is None
+        url = delta_link
+        params = None
+        if full:
+            url = f"{self.config.AUTH_MS_GRAPH_ENDPOINT}/groups/delta"
+            params = {"$filter": f"id eq '{group_id}'", "$select": "members"}
+
+        added = []
+        removed = []
+        while True:
+            r = self._get(url=url, params=params)
+            if r.status_code == 410 and not full:
+                self.logger.info("Delta link for group ID: %s expired, getting all members.", group_id)
+                return self.get_group_members_delta(group_id=group_id)
+            r.raise_for_status()
+            data = r.json()
+
+            for group in data["value"]:
+                for member in group.get("members@delta", []):
+                    if member.get("@odata.type", "#microsoft.graph.user") != "#microsoft.graph.user":
+                        continue
+                    (removed if "@removed" in member else added).append(member["id"])
+
+            if "@odata.deltaLink" in data:
+                self.logger.info("Members added (%s), removed (%s).", len(added), len(removed))
+                return GroupMembersDelta(added=added, removed=removed, delta_link=data["@odata.deltaLink"], full=full)
+
+            # next link already includes query parameters
+            url = data["@odata.nextLink"]
+            params = None
+
+    def get_groups_members_delta(self, delta_links: dict[str, Optional[str]]) -> dict[str, GroupMembersDelta]:
+        """
+        Get changes to members of multiple Azure groups using delta queries.
+
+        `delta_links` are indexed by group ID, use `None` to get all current members of a group.
+
+        Groups are fetched concurrently. Returns changes indexed by group ID.
+        """
+        if len(delta_links) == 0:
+            return {}
+
+        group_ids = list(delta_links.keys())
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(group_ids))) as executor:
+            results = executor.map(
+                lambda group_id: self.get_group_members_delta(group_id=group_id, delta_link=delta_links[group_id]),
+                group_ids,
+            )
+            return dict(zip(group_ids, results))
+
+    def get_users_upns(self, user_ids: list[str]) -> dict[str, str]:
+        """
+        Get User Principal Name's (UPNs) of Azure users from their object IDs.
+
+        Users are looked up in chunks (the most IDs accepted per request), sent using batched requests. Returns UPNs
+        indexed by user ID. Users that do not exist are omitted.
+        """
+        chunks = {str(i): user_ids[i : i + self.ids_size] for i in range(0, len(user_ids), self.ids_size)}
+        if len(chunks) == 0:
+            return {}
+
+        self.logger.info("Getting UPNs of %s users from MS Graph API.", len(user_ids))
+        responses = self._batch(
+            urls={chunk_id: "/directoryObjects/getByIds" for chunk_id in chunks},
+            bodies={chunk_id: {"ids": chunk, "types": ["user"]} for chunk_id, chunk in chunks.items()},
+        )
+
+        upns = {}
+        for chunk_id in chunks:
+            response = responses[chunk_id]
+            if response["status"] >= 400:
+                msg = "Failed to get UPNs of users."
+                self.logger.error("%s Response: %s", msg, response["body"])
+                raise RuntimeError(msg)
+            upns.update({user["id"]: user["userPrincipalName"] for user in response["body"]["value"]})
+
+        return upns
+
+
+class LDAPConnection:
+    """
+    Process-wide LDAP connection.
+
+    A single connection to the LDAP server is created, secured (using StartTLS if configured) and bound when first
+    needed, then shared by all LDAP clients in the process until it exits.
+
+    Connections use `ReconnectLDAPObject`, which reconnects (re-applying options, StartTLS and the bind) and retries
+    if the server has dropped the connection (e.g. when idle) during synchronous operations. Asynchronous operations
+    are not retried automatically, clients use `reconnect()` for these.
+    """
+
+    retry_delay = 5.0
+
+    _connection: Optional[ReconnectLDAPObject] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _connect(cls: type[LDAPConnection]) -> ReconnectLDAPObject:
+        """Create, secure and bind connection using config options."""
+        config = Config()
+        logger = logging.getLogger("app")
+
+        logger.info("Connecting to LDAP server: %s.", config.AUTH_LDAP_URL)
+        connection = ReconnectLDAPObject(
+            config.AUTH_LDAP_URL, retry_max=config.AUTH_LDAP_RETRY_MAX, retry_delay=cls.retry_delay
+        )
+        connection.set_option(ldap.OPT_PROTOCOL_VERSION, ldap.VERSION3)
+        connection.set_option(ldap.OPT_REFERRALS, 0)
+        connection.set_option(ldap.OPT_NETWORK_TIMEOUT, config.AUTH_LDAP_NETWORK_TIMEOUT)
+        connection.set_option(ldap.OPT_TIMEOUT, config.AUTH_LDAP_TIMEOUT)
+        if config.AUTH_LDAP_TLS_CA_CERT_PATH is not None:
+            connection.set_option(ldap.OPT_X_TLS_CACERTFILE, str(config.AUTH_LDAP_TLS_CA_CERT_PATH))
+            connection.set_option(ldap.OPT_X_TLS_NEWCTX, 0)
+
+        if config.AUTH_LDAP_START_TLS:
+            logger.info("Starting TLS.")
+            connection.start_tls_s()
+
+        connection.simple_bind_s(who=config.AUTH_LDAP_BIND_DN, cred=config.AUTH_LDAP_BIND_PASSWORD)
+        logger.info("LDAP bind successful.")
+
+        return connection
+
+    @classmethod
+    def get(cls: type[LDAPConnection]) -> ReconnectLDAPObject:
+        """
+        Get bound connection.
+
+        The connection is created when first requested and reused after. If connecting or binding fails, the next
+        request tries again.
+        """
+        with cls._lock:
+            if cls._connection is None:
+                cls._connection = cls._connect()
+            else:
+                logging.getLogger("app").info("Reusing LDAP connection.")
+            return cls._connection
+
+    @classmethod
+    def reconnect(cls: type[LDAPConnection]) -> None:
+        """Reconnect to the LDAP server, re-applying options, StartTLS and the bind."""
+        config = Config()
+        with cls._lock:
+            if cls._connection is None:
+                return
+            logging.getLogger("app").info("Reconnecting to LDAP server.")
+            cls._connection.reconnect(
+                config.AUTH_LDAP_URL, retry_max=config.AUTH_LDAP_RETRY_MAX, retry_delay=cls.retry_delay
+            )
+
+    @classmethod
+    def close(cls: type[LDAPConnection]) -> None:
+        """
+        Unbind and close connection, if connected.
+
+        Called automatically when the process exits.
+        """
+        with cls._lock:
+            if cls._connection is None:
+                return
+            logger = logging.getLogger("app")
+            logger.info("Attempting to unbind from LDAP server.")
+            try:
+                cls._connection.unbind_s()
+                logger.info("LDAP unbind successful.")
+            except ldap.LDAPError as e:
+                logger.warning(e, exc_info=True)
+            cls._connection = None
+
+
+atexit.register(LDAPConnection.close)
+
 
 class LDAPClient:
     """
@@ -125,10 +546,26 @@ class LDAPClient:
 
     Used for managing resources within an LDAP directory.
 
-    This client will maintain bound to the LDAP server until the class instance is destroyed. It will bind automatically
-    when first needed.
+    This client uses the process-wide LDAP connection (see `LDAPConnection`), which is bound automatically when first
+    needed and shared with other clients. If the connection has been dropped by the server, searches are retried once
+    reconnected. Group modifications in progress are treated as failed and later batches sent once reconnected.
+
+    Searches request results in pages of `page_size` objects (using the Simple Paged Results control) to avoid server
+    size limits. Large multi-valued attributes returned in ranges (e.g. `member;range=0-1499` in Active Directory) are
+    fetched range by range.
+
+    When checking many objects exist, search filters are split into chunks of `filter_chunk_size` objects, which are
+    searched for concurrently.
+
+    Group members are added or removed in batches (sized by the `AUTH_LDAP_MODIFY_BATCH_SIZE` config option), with up
+    to `max_modify_in_flight` batches sent before waiting for results. Failed batches are logged and returned, rather
+    than stopping later batches.
     """
 
+    page_size = 500
+    filter_chunk_size = 50
+    max_modify_in_flight = 4
+
     def __init__(self) -> None:
         """Create instance."""
         self.config = Config()
@@ -136,25 +573,11 @@ class LDAPClient:
         self.logger = logging.getLogger("app")
         self.logger.info("Creating LDAP client.")
 
-        self.client = ldap.initialize(self.config.AUTH_LDAP_URL)
+        self.client: Optional[ReconnectLDAPObject] = None
         self._is_bound = False
 
-        self._finalizer = weakref.finalize(self, self._unbind, self.logger, self.client)
-
-    @classmethod
-    def _unbind(cls: LDAPClient, logger: logging.Logger, client: SimpleLDAPObject) -> None:
-        """
-        Unbind from LDAP server.
-
-        This method is called as the '_finalizer' when the class instance is destroyed, as such it cannot access any
-        class attributes and is passed the logger, client, etc. as arguments.
-        """
-        logger.info("Attempting to unbind from LDAP server.")
-        client.unbind_s()
-        logger.info("LDAP unbind successful.")
-
     def _bind(self) -> None:
-        """Bind to LDAP server."""
+        """Bind to LDAP server, using shared connection."""
         self.logger.info("Attempting to bind to LDAP server.")
 
         if self._is_bound:
@@ -162,28 +585,83 @@ class LDAPClient:
             return
 
         try:
-            self.client.simple_bind_s(who=self.config.AUTH_LDAP_BIND_DN, cred=self.config.AUTH_LDAP_BIND_PASSWORD)
-            self.logger.info("LDAP bind successful.")
+            self.client = LDAPConnection.get()
             self._is_bound = True
         except ldap.LDAPError as e:
             self.logger.error(e, exc_info=True)
             msg = "Failed to connect to LDAP server."
             raise RuntimeError(msg) from e
 
-    def _search_objects(self, base: str, ldap_filter: str, attributes: list[str]) -> dict:
+    def _run(self, operation: Callable[[], T]) -> T:
         """
-        Search for objects.
+        Run asynchronous operation, reconnecting and retrying once if the connection was dropped by the server.
 
-        Finds one or more objects within the LDAP server, returning requested attributes for each result (e.g. `["DN"]`).
+        Operations must send requests and collect their results, as message IDs are not valid across connections.
+        """
+        try:
+            return operation()
+        except ldap.SERVER_DOWN:
+            self.logger.warning("LDAP server connection lost, reconnecting.")
+            LDAPConnection.reconnect()
+            return operation()
+
+    def _iter_objects(
+        self, base: str, ldap_filter: str, attributes: list[str], scope: int = ldap.SCOPE_SUBTREE
+    ) -> Iterator[tuple[str, dict]]:
+        """
+        Search for objects, yielding results as each page is received.
+
+        Returns a generator of (DN, attributes) tuples for each result. Search references (referrals) are skipped.
 
         The `base` should be a valid base DN and the `ldap_filter` a valid LDAP search filter.
+
+        Only the first page is retried if the connection was dropped, as later pages depend on the connection.
         """
         self._bind()
         self.logger.info("Searching for: %s in: %s with filter: %s.", attributes, base, ldap_filter)
-        results = self.client.search_s(base=base, scope=ldap.SCOPE_SUBTREE, filterstr=ldap_filter, attrlist=attributes)
-        self.logger.debug("Results: %s", results)
 
-        return results
+        control = SimplePagedResultsControl(criticality=False, size=self.page_size, cookie="")
+
+        def _search_page() -> tuple:
+            with Metrics.timed("ldap.search") as timing:
+                msgid = self.client.search_ext(
+                    base, scope, filterstr=ldap_filter, attrlist=attributes, serverctrls=[control]
+                )
+                result = self.client.result3(msgid)
+                timing.rows = len(result[1])
+            return result
+
+        while True:
+            _, results, _, response_controls = _search_page() if control.cookie else self._run(_search_page)
+            self.logger.debug("Results: %s", results)
+            yield from ((dn, attrs) for dn, attrs in results if dn is not None)
+
+            cookies = [c.cookie for c in response_controls if c.controlType == SimplePagedResultsControl.controlType]
+            if not cookies or not cookies[0]:
+                return
+            control.cookie = cookies[0]
+
+    def _search_objects(
+        self, base: str, ldap_filter: str, attributes: list[str], scope: int = ldap.SCOPE_SUBTREE
+    ) -> list[tuple[str, dict]]:
+        """
+        Search for objects.
+
+        Finds one or more objects within the LDAP server, returning requested attributes for each result (e.g. `["DN"]`).
+
+        The `base` should be a valid base DN and the `ldap_filter` a valid LDAP search filter.
+        """
+        return list(self._iter_objects(base=base, ldap_filter=ldap_filter, attributes=attributes, scope=scope))
+
+    @staticmethod
+    def _escape_object_id(object_id: str) -> str:
+        """
+        Escape value of object ID for use in a search filter.
+
+        Only the value is escaped, e.g. for `cn=con(wat)` only `con(wat)` is escaped.
+        """
+        prefix, _, value = object_id.partition("=")
+        return f"{prefix}={escape_filter_chars(value)}"
 
     def _check_objects(self, base: str, object_ids: list[str]) -> list[str]:
         """
@@ -197,12 +675,32 @@ class LDAPClient:
 
         The `base` should be a valid base DN and `object_ids`, one or more object IDs with correct prefix for the
         LDAP server, e.g. `cn=conwat`.
+
+        Object IDs are searched for in chunks, using OR filters. All chunks are sent before waiting for any results,
+        so they are evaluated by the server concurrently. Chunks are small enough not to need paging.
         """
-        ldap_filter = f"(|{''.join([f'({object_id})' for object_id in object_ids])})"
         dns_searched = [f"{object_id},{base}" for object_id in object_ids]
 
-        results = self._search_objects(base=base, ldap_filter=ldap_filter, attributes=["dn"])
-        dns_found = [result[0] for result in results]
+        self._bind()
+
+        def _search() -> list[str]:
+            msgids = []
+            for i in range(0, len(object_ids), self.filter_chunk_size):
+                chunk = object_ids[i : i + self.filter_chunk_size]
+                ldap_filter = f"(|{''.join([f'({self._escape_object_id(object_id)})' for object_id in chunk])})"
+                self.logger.info("Searching for: %s in: %s with filter: %s.", ["dn"], base, ldap_filter)
+                msgids.append(self.client.search_ext(base, ldap.SCOPE_SUBTREE, filterstr=ldap_filter, attrlist=["dn"]))
+
+            found = []
+            for msgid in msgids:
+                _, results, _, _ = self.client.result3(msgid)
+                self.logger.debug("Results: %s", results)
+                found.extend(dn for dn, _ in results if dn is not None)
+            return found
+
+        with Metrics.timed("ldap.check") as timing:
+            dns_found = self._run(_search)
+            timing.rows = len(dns_found)
         dns_missing = list(set(dns_searched) - set(dns_found))
         self.logger.info("Distinguished names found: %s", dns_found)
         self.logger.info("Distinguished names missing: %s", dns_missing)
@@ -243,64 +741,184 @@ class LDAPClient:
         ldap_base = f"ou={self.config.AUTH_LDAP_OU_GROUPS},{self.config.AUTH_LDAP_BASE_DN}"
         return self._check_objects(base=ldap_base, object_ids=group_ids)
 
-    def get_group_members(self, group_dn: str) -> list[str]:
+    def iter_group_members(self, group_dn: str) -> Iterator[str]:
         """
-        Get Distinguished Names (DNs) of members of a group.
+        Get Distinguished Names (DNs) of members of a group as a generator.
+
+        Where the server returns members in ranges (e.g. `member;range=0-1499`), each further range is requested in
+        turn until the last (e.g. `member;range=1500-*`) is received.
 
         The group DN should use the correct naming context prefix for the LDAP server, e.g. `cn=admins`.
         """
-        ldap_filter = f"({group_dn.split(',')[0]})"
+        ldap_filter = f"({self._escape_object_id(group_dn.split(',')[0])})"
         ldap_base = ",".join(group_dn.split(",")[1:])
 
         results = self._search_objects(base=ldap_base, ldap_filter=ldap_filter, attributes=["member"])
+        dn, attributes = results[0]
+
+        while True:
+            ranged = [key for key in attributes if key.lower().startswith("member;range=")]
+            if not ranged:
+                yield from (member.decode() for member in attributes.get("member", []))
+                return
+
+            yield from (member.decode() for member in attributes[ranged[0]])
+            end = ranged[0].split("-")[-1]
+            if end == "*":
+                return
+
+            attribute = f"member;range={int(end) + 1}-*"
+            results = self._search_objects(
+                base=dn, ldap_filter="(objectClass=*)", attributes=[attribute], scope=ldap.SCOPE_BASE
+            )
+            attributes = results[0][1]
 
-        return [member.decode() for member in results[0][1]["member"]]
+    def get_group_members(self, group_dn: str) -> list[str]:
+        """
+        Get Distinguished Names (DNs) of members of a group.
+
+        The group DN should use the correct naming context prefix for the LDAP server, e.g. `cn=admins`.
+        """
+        return list(self.iter_group_members(group_dn=group_dn))
 
-    def add_to_group(self, group_dn: str, user_dns: list[str]) -> None:
+    def _modify_group_members(self, group_dn: str, op: int, user_dns: list[str]) -> list[str]:
+        """
+        Add or remove group members in batches.
+
+        Batches are sent using the asynchronous LDAP API, with up to `max_modify_in_flight` batches awaiting results
+        at once. Results are collected in order, with any batch that fails logged without stopping other batches.
+
+        If the connection was dropped by the server, batches in progress are treated as failed (as they may or may not
+        have been applied) and later batches sent once reconnected.
+
+        Returns the DNs of any members in failed batches.
+        """
+        batch_size = self.config.AUTH_LDAP_MODIFY_BATCH_SIZE
+        batches = [user_dns[i : i + batch_size] for i in range(0, len(user_dns), batch_size)]
+        in_flight: deque[tuple[int, list[str]]] = deque()
+        failed_dns = []
+
+        def _collect() -> None:
+            msgid, batch = in_flight.popleft()
+            try:
+                self.client.result3(msgid)
+            except ldap.LDAPError:
+                self.logger.error("Failed to modify members of group: %s, batch: %s.", group_dn, batch, exc_info=True)
+                failed_dns.extend(batch)
+
+        for i, batch in enumerate(batches):
+            if len(in_flight) >= self.max_modify_in_flight:
+                _collect()
+
+            self.logger.info("Batch %s of %s.", i + 1, len(batches))
+            modlist = [(op, "member", [member.encode() for member in batch])]
+            try:
+                msgid = self.client.modify_ext(group_dn, modlist)
+            except ldap.SERVER_DOWN:
+                while in_flight:
+                    _collect()
+                self.logger.warning("LDAP server connection lost, reconnecting.")
+                LDAPConnection.reconnect()
+                msgid = self.client.modify_ext(group_dn, modlist)
+            in_flight.append((msgid, batch))
+        while in_flight:
+            _collect()
+
+        return failed_dns
+
+    def add_to_group(self, group_dn: str, user_dns: list[str]) -> list[str]:
         """
         Add users to group as members.
 
         The group and all members to be added should be specified using their Distinguished Names (DNs).
+
+        Returns the DNs of any users that could not be added.
         """
         if len(user_dns) == 0:
             self.logger.info("Skipping as no users specified.")
-            return
+            return []
 
         self._bind()
 
-        # batch changes to 10 users to prevent requests being too large
-        for i in range(0, len(user_dns), 10):
-            user_dns_batch = user_dns[i : i + 10]
+        self.logger.info("Group to add to: %s.", group_dn)
+        self.logger.info("Users to add: %s.", user_dns)
+        with Metrics.timed("ldap.add_to_group") as timing:
+            timing.rows = len(user_dns)
+            return self._modify_group_members(group_dn=group_dn, op=ldap.MOD_ADD, user_dns=user_dns)
 
-            self.logger.info("Batch %s of %s.", i + 1, len(user_dns) // 10 + 1)
-            self.logger.info("Group to add to: %s.", group_dn)
-            self.logger.info("Users to add: %s.", user_dns)
-            self.client.modify_s(
-                dn=group_dn, modlist=[(ldap.MOD_ADD, "member", [member.encode() for member in user_dns_batch])]
-            )
-
-    def remove_from_group(self, group_dn: str, user_dns: list[str]) -> None:
+    def remove_from_group(self, group_dn: str, user_dns: list[str]) -> list[str]:
         """
         Remove members from group.
 
         The group and all members to be removed should be specified using their Distinguished Names (DNs).
+
+        Returns the DNs of any users that could not be removed.
         """
         if len(user_dns) == 0:
             self.logger.info("Skipping as no users specified.")
-            return
+            return []
 
         self._bind()
 
-        # batch changes to 10 users to prevent requests being too large
-        for i in range(0, len(user_dns), 10):
-            user_dns_batch = user_dns[i : i + 10]
+        self.logger.info("Group to remove from: %s.", group_dn)
+        self.logger.info("Users to remove: %s.", user_dns)
+        with Metrics.timed("ldap.remove_from_group") as timing:
+            timing.rows = len(user_dns)
+            return self._modify_group_members(group_dn=group_dn, op=ldap.MOD_DELETE, user_dns=user_dns)
 
-            self.logger.info("Batch %s of %s.", i + 1, len(user_dns) // 10 + 1)
-            self.logger.info("Group to remove from: %s.", group_dn)
-            self.logger.info("Users to remove: %s.", user_dns)
-            self.client.modify_s(
-                dn=group_dn, modlist=[(ldap.MOD_DELETE, "member", [member.encode() for member in user_dns_batch])]
-            )
+
+@dataclass
+class SyncDiff:
+    """
+    Difference between members of source Azure groups and a target LDAP group or database role.
+
+    Users are identified by generic usernames (e.g. `conwat`), normalised to lower case. For LDAP groups, users that can
+    be added to, or removed from, the target group are held with their Distinguished Names (DNs).
+    """
+
+    source: set[str] = field(default_factory=set)
+    target: set[str] = field(default_factory=set)
+    missing: set[str] = field(default_factory=set)
+    unknown: set[str] = field(default_factory=set)
+    remove: set[str] = field(default_factory=set)
+    dns: dict[str, str] = field(default_factory=dict)
+
+    @staticmethod
+    def user_id_from_upn(upn: str) -> str:
+        """Get username from User Principal Name (UPN), e.g. `conwat@bas.ac.uk` becomes `conwat`."""
+        return upn.split("@")[0].lower()
+
+    @staticmethod
+    def user_id_from_dn(dn: str) -> str:
+        """Get username from Distinguished Name (DN), e.g. `cn=conwat,ou=users,dc=example,dc=com` becomes `conwat`."""
+        return str2dn(dn)[0][0][1].lower()
+
+    @property
+    def present(self) -> set[str]:
+        """Users in both the source and target groups."""
+        return self.source & self.target
+
+    def applied(self, added: set[str], removed: set[str]) -> SyncDiff:
+        """Difference once users have been added to, and removed from, the target group."""
+        return SyncDiff(
+            source=self.source,
+            target=(self.target - removed) | added,
+            missing=self.missing - added,
+            unknown=self.unknown,
+            remove=self.remove - removed,
+            dns=self.dns,
+        )
+
+    def as_dict(self) -> dict[str, list[str]]:
+        """Users in each category as sorted lists, as returned by `SimpleSyncClient.evaluate`."""
+        return {
+            "source": sorted(self.source),
+            "target": sorted(self.target),
+            "present": sorted(self.present),
+            "missing": sorted(self.missing),
+            "unknown": sorted(self.unknown),
+            "remove": sorted(self.remove),
+        }
 
 
 class SimpleSyncClient:
@@ -310,51 +928,63 @@ class SimpleSyncClient:
     In this simple client, users from one or more (source) Azure groups are synced to a single (target) LDAP group.
     Members in the target group are replaced by the union of those in the source. Any LDAP members not in the Azure
     group are dropped.
+
+    Members are compared as sets of usernames (see `SyncDiff`). The result of evaluating a sync is kept, and used to
+    apply and report on changes, without fetching members again.
     """
 
-    def __init__(self, azure_group_ids: list[str], ldap_group_id: str) -> None:
-        """Create instance."""
+    def __init__(
+        self,
+        azure_group_ids: list[str],
+        ldap_group_id: str,
+        azure_client: Optional[AzureClient] = None,
+        ldap_client: Optional[LDAPClient] = None,
+        source_members: Optional[dict[str, list[str]]] = None,
+    ) -> None:
+        """
+        Create instance.
+
+        Existing Azure and LDAP clients can be given to reuse access tokens and LDAP binds across syncs.
+
+        Members of source Azure groups (UPNs indexed by group ID) can be given if already fetched (e.g. when syncing
+        multiple target groups), in which case source groups are not checked or fetched again.
+        """
         self.config = Config()
 
         self.logger = logging.getLogger("app")
         self.logger.info("Creating sync client.")
 
-        self.azure_client = AzureClient()
-        self.ldap_client = LDAPClient()
+        self.azure_client = azure_client if azure_client is not None else AzureClient()
+        self.ldap_client = ldap_client if ldap_client is not None else LDAPClient()
 
         self.logger.info(f"Azure group IDs: {azure_group_ids}")
         self.logger.info(f"LDAP group ID: {ldap_group_id}")
 
         self._source_group_ids: list[str] = azure_group_ids
+        self._source_members: Optional[dict[str, list[str]]] = source_members
         self._target_group_id: str = ldap_group_id
         self._target_group_dn: Optional[str] = None
 
-        self._source_user_ids: list[str] = []
-        self._target_user_ids: list[str] = []
-
-        self._user_ids_already_in_target: list[str] = []
-        self._user_ids_missing_in_target: list[str] = []
-        self._user_ids_unknown_in_target: list[str] = []
-        self._user_ids_unknown_in_source: list[str] = []
-
-        self._target_dns_del: list[str] = []
-        self._target_dns_add: list[str] = []
+        self._source_user_ids: set[str] = set()
+        self._target_user_ids: set[str] = set()
 
-        self._evaluated: bool = False
+        self._diff: Optional[SyncDiff] = None
 
     def _check_groups_exist(self) -> Optional[str]:
         """
         Check Azure and LDAP groups exist.
 
         Returns Distinguished Name (DN) for LDAP group if it exists.
+
+        Azure groups are not checked if their members were given when created, as they must exist.
         """
-        for group_id in self._source_group_ids:
-            try:
-                self.azure_client.check_group(group_id=group_id)
-            except ValueError as e:
-                msg = f"Azure group {group_id} does not exist."
-                self.logger.error(e, exc_info=True)
-                raise RuntimeError(msg) from e
+        if self._source_members is None:
+            found_group_ids = self.azure_client.check_groups(group_ids=self._source_group_ids)
+            missing_group_ids = [group_id for group_id in self._source_group_ids if group_id not in found_group_ids]
+            if missing_group_ids:
+                msg = f"Azure group {', '.join(missing_group_ids)} does not exist."
+                self.logger.error(msg)
+                raise RuntimeError(msg) from None
 
         ldap_group_uid = f"{self.config.AUTH_LDAP_NAME_CONTEXT_GROUPS}={self._target_group_id}"
         results = self.ldap_client.check_groups(group_ids=[ldap_group_uid])
@@ -365,38 +995,6 @@ class SimpleSyncClient:
         self.logger.error(msg)
         raise RuntimeError(msg) from None
 
-    def _check_target_users(self) -> None:
-        """
-        Check users from source not in target exist in target.
-
-        E.g. If:
-        - a source group contains users `alice`, `bob` and `connie`
-        - a target group contains `alice` and `darren`
-        - the target more widely contains `alice`, `bob` and `darren` (but not `connie`)
-        Then:
-        - `alice` is already in the target group and is ignored as by implication they exist in the target
-        - `bob` and `connie` are searched for in the target
-        - `bob` is found and can be added to the target group
-        - `connie` is not found and cannot be added to the target group as they don't exist in the target
-        """
-        # For users not in the target already, convert IDs to UIDs (e.g. `conwat` -> `cn=conwat`)
-        search_ids = list(set(self._source_user_ids) - set(self._target_user_ids))
-        search_uids = [f"{self.config.AUTH_LDAP_NAME_CONTEXT_USERS}={user}" for user in search_ids]
-
-        # Search for users in target, converting DNs to IDs (e.g. `cn=conwat,ou=users,dc=example,dc=com` -> `conwat`)
-        found_dns = self.ldap_client.check_users(user_ids=search_uids)
-        found_ids = [user.split(",")[0].split("=")[1] for user in found_dns]
-
-        # Distinguish between users not in target and those not in target group
-        self._user_ids_unknown_in_target = list(set(search_ids) - set(found_ids))
-        self._user_ids_missing_in_target = found_ids
-
-        # Store DNs for users to be removed and added
-        search_ids = list(set(self._target_user_ids) - set(self._source_user_ids))
-        search_uids = [f"{self.config.AUTH_LDAP_NAME_CONTEXT_USERS}={user}" for user in search_ids]
-        self._target_dns_del = self.ldap_client.check_users(user_ids=search_uids)
-        self._target_dns_add = found_dns
-
     def _get_source_user_ids(self) -> None:
         """
         Store members of source Azure groups as usernames.
@@ -404,12 +1002,12 @@ class SimpleSyncClient:
         Azure group members are identified by their User Principal Name (UPN, an email address). These need converting
         into generic usernames for comparison with LDAP users. E.g. a user `conwat@bas.ac.uk` becomes `conwat`.
         """
-        members = []
-
-        for group_id in self._source_group_ids:
-            members.extend(self.azure_client.get_group_members(group_id=group_id))
-
-        self._source_user_ids = [member.split("@")[0] for member in members]
+        groups_members = self._source_members
+        if groups_members is None:
+            groups_members = self.azure_client.get_groups_members(group_ids=self._source_group_ids)
+        self._source_user_ids = {
+            SyncDiff.user_id_from_upn(member) for group_members in groups_members.values() for member in group_members
+        }
 
     def _get_target_user_ids(self) -> None:
         """
@@ -419,7 +1017,39 @@ class SimpleSyncClient:
         usernames for comparison with Azure users. E.g. a user `cn=conwat,ou=users,dc=example,dc=com` becomes `conwat`.
         """
         members = self.ldap_client.get_group_members(group_dn=self._target_group_dn)
-        self._target_user_ids = [member.split(",")[0].split("=")[1] for member in members]
+        self._target_user_ids = {SyncDiff.user_id_from_dn(member) for member in members}
+
+    def _get_changes(self) -> tuple[set[str], set[str]]:
+        """
+        Determine users to add to, and remove from, the target group.
+
+        Users to add are in the source but not the target group, users to remove are in the target group but not the
+        source.
+        """
+        return self._source_user_ids - self._target_user_ids, self._target_user_ids - self._source_user_ids
+
+    def _resolve_users(self, user_ids: set[str]) -> dict[str, str]:
+        """
+        Get Distinguished Names (DNs) for users in target LDAP server.
+
+        All users are looked up together. Users that do not exist in the target are omitted.
+
+        E.g. If:
+        - a source group contains users `alice`, `bob` and `connie`
+        - a target group contains `alice` and `darren`
+        - the target more widely contains `alice`, `bob` and `darren` (but not `connie`)
+        Then:
+        - `alice` is already in the target group and is not looked up
+        - `bob`, `connie` and `darren` are looked up
+        - `bob` is found and can be added to the target group, `darren` is found and can be removed
+        - `connie` is not found and cannot be added to the target group as they don't exist in the target
+        """
+        if not user_ids:
+            return {}
+
+        search_uids = [f"{self.config.AUTH_LDAP_NAME_CONTEXT_USERS}={user}" for user in sorted(user_ids)]
+        found_dns = self.ldap_client.check_users(user_ids=search_uids)
+        return {SyncDiff.user_id_from_dn(dn): dn for dn in found_dns}
 
     def evaluate(self) -> dict[str, list[str]]:
         """
@@ -429,8 +1059,8 @@ class SimpleSyncClient:
         (if they exist) and determines which users should be added to or removed from the LDAP group.
 
         It returns a dictionary of [keys] and lists of users that are:
-        -  [target]: in the source group (for information)
-        -  [source]: in the target group (for information)
+        -  [source]: in the source groups (for information)
+        -  [target]: in the target group (for information)
         - [present]: in both the source and target groups (no change needed)
         - [missing]: in the source group but not the target group (can be added)
         - [unknown]: not in the target server (cannot be added)
@@ -442,31 +1072,24 @@ class SimpleSyncClient:
 
         self._get_source_user_ids()
         self._get_target_user_ids()
-        self._check_target_users()
-        self._user_ids_already_in_target = list(set(self._source_user_ids) & set(self._target_user_ids))
-        self._user_ids_unknown_in_source = list(set(self._target_user_ids) - set(self._source_user_ids))
-
-        self.logger.info(f" user IDs target: {self._source_user_ids}")
-        self.logger.info(f" user IDs source: {self._target_user_ids}")
-        self.logger.info(f"user IDs present: {self._user_ids_already_in_target}")
-        self.logger.info(f"user IDs missing: {self._user_ids_missing_in_target}")
-        self.logger.info(f"user IDs unknown: {self._user_ids_unknown_in_target}")
-        self.logger.info(f" user IDs remove: {self._user_ids_unknown_in_source}")
-        self.logger.info(f" user DNs to add: {self._target_dns_add}")
-        self.logger.info(f" user DNs to del: {self._target_dns_del}")
+        add_ids, remove_ids = self._get_changes()
+        dns = self._resolve_users(user_ids=add_ids | remove_ids)
+        self._diff = SyncDiff(
+            source=self._source_user_ids,
+            target=self._target_user_ids,
+            missing=add_ids & dns.keys(),
+            unknown=add_ids - dns.keys(),
+            remove=remove_ids & dns.keys(),
+            dns=dns,
+        )
 
-        self._evaluated = True
+        result = self._diff.as_dict()
+        for key, user_ids in result.items():
+            self.logger.info(f"user IDs {key}: {user_ids}")
 
-        return {
-            "source": self._source_user_ids,
-            "target": self._target_user_ids,
-            "present": self._user_ids_already_in_target,
-            "missing": self._user_ids_missing_in_target,
-            "unknown": self._user_ids_unknown_in_target,
-            "remove": self._user_ids_unknown_in_source,
-        }
+        return result
 
-    def sync(self) -> None:
+    def sync(self) -> dict[str, list[str]]:
         """
         Sync users from one or more Azure groups to an LDAP group.
 
@@ -475,12 +1098,509 @@ class SimpleSyncClient:
         It depends on the `evaluate` method to check source/target groups exist and determine DNs to add/remove.
 
         Users are added before removing to prevent trying to remove the last member of a group which isn't permitted.
+
+        If some users cannot be added or removed, other users are still synced before an error is raised.
+
+        Returns the result of the sync, in the same form as `evaluate`, based on the evaluation and changes applied.
         """
-        if not self._evaluated:
+        if self._diff is None:
             self.logger.info("Sync not yet evaluated, evaluating first.")
 
             self.evaluate()
 
+        diff = self._diff
+        add_dns = [diff.dns[user] for user in sorted(diff.missing)]
+        del_dns = [diff.dns[user] for user in sorted(diff.remove)]
+
         self.logger.info("Syncing members of Azure groups to LDAP.")
-        self.ldap_client.add_to_group(group_dn=self._target_group_dn, user_dns=self._target_dns_add)
-        self.ldap_client.remove_from_group(group_dn=self._target_group_dn, user_dns=self._target_dns_del)
+        failed_add = self.ldap_client.add_to_group(group_dn=self._target_group_dn, user_dns=add_dns)
+        failed_del = self.ldap_client.remove_from_group(group_dn=self._target_group_dn, user_dns=del_dns)
+
+        self._diff = diff.applied(
+            added={user for user in diff.missing if diff.dns[user] not in failed_add},
+            removed={user for user in diff.remove if diff.dns[user] not in failed_del},
+        )
+
+        if failed_add or failed_del:
+            msg = f"Failed to add {len(failed_add)} and remove {len(failed_del)} users in LDAP group."
+            self.logger.error(msg)
+            self.logger.error("Users not added: %s, users not removed: %s.", failed_add, failed_del)
+            raise RuntimeError(msg) from None
+
+        return self._diff.as_dict()
+
+
+class RoleSyncClient:
+    """
+    Sync users from Azure groups to a Postgres role.
+
+    Users from one or more (source) Azure groups are synced to a single (target) database role, as per
+    `SimpleSyncClient` for LDAP groups. Members of the role are compared as sets of usernames (see `SyncDiff`), where
+    database usernames are expected to match generic usernames (e.g. `conwat`).
+
+    Only users directly granted the role are considered. Users listed in the `AUTH_DB_SYNC_IGNORED_USERS` config option
+    (e.g. application and test users) are never granted or revoked the role. As any other user granted the role would
+    be revoked it, syncs are refused if this option is not set. All changes are applied in one transaction.
+    """
+
+    def __init__(
+        self,
+        azure_group_ids: list[str],
+        db_role: str,
+        azure_client: Optional[AzureClient] = None,
+        db_client: Optional[DBClient] = None,
+        source_members: Optional[dict[str, list[str]]] = None,
+    ) -> None:
+        """
+        Create instance.
+
+        Members of source Azure groups can be given if already fetched, as per `SimpleSyncClient`.
+        """
+        self.config = Config()
+
+        self.logger = logging.getLogger("app")
+        self.logger.info("Creating role sync client.")
+
+        self.azure_client = azure_client if azure_client is not None else AzureClient()
+        self.db_client = db_client if db_client is not None else DBClient()
+
+        self.logger.info(f"Azure group IDs: {azure_group_ids}")
+        self.logger.info(f"DB role: {db_role}")
+
+        self._source_group_ids: list[str] = azure_group_ids
+        self._source_members: Optional[dict[str, list[str]]] = source_members
+        self._target_role: str = db_role
+        self._ignored_user_ids: set[str] = set(self.config.AUTH_DB_SYNC_IGNORED_USERS)
+
+        self._source_user_ids: set[str] = set()
+        self._target_user_ids: set[str] = set()
+
+        self._diff: Optional[SyncDiff] = None
+
+    def _check_ignored_users(self) -> None:
+        """Check users to ignore are set, so application and service users are not revoked the target role."""
+        if not self._ignored_user_ids:
+            msg = "No DB users to ignore, set the `AUTH_DB_SYNC_IGNORED_USERS` config option."
+            self.logger.error(msg)
+            raise RuntimeError(msg) from None
+
+    def _check_groups_exist(self) -> None:
+        """Check Azure groups and database role exist."""
+        if self._source_members is None:
+            found_group_ids = self.azure_client.check_groups(group_ids=self._source_group_ids)
+            missing_group_ids = [group_id for group_id in self._source_group_ids if group_id not in found_group_ids]
+            if missing_group_ids:
+                msg = f"Azure group {', '.join(missing_group_ids)} does not exist."
+                self.logger.error(msg)
+                raise RuntimeError(msg) from None
+
+        if self.db_client.check_roles(role_names=[self._target_role]) != [self._target_role]:
+            msg = f"DB role {self._target_role} does not exist."
+            self.logger.error(msg)
+            raise RuntimeError(msg) from None
+
+    def _get_source_user_ids(self) -> None:
+        """Store members of source Azure groups as usernames, excluding ignored users."""
+        groups_members = self._source_members
+        if groups_members is None:
+            groups_members = self.azure_client.get_groups_members(group_ids=self._source_group_ids)
+        self._source_user_ids = {
+            SyncDiff.user_id_from_upn(member) for group_members in groups_members.values() for member in group_members
+        } - self._ignored_user_ids
+
+    def _get_target_user_ids(self) -> None:
+        """Store users granted target database role, excluding ignored users."""
+        members = self.db_client.get_role_members(role_name=self._target_role)
+        self._target_user_ids = set(members) - self._ignored_user_ids
+
+    def evaluate(self) -> dict[str, list[str]]:
+        """
+        Assess syncing users from one or more Azure groups to a database role.
+
+        This method performs no modifications to the database. Users to add are checked to exist in the database in a
+        single query, users that don't exist (e.g. not yet created by the BAS IT User Sync) are returned as unknown.
+
+        Returns a dictionary of users in the same form as `SimpleSyncClient.evaluate`.
+        """
+        self.logger.info("Evaluating Azure group to DB role sync.")
+
+        self._check_ignored_users()
+        self._check_groups_exist()
+        self._get_source_user_ids()
+        self._get_target_user_ids()
+
+        add_ids = self._source_user_ids - self._target_user_ids
+        found_ids = set(self.db_client.check_roles(role_names=sorted(add_ids))) if add_ids else set()
+        self._diff = SyncDiff(
+            source=self._source_user_ids,
+            target=self._target_user_ids,
+            missing=add_ids & found_ids,
+            unknown=add_ids - found_ids,
+            remove=self._target_user_ids - self._source_user_ids,
+        )
+
+        result = self._diff.as_dict()
+        for key, user_ids in result.items():
+            self.logger.info(f"user IDs {key}: {user_ids}")
+
+        return result
+
+    def sync(self) -> dict[str, list[str]]:
+        """
+        Sync users from one or more Azure groups to a database role.
+
+        This method will modify the database!
+
+        It depends on the `evaluate` method to check source groups and target role exist and determine users to
+        grant/revoke. Changes are applied in a single transaction, so if any change fails no changes are made.
+
+        Returns the result of the sync, in the same form as `evaluate`.
+        """
+        if self._diff is None:
+            self.logger.info("Sync not yet evaluated, evaluating first.")
+
+            self.evaluate()
+
+        diff = self._diff
+        self.logger.info("Syncing members of Azure groups to DB role.")
+        self.db_client.set_role_members(
+            role_name=self._target_role, grant=sorted(diff.missing), revoke=sorted(diff.remove)
+        )
+
+        self._diff = diff.applied(added=diff.missing, removed=diff.remove)
+        return self._diff.as_dict()
+
+
+class MultiSyncClient:
+    """
+    Sync users from Azure groups to multiple LDAP groups.
+
+    Target LDAP groups, and their source Azure groups, are defined in a mapping. Each target is synced as per
+    `SimpleSyncClient`, except members of each distinct source group are only fetched once and shared between targets.
+    Targets are evaluated, and synced, concurrently.
+
+    Mappings are JSON objects of source Azure group IDs indexed by target LDAP group ID, e.g.:
+
+    ```
+    {"apps_magic_ods_read": ["3b2c5acf-...", "75ec55c1-..."], "apps_magic_ods_write_fo": ["75ec55c1-..."]}
+    ```
+    """
+
+    max_workers = 4
+
+    def __init__(
+        self,
+        mapping: dict[str, list[str]],
+        azure_client: Optional[AzureClient] = None,
+        ldap_client: Optional[LDAPClient] = None,
+    ) -> None:
+        """Create instance."""
+        self.logger = logging.getLogger("app")
+        self.logger.info("Creating multi-target sync client.")
+
+        self.azure_client = azure_client if azure_client is not None else AzureClient()
+        self.ldap_client = ldap_client if ldap_client is not None else LDAPClient()
+
+        self._mapping = mapping
+        self._clients: dict[str, SimpleSyncClient] = {}
+
+    @staticmethod
+    def load_mapping(path: Path) -> dict[str, list[str]]:
+        """Load and validate mapping of target LDAP groups to source Azure groups from a JSON file."""
+        try:
+            with path.open(mode="r") as file:
+                mapping = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            msg = f"Cannot read sync mapping file: {e}."
+            raise RuntimeError(msg) from e
+
+        if (
+            not isinstance(mapping, dict)
+            or len(mapping) == 0
+            or not all(isinstance(ids, list) and len(ids) > 0 for ids in mapping.values())
+            or not all(isinstance(group_id, str) for ids in mapping.values() for group_id in ids)
+        ):
+            msg = "Invalid sync mapping file, expected an object of Azure group ID lists indexed by LDAP group ID."
+            raise RuntimeError(msg)
+
+        return mapping
+
+    def _get_source_members(self) -> dict[str, list[str]]:
+        """Check and get members of each distinct source Azure group once."""
+        group_ids = sorted({group_id for group_ids in self._mapping.values() for group_id in group_ids})
+        self.logger.info("Distinct Azure group IDs: %s", group_ids)
+
+        found_group_ids = self.azure_client.check_groups(group_ids=group_ids)
+        missing_group_ids = [group_id for group_id in group_ids if group_id not in found_group_ids]
+        if missing_group_ids:
+            msg = f"Azure group {', '.join(missing_group_ids)} does not exist."
+            self.logger.error(msg)
+            raise RuntimeError(msg) from None
+
+        return self.azure_client.get_groups_members(group_ids=group_ids)
+
+    def evaluate(self) -> dict[str, dict[str, list[str]]]:
+        """
+        Assess syncing users to each target LDAP group.
+
+        Returns results of `SimpleSyncClient.evaluate` indexed by target LDAP group ID.
+        """
+        self.logger.info("Evaluating Azure to LDAP group sync for %s target groups.", len(self._mapping))
+
+        members = self._get_source_members()
+        self._clients = {
+            ldap_group_id: SimpleSyncClient(
+                azure_group_ids=azure_group_ids,
+                ldap_group_id=ldap_group_id,
+                azure_client=self.azure_client,
+                ldap_client=self.ldap_client,
+                source_members={group_id: members[group_id] for group_id in azure_group_ids},
+            )
+            for ldap_group_id, azure_group_ids in self._mapping.items()
+        }
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self._clients))) as executor:
+            results = executor.map(lambda client: client.evaluate(), self._clients.values())
+            return dict(zip(self._clients.keys(), results))
+
+    def sync(self) -> dict[str, dict[str, list[str]]]:
+        """
+        Sync users to each target LDAP group.
+
+        This method will modify LDAP!
+
+        Targets are evaluated first if needed. If any target fails to sync, other targets are still synced before an
+        error is raised.
+
+        Returns results of `SimpleSyncClient.sync` indexed by target LDAP group ID.
+        """
+        if not self._clients:
+            self.logger.info("Sync not yet evaluated, evaluating first.")
+            self.evaluate()
+
+        results = {}
+        failed = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self._clients))) as executor:
+            futures = {ldap_group_id: executor.submit(client.sync) for ldap_group_id, client in self._clients.items()}
+            for ldap_group_id, future in futures.items():
+                try:
+                    results[ldap_group_id] = future.result()
+                except RuntimeError:
+                    self.logger.error("Failed to sync LDAP group: %s.", ldap_group_id, exc_info=True)
+                    failed.append(ldap_group_id)
+
+        if failed:
+            msg = f"Failed to sync LDAP group {', '.join(failed)}."
+            raise RuntimeError(msg)
+
+        return results
+
+
+@dataclass
+class DeltaSyncGroupState:
+    """Incremental sync state for a source Azure group."""
+
+    delta_link: str
+    members: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class DeltaSyncState:
+    """
+    Incremental sync state for a target LDAP group.
+
+    Holds the delta link and members (UPNs indexed by user ID) of each source group as of the last sync, and when
+    members were last fully reconciled.
+
+    State for all target groups is saved in a single JSON file, indexed by LDAP group ID.
+    """
+
+    reconciled_at: Optional[datetime] = None
+    groups: dict[str, DeltaSyncGroupState] = field(default_factory=dict)
+    _schema_version: ClassVar[str] = "1"
+
+    @property
+    def user_ids(self) -> set[str]:
+        """Members of all source groups as usernames."""
+        return {SyncDiff.user_id_from_upn(upn) for group in self.groups.values() for upn in group.members.values()}
+
+    @classmethod
+    def _load_file(cls: type[DeltaSyncState], path: Path) -> dict:
+        """Load state for all targets from JSON file."""
+        if not path.exists():
+            return {"schema_version": cls._schema_version, "targets": {}}
+
+        with path.open(mode="r") as file:
+            data = json.load(file)
+
+        if data["schema_version"] != cls._schema_version:
+            msg = f"Unsupported schema version: {data['schema_version']}"
+            raise ValueError(msg)
+        return data
+
+    @classmethod
+    def load(cls: type[DeltaSyncState], path: Path, target: str) -> DeltaSyncState:
+        """Decode saved state for target group from JSON file, or return empty state if not saved."""
+        data = cls._load_file(path=path)["targets"].get(target)
+        if data is None:
+            return cls()
+
+        return cls(
+            reconciled_at=datetime.fromisoformat(data["reconciled_at"]),
+            groups={k: DeltaSyncGroupState(**v) for k, v in data["groups"].items()},
+        )
+
+    def dump(self, path: Path, target: str) -> None:
+        """
+        Encode state for target group as JSON and save to file.
+
+        State for other target groups is kept. The file is replaced atomically and only readable by the current user.
+        """
+        data = self._load_file(path=path)
+        data["targets"][target] = {
+            "reconciled_at": self.reconciled_at.isoformat(),
+            "groups": {k: asdict(v) for k, v in self.groups.items()},
+        }
+
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, mode="w") as file:
+            json.dump(obj=data, fp=file, indent=2)
+        tmp_path.replace(path)
+
+
+class IncrementalSyncClient(SimpleSyncClient):
+    """
+    Incremental implementation of syncing users from Azure groups to LDAP.
+
+    Rather than comparing all members of the source and target groups, only users added to or removed from source
+    groups since the last sync (determined using MS Graph delta queries) are added to or removed from the target group.
+
+    As changes made directly to the target group are not detected, a full reconciliation (as per `SimpleSyncClient`)
+    is performed if `reconcile_interval` seconds have passed since the last, if source groups have changed, or if
+    there is no previous state.
+
+    State is only saved once changes have been synced.
+    """
+
+    def __init__(
+        self,
+        azure_group_ids: list[str],
+        ldap_group_id: str,
+        state_path: Path,
+        reconcile_interval: int,
+        azure_client: Optional[AzureClient] = None,
+        ldap_client: Optional[LDAPClient] = None,
+    ) -> None:
+        """Create instance."""
+        super().__init__(
+            azure_group_ids=azure_group_ids,
+            ldap_group_id=ldap_group_id,
+            azure_client=azure_client,
+            ldap_client=ldap_client,
+        )
+        self.logger.info(f"Sync state file: {state_path.resolve()}")
+
+        self._state_path = state_path
+        self._reconcile_interval = reconcile_interval
+        self._state = DeltaSyncState.load(path=state_path, target=ldap_group_id)
+        self._pending_state: Optional[DeltaSyncState] = None
+
+        self._user_ids_added_in_source: set[str] = set()
+        self._user_ids_removed_in_source: set[str] = set()
+
+        self.reconcile: bool = self._needs_reconcile()
+
+    def _needs_reconcile(self) -> bool:
+        """Determine if a full reconciliation is needed."""
+        if self._state.reconciled_at is None:
+            self.logger.info("No previous sync state, full reconciliation needed.")
+            return True
+        if set(self._state.groups.keys()) != set(self._source_group_ids):
+            self.logger.info("Source groups changed since last sync, full reconciliation needed.")
+            return True
+
+        elapsed = (datetime.now(tz=timezone.utc) - self._state.reconciled_at).total_seconds()
+        if elapsed >= self._reconcile_interval:
+            self.logger.info("Last full reconciliation %s seconds ago, full reconciliation needed.", int(elapsed))
+            return True
+
+        return False
+
+    def _get_source_user_ids(self) -> None:
+        """
+        Store members of source Azure groups as usernames, and users added or removed since the last sync.
+
+        Changes to members are fetched using delta queries and applied to the previous state, which is held as pending
+        until synced. Only users added since the last sync need their UPNs fetching.
+        """
+        delta_links = {
+            group_id: None if self.reconcile else self._state.groups[group_id].delta_link
+            for group_id in self._source_group_ids
+        }
+        deltas = self.azure_client.get_groups_members_delta(delta_links=delta_links)
+
+        groups = {}
+        new_ids = set()
+        for group_id, delta in deltas.items():
+            members = {} if delta.full else dict(self._state.groups[group_id].members)
+            for user_id in delta.removed:
+                members.pop(user_id, None)
+            new_ids.update(user_id for user_id in delta.added if user_id not in members)
+            groups[group_id] = DeltaSyncGroupState(delta_link=delta.delta_link, members=members)
+
+        upns = self.azure_client.get_users_upns(user_ids=sorted(new_ids)) if new_ids else {}
+        for group_id, delta in deltas.items():
+            groups[group_id].members.update({user_id: upns[user_id] for user_id in delta.added if user_id in upns})
+
+        reconciled_at = datetime.now(tz=timezone.utc) if self.reconcile else self._state.reconciled_at
+        self._pending_state = DeltaSyncState(reconciled_at=reconciled_at, groups=groups)
+
+        before = set() if self.reconcile else self._state.user_ids
+        after = self._pending_state.user_ids
+        self._source_user_ids = after
+        self._user_ids_added_in_source = after - before
+        self._user_ids_removed_in_source = before - after
+
+    def _get_changes(self) -> tuple[set[str], set[str]]:
+        """
+        Determine users to add to, and remove from, the target group.
+
+        As per `SimpleSyncClient._get_changes` but, unless reconciling, limited to users added to or removed from
+        source groups since the last sync. I.e. users in the target group but not the source are not removed unless
+        they were removed from the source since the last sync.
+        """
+        if self.reconcile:
+            return super()._get_changes()
+
+        return (
+            self._user_ids_added_in_source - self._target_user_ids,
+            self._user_ids_removed_in_source & self._target_user_ids,
+        )
+
+    def evaluate(self) -> dict[str, list[str]]:
+        """
+        Assess syncing users from one or more Azure groups to an LDAP group.
+
+        As per `SimpleSyncClient.evaluate`, except unless reconciling, only changes since the last sync are considered.
+        """
+        self.logger.info("Full reconciliation: %s", self.reconcile)
+        return super().evaluate()
+
+    def sync(self) -> dict[str, list[str]]:
+        """
+        Sync users from one or more Azure groups to an LDAP group.
+
+        This method will modify LDAP!
+
+        As per `SimpleSyncClient.sync`, with state saved once synced, so later syncs are incremental to this one.
+        If any users cannot be added or removed, state is not saved, so these changes are retried by the next sync.
+        """
+        result = super().sync()
+
+        self.logger.info("Saving sync state.")
+        self._state = self._pending_state
+        self._state.dump(path=self._state_path, target=self._target_group_id)
+        self.reconcile = False
+
+        return result
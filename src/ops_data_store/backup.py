@@ -13,6 +13,7 @@ from typing import Optional, Union
 from ops_data_store.config import Config
 from ops_data_store.data import DataClient
 from ops_data_store.db import DBClient
+from ops_data_store.metrics import Metrics
 
 
 @dataclass
@@ -89,8 +90,9 @@ class RollingFileState:
     @staticmethod
     def _sha1_file(path: Path) -> str:
         """Calculate SHA1 sum of file at path."""
-        with path.open(mode="rb") as file:
+        with Metrics.timed("backup.hash") as timing, path.open(mode="rb") as file:
             data = file.read()
+            timing.bytes = len(data)
         return sha1(data).hexdigest()  # noqa: S324 - not used in cryptographic context
 
     @property
@@ -276,6 +278,24 @@ class RollingFileSet:
         """Return oldest iteration metadata."""
         return self._state.oldest_iteration
 
+    @property
+    def iteration_count(self) -> int:
+        """Number of iterations in set."""
+        return self._state.iteration_count
+
+    @property
+    def size(self) -> int:
+        """Combined size of all iterations in set in bytes."""
+        return sum(iteration.path.stat().st_size for iteration in self._state.iterations.values())
+
+    @property
+    def newest_size(self) -> int:
+        """Size of the newest iteration in set in bytes, or 0 if set is empty."""
+        try:
+            return self._state.newest_iteration.path.stat().st_size
+        except ValueError:
+            return 0
+
     def _init_workspace(self) -> None:
         """Create workspace directory if needed."""
         if not self._workspace.exists():
@@ -303,7 +323,9 @@ class RollingFileSet:
         iteration_path = self._workspace.joinpath(iteration_name)
 
         self.logger.info("Copying file: %s to: %s", path.resolve(), iteration_path.resolve())
-        copyfile(src=path, dst=iteration_path)
+        with Metrics.timed("backup.copy") as timing:
+            copyfile(src=path, dst=iteration_path)
+            timing.bytes = iteration_path.stat().st_size
 
         self._state.add_new_iteration(original_path=path, sequence=sequence, iteration_path=iteration_path)
         self._state.dump(path=self._state_file)
@@ -384,6 +406,11 @@ class BackupClient:
             workspace_path=self._backups_path, base_name=self._data_backup_name, max_iterations=self._max_iterations
         )
 
+    @property
+    def backup_sets(self) -> dict[str, RollingFileSet]:
+        """Database and controlled dataset backup sets, indexed by a short name."""
+        return {"db": self._db_backups, "data": self._data_backups}
+
     def backup(self) -> None:
         """
         Create backups and add to file sets.
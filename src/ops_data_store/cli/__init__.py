@@ -1,30 +1,79 @@
 from __future__ import annotations
 
+from importlib import import_module
+from pathlib import Path
 from typing import Optional
 
+import click
 import typer
+from typer.core import TyperGroup
 
-from ops_data_store.cli.auth import app as auth_cli
-from ops_data_store.cli.backup import app as backup_cli
-from ops_data_store.cli.config import app as config_cli
-from ops_data_store.cli.data import app as data_cli
-from ops_data_store.cli.db import app as db_cli
 from ops_data_store.config import Config
+from ops_data_store.metrics import Metrics
 
-config = Config()
+_sub_apps: dict[str, tuple[str, str]] = {
+    "auth": ("ops_data_store.cli.auth", "Manage application authentication/authorisation."),
+    "backup": ("ops_data_store.cli.backup", "Manage backups."),
+    "config": ("ops_data_store.cli.config", "Manage application configuration."),
+    "data": ("ops_data_store.cli.data", "Manage datasets."),
+    "db": ("ops_data_store.cli.db", "Manage application database."),
+    "serve": ("ops_data_store.cli.serve", "Run scheduled jobs as a long-running process."),
+}
 
-app = typer.Typer(name="ods-ctl", help="BAS MAGIC Operations Data Store control CLI.")
-app.add_typer(auth_cli, name="auth", help="Manage application authentication/authorisation.")
-app.add_typer(backup_cli, name="backup", help="Manage backups.")
-app.add_typer(config_cli, name="config", help="Manage application configuration.")
-app.add_typer(data_cli, name="data", help="Manage datasets.")
-app.add_typer(db_cli, name="db", help="Manage application database.")
+
+class LazyGroup(TyperGroup):
+    """
+    Command group which loads sub-apps when needed.
+
+    Sub-apps are only imported when one of their commands is called (or when listed in help output), so each command
+    only imports its own dependencies (e.g. GDAL or LDAP libraries), rather than those for all commands.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List names of commands and sub-apps."""
+        return sorted([*super().list_commands(ctx), *_sub_apps])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get command or sub-app, importing sub-apps as needed."""
+        if cmd_name not in _sub_apps:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, help_text = _sub_apps[cmd_name]
+        command = typer.main.get_group(import_module(module_name).app)
+        command.name = cmd_name
+        command.help = help_text
+        return command
+
+
+app = typer.Typer(name="ods-ctl", help="BAS MAGIC Operations Data Store control CLI.", cls=LazyGroup)
 _version_option = typer.Option(None, "-v", "--version", is_eager=True, help="Show application version and exit.")
+_metrics_path_option = typer.Option(None, "--metrics-path", help="Write timings of operations to a JSON file.")
+
+
+def _report_metrics(path: Optional[Path]) -> None:
+    """Display summary of timed operations, and optionally write them to a file."""
+    summary = Metrics.summary()
+    if summary:
+        print("\n=== Timings ===")
+        for line in summary:
+            print(f" * {line}")
+
+    if path is not None:
+        Metrics.dump(path=path)
 
 
 @app.callback(invoke_without_command=True)
-def cli(version: Optional[bool] = _version_option) -> None:
-    """Display application version."""
+def cli(
+    ctx: typer.Context, version: Optional[bool] = _version_option, metrics_path: Optional[Path] = _metrics_path_option
+) -> None:
+    """
+    Display application version.
+
+    Operations timed while running a command are summarised once it completes (or fails).
+    """
     if version:
-        print(config.VERSION)
+        print(Config().VERSION)
         raise typer.Exit()
+
+    Metrics.reset()
+    ctx.call_on_close(lambda: _report_metrics(path=metrics_path))
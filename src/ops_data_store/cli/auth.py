@@ -1,18 +1,28 @@
+from __future__ import annotations
+
 import logging
-from typing import Annotated
+from pathlib import Path
+from typing import Annotated, Optional
 
 import typer
 
-from ops_data_store.auth import AzureClient, LDAPClient, SimpleSyncClient
+from ops_data_store.auth import (
+    AzureClient,
+    IncrementalSyncClient,
+    LDAPClient,
+    MultiSyncClient,
+    RoleSyncClient,
+    SimpleSyncClient,
+)
 from ops_data_store.config import Config
+from ops_data_store.metrics import JobMetrics
 
 app = typer.Typer()
 
-config = Config()
 logger = logging.getLogger("app")
 
 
-def _print_sync_evaluation(eval_result: dict[str, list[str]]) -> None:
+def _print_sync_evaluation(eval_result: dict[str, list[str]], target: str = "LDAP server") -> None:
     """Format and display a sync evaluation result set."""
     print("=== Sync Evaluation ===")
     print(f"\nUsers to be added to target group [{len(eval_result['missing'])}]:")
@@ -21,7 +31,7 @@ def _print_sync_evaluation(eval_result: dict[str, list[str]]) -> None:
     print(f"\nUsers to be removed from target group [{len(eval_result['remove'])}]:")
     for user in eval_result["remove"]:
         print(f" - {user}")
-    print(f"\nUsers not in target LDAP server (need to be registered first) [{len(eval_result['unknown'])}]:")
+    print(f"\nUsers not in target {target} (need to be registered first) [{len(eval_result['unknown'])}]:")
     for user in eval_result["unknown"]:
         print(f" ! {user}")
     print(f"\nUsers in source and target group (no change, for reference) [{len(eval_result['present'])}]:")
@@ -58,6 +68,14 @@ def check() -> None:
 def sync(
     azure_group: Annotated[list[str], typer.Option("--azure-group", "-ag", help="ID of Azure group")],
     ldap_group: Annotated[str, typer.Option("--ldap-group", "-lg", help="ID of LDAP group")],
+    incremental: Annotated[
+        bool, typer.Option("--incremental", help="Only sync changes to Azure groups since the last incremental sync")
+    ] = False,
+    yes: Annotated[bool, typer.Option("--yes", "-y", help="Sync without asking for confirmation")] = False,
+    metrics_textfile: Annotated[
+        Optional[Path],
+        typer.Option(help="Write job metrics to an OpenMetrics textfile (e.g. for the Prometheus node_exporter)."),
+    ] = None,
 ) -> None:
     """Sync group members from Azure to LDAP."""
     print("Note: If this command fails, please run the `ods-ctl auth check` command and resolve an errors.")
@@ -66,20 +84,110 @@ def sync(
         "magic@bas.ac.uk with the output of this command."
     )
 
-    sync_client = SimpleSyncClient(azure_group_ids=azure_group, ldap_group_id=ldap_group)
+    if incremental:
+        config = Config()
+        if config.AUTH_SYNC_STATE_PATH is None:
+            print("No. Incremental sync not configured, set the `AUTH_SYNC_STATE_PATH` config option.")
+            raise typer.Abort()
+
+        sync_client = IncrementalSyncClient(
+            azure_group_ids=azure_group,
+            ldap_group_id=ldap_group,
+            state_path=config.AUTH_SYNC_STATE_PATH,
+            reconcile_interval=config.AUTH_SYNC_RECONCILE_INTERVAL,
+        )
+    else:
+        sync_client = SimpleSyncClient(azure_group_ids=azure_group, ldap_group_id=ldap_group)
+
+    with JobMetrics.record(job="sync", path=metrics_textfile) as job:
+        try:
+            _print_sync_evaluation(eval_result=sync_client.evaluate())
+
+            if not yes and not typer.confirm("Continue with these additions and removals?"):
+                job.cancelled = True
+                print("Ok. Sync aborted.")
+                raise typer.Abort()
+
+            print("Syncing...")
+            _print_sync_evaluation(eval_result=sync_client.sync())
+            print("Ok. Sync completed.")
+        except RuntimeError as e:
+            logger.error(e, exc_info=True)
+            print(f"No. {e} Sync aborted.")
+            raise typer.Abort() from e
+
+
+@app.command(name="sync-role", help="Sync group members from Azure to a database role.")
+def sync_role(
+    azure_group: Annotated[list[str], typer.Option("--azure-group", "-ag", help="ID of Azure group")],
+    db_role: Annotated[str, typer.Option("--db-role", "-r", help="Name of database role")],
+) -> None:
+    """Sync group members from Azure to a database role."""
+    print("Note: If this command fails, please run the `ods-ctl auth check` command and resolve an errors.")
+    print(
+        "If problems persist, create an issue in the 'Ops Data Store' project in GitLab, or contact MAGIC at "
+        "magic@bas.ac.uk with the output of this command."
+    )
+
+    sync_client = RoleSyncClient(azure_group_ids=azure_group, db_role=db_role)
 
     try:
-        _print_sync_evaluation(eval_result=sync_client.evaluate())
+        _print_sync_evaluation(eval_result=sync_client.evaluate(), target="database")
 
-        if not typer.confirm("Continue with these additions and removals?"):
+        if not typer.confirm("Continue with these grants and revokes?"):
             print("Ok. Sync aborted.")
             raise typer.Abort()
 
         print("Syncing...")
-        sync_client.sync()
-        _print_sync_evaluation(eval_result=sync_client.evaluate())
+        _print_sync_evaluation(eval_result=sync_client.sync(), target="database")
         print("Ok. Sync completed.")
     except RuntimeError as e:
         logger.error(e, exc_info=True)
         print(f"No. {e} Sync aborted.")
         raise typer.Abort() from e
+
+
+@app.command(name="sync-all", help="Sync group members from Azure to multiple LDAP groups defined in a mapping file.")
+def sync_all(
+    mapping: Annotated[
+        Path, typer.Option("--mapping", "-m", help="Path to JSON file of Azure group IDs indexed by LDAP group ID")
+    ],
+    yes: Annotated[bool, typer.Option("--yes", "-y", help="Sync without asking for confirmation")] = False,
+    metrics_textfile: Annotated[
+        Optional[Path],
+        typer.Option(help="Write job metrics to an OpenMetrics textfile (e.g. for the Prometheus node_exporter)."),
+    ] = None,
+) -> None:
+    """Sync group members from Azure to multiple LDAP groups."""
+    print("Note: If this command fails, please run the `ods-ctl auth check` command and resolve an errors.")
+    print(
+        "If problems persist, create an issue in the 'Ops Data Store' project in GitLab, or contact MAGIC at "
+        "magic@bas.ac.uk with the output of this command."
+    )
+
+    if not mapping.exists():
+        print(f"No. Mapping file '{mapping.resolve()}' does not exist.")
+        raise typer.Abort()
+
+    with JobMetrics.record(job="sync-all", path=metrics_textfile) as job:
+        try:
+            sync_client = MultiSyncClient(mapping=MultiSyncClient.load_mapping(path=mapping))
+
+            for ldap_group, eval_result in sync_client.evaluate().items():
+                print(f"=== Target LDAP group: {ldap_group} ===\n")
+                _print_sync_evaluation(eval_result=eval_result)
+
+            if not yes and not typer.confirm("Continue with these additions and removals for all target groups?"):
+                job.cancelled = True
+                print("Ok. Sync aborted.")
+                raise typer.Abort()
+
+            print("Syncing...")
+            for ldap_group, sync_result in sync_client.sync().items():
+                print(f"=== Target LDAP group: {ldap_group} ===\n")
+                _print_sync_evaluation(eval_result=sync_result)
+            print("Ok. Sync completed.")
+        except RuntimeError as e:
+            logger.error(e, exc_info=True)
+            print(f"No. {e} Sync aborted.")
+            raise typer.Abort() from e
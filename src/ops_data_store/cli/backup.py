@@ -1,21 +1,37 @@
+from __future__ import annotations
+
 import logging
+from pathlib import Path
+from typing import Annotated, Optional
 
 import typer
 
 from ops_data_store.backup import BackupClient
 from ops_data_store.config import Config
+from ops_data_store.metrics import JobMetrics
 
 app = typer.Typer()
 
-config = Config()
 logger = logging.getLogger("app")
 
 
 @app.command(help="Backup database and managed datasets.")
-def now() -> None:
+def now(
+    metrics_textfile: Annotated[
+        Optional[Path],
+        typer.Option(help="Write job metrics to an OpenMetrics textfile (e.g. for the Prometheus node_exporter)."),
+    ] = None,
+) -> None:
     """Create backups as part of managed file set."""
+    config = Config()
     client = BackupClient()
     print(f"Backing up database and managed datasets backup as part of file set at: '{config.BACKUPS_PATH.resolve()}'.")
 
-    client.backup()
+    with JobMetrics.record(job="backup", path=metrics_textfile) as job:
+        client.backup()
+        backup_sets = client.backup_sets
+        job.bytes_written = sum(backup_set.newest_size for backup_set in backup_sets.values())
+        job.backup_sets = {
+            name: (backup_set.iteration_count, backup_set.size) for name, backup_set in backup_sets.items()
+        }
     print("Ok. Complete.")
@@ -7,13 +7,13 @@ from ops_data_store.config import Config
 
 app = typer.Typer()
 
-config = Config()
 logger = logging.getLogger("app")
 
 
 @app.command(help="Check current app configuration is valid.")
 def check() -> None:
     """Validate current app configuration."""
+    config = Config()
     try:
         logger.info("Checking app config.")
         config.validate()
@@ -29,6 +29,7 @@ def check() -> None:
 @app.command(help="Display the current app configuration.")
 def show() -> None:
     """Display the current app configuration."""
+    config = Config()
     try:
         logger.info("Checking app config.")
         config.validate()
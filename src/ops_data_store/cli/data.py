@@ -1,20 +1,29 @@
+from __future__ import annotations
+
 import logging
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Optional
 
+import psycopg
 import typer
 
 from ops_data_store.config import Config
 from ops_data_store.data import DataClient
+from ops_data_store.metrics import JobMetrics
 
 app = typer.Typer()
 
-config = Config()
 logger = logging.getLogger("app")
 
 
 @app.command(help="Save managed datasets as GeoPackage.")
-def backup(output_path: Annotated[Path, typer.Option()]) -> None:
+def backup(
+    output_path: Annotated[Path, typer.Option()],
+    metrics_textfile: Annotated[
+        Optional[Path],
+        typer.Option(help="Write job metrics to an OpenMetrics textfile (e.g. for the Prometheus node_exporter)."),
+    ] = None,
+) -> None:
     """Export managed datasets from DB to GeoPackage file."""
     client = DataClient()
 
@@ -24,24 +33,70 @@ def backup(output_path: Annotated[Path, typer.Option()]) -> None:
     )
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    try:
-        client.export(path=output_path)
-        logger.info("Managed datasets exported normally.")
-        print("Ok. Complete.")
-    except RuntimeError as e:
-        logger.error(e, exc_info=True)
-        print("No. Error saving managed datasets.")
-        raise typer.Abort() from e
+    with JobMetrics.record(job="data-backup", path=metrics_textfile) as job:
+        try:
+            client.export(path=output_path)
+            job.bytes_written = output_path.stat().st_size
+            logger.info("Managed datasets exported normally.")
+            print("Ok. Complete.")
+        except RuntimeError as e:
+            logger.error(e, exc_info=True)
+            print("No. Error saving managed datasets.")
+            raise typer.Abort() from e
 
 
 @app.command(help="Convert select managed datasets to device formats.")
-def convert() -> None:
+def convert(
+    metrics_textfile: Annotated[
+        Optional[Path],
+        typer.Option(help="Write job metrics to an OpenMetrics textfile (e.g. for the Prometheus node_exporter)."),
+    ] = None,
+) -> None:
     """Convert selected managed datasets from DB to device formats."""
     print("Note: This command only exports formally managed routes and waypoints.")
 
+    config = Config()
     client = DataClient()
-    client.convert()
+    with JobMetrics.record(job="convert", path=metrics_textfile) as job:
+        client.convert()
+        job.bytes_written = sum(
+            path.stat().st_size for path in config.DATA_AIRNET_OUTPUT_PATH.glob("**/*") if path.is_file()
+        )
 
     logger.info("Routes and waypoints converted normally.")
     print(f"Output path: {config.DATA_AIRNET_OUTPUT_PATH.resolve()}")
     print("Ok. Complete.")
+
+
+@app.command(help="Convert select managed datasets to device formats when they change.")
+def watch(
+    debounce: Annotated[float, typer.Option(help="Seconds without further changes to wait before converting.")] = 5,
+) -> None:
+    """Convert selected managed datasets from DB to device formats whenever they change."""
+    print("Note: This command only exports formally managed routes and waypoints.")
+
+    config = Config()
+    client = DataClient()
+
+    def _convert() -> None:
+        """Convert datasets, logging rather than raising errors so that later changes are still converted."""
+        try:
+            client.convert()
+            logger.info("Routes and waypoints converted normally.")
+            print(f"Ok. Routes and waypoints converted to: {config.DATA_AIRNET_OUTPUT_PATH.resolve()}")
+        except Exception as e:
+            logger.error(e, exc_info=True)
+            print("No. Error converting routes and waypoints, waiting for further changes.")
+
+    # outputs may be out of date if changes were made while not watching
+    _convert()
+
+    print("Watching for changes to routes and waypoints, press Ctrl+C to stop.")
+    try:
+        client.airnet_client.listen(on_change=_convert, debounce=debounce)
+    except psycopg.OperationalError as e:
+        logger.error(e, exc_info=True)
+        print("No. Database connection lost.")
+        raise typer.Abort() from e
+    except KeyboardInterrupt:
+        print("Ok. Stopped.")
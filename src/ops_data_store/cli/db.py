@@ -5,12 +5,10 @@ from typing import Annotated
 import psycopg
 import typer
 
-from ops_data_store.config import Config
 from ops_data_store.db import DBClient
 
 app = typer.Typer()
 
-config = Config()
 logger = logging.getLogger("app")
 
 
@@ -48,6 +46,50 @@ def setup() -> None:
         raise typer.Abort() from e
 
 
+@app.command(help="Apply pending database migrations.")
+def migrate() -> None:
+    """Apply pending database migrations."""
+    client = DBClient()
+
+    try:
+        applied = client.migrate()
+    except RuntimeError as e:
+        logger.error(e, exc_info=True)
+        print(e)
+        print("No. Database migration failed, no migrations have been applied.")
+        raise typer.Abort() from e
+
+    if not applied:
+        print("Ok. No pending migrations.")
+        return
+
+    for migration in applied:
+        print(f"Applied migration '{migration.version}_{migration.name}'.")
+    print(f"Ok. {len(applied)} migration(s) applied.")
+
+
+@app.command(help="Check foreign keys in controlled datasets have supporting indexes.")
+def check_indexes() -> None:
+    """Report foreign keys without supporting indexes."""
+    client = DBClient()
+
+    try:
+        missing = client.check_fk_indexes()
+    except psycopg.OperationalError as e:
+        logger.error(e, exc_info=True)
+        print("No. Database connection failed.")
+        raise typer.Abort() from e
+
+    if not missing:
+        print("Ok. All foreign keys have supporting indexes.")
+        return
+
+    for table, constraint, columns in missing:
+        print(f"Foreign key '{constraint}' on '{table}' ({columns}) has no supporting index.")
+    print(f"No. {len(missing)} foreign key(s) without supporting indexes.")
+    raise typer.Abort()
+
+
 @app.command(help="Execute contents of an SQL against database.")
 def run(input_path: Annotated[Path, typer.Option()]) -> None:
     """Load contents of SQL file and execute against database."""
@@ -0,0 +1,88 @@
+import logging
+import signal
+import socket
+from typing import Annotated
+
+import typer
+
+from ops_data_store.config import Config
+from ops_data_store.serve import JobScheduler, send_command
+
+app = typer.Typer()
+
+logger = logging.getLogger("app")
+
+
+def _send_command(command: str, timeout: float = 10) -> str:
+    """Send command to running scheduler, aborting if the control socket is unavailable or no response is received."""
+    config = Config()
+    if config.SERVE_SOCKET_PATH is None:
+        print("No. Control socket not configured, set the `SERVE_SOCKET_PATH` config option.")
+        raise typer.Abort()
+
+    try:
+        response = send_command(path=config.SERVE_SOCKET_PATH, command=command, timeout=timeout)
+    except socket.timeout as e:
+        logger.error(e, exc_info=True)
+        print(f"No. No response from `serve` within {timeout} seconds, any job may still be running.")
+        raise typer.Abort() from e
+    except OSError as e:
+        logger.error(e, exc_info=True)
+        print(f"No. Cannot connect to control socket at '{config.SERVE_SOCKET_PATH.resolve()}', is `serve` running?")
+        raise typer.Abort() from e
+
+    if not response:
+        print("No. No response from `serve`, it may have stopped.")
+        raise typer.Abort()
+    return response
+
+
+@app.callback(invoke_without_command=True)
+def serve(ctx: typer.Context) -> None:
+    """Run scheduled backups, conversions and syncs until stopped."""
+    if ctx.invoked_subcommand is not None:
+        return
+
+    config = Config()
+    try:
+        config.validate()
+    except RuntimeError as e:
+        logger.error(e, exc_info=True)
+        print("No. Application config is invalid. Check with `ods-ctl config check`.")
+        raise typer.Abort() from e
+
+    scheduler = JobScheduler()
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+
+    print("Running scheduled jobs, press Ctrl+C to stop.")
+    for job in scheduler.jobs.values():
+        print(f" * {job}")
+
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        logger.info("Interrupted, stopping job scheduler.")
+    print("Ok. Stopped.")
+
+
+@app.command(help="Run a job in a running `serve` process.")
+def run(
+    job: Annotated[str, typer.Argument(help="Name of job (backup, convert or sync)")],
+    timeout: Annotated[float, typer.Option(help="Seconds to wait for job to finish")] = 3600,
+) -> None:
+    """
+    Trigger job in running scheduler and wait for it to finish.
+
+    If the timeout is reached, the job is not cancelled and may still complete.
+    """
+    print(f"Running job '{job}'.")
+    response = _send_command(command=f"run {job}", timeout=timeout)
+    print(response)
+    if not response.startswith("Ok."):
+        raise typer.Abort()
+
+
+@app.command(help="Show status of jobs in a running `serve` process.")
+def status() -> None:
+    """Show state of jobs in running scheduler."""
+    print(_send_command(command="status"))
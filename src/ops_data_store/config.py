@@ -1,14 +1,115 @@
 from __future__ import annotations
 
+from functools import partial
 from importlib.metadata import version
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, NamedTuple, Optional, Union
 
 from environs import Env, EnvError
 
 
+class _Settings(NamedTuple):
+    """
+    Configuration options parsed from the environment.
+
+    Options that are required but not set, or are invalid, hold the error raised when parsed. This error is raised
+    when the option is accessed via Config.
+    """
+
+    AUTH_AZURE_AUTHORITY: Optional[str]
+    AUTH_AZURE_CLIENT_ID: Optional[str]
+    AUTH_AZURE_CLIENT_SECRET: Optional[str]
+    AUTH_AZURE_TOKEN_CACHE_PATH: Optional[Path]
+    AUTH_DB_SYNC_IGNORED_USERS: tuple[str, ...]
+    AUTH_LDAP_BASE_DN: Optional[str]
+    AUTH_LDAP_BIND_DN: Optional[str]
+    AUTH_LDAP_BIND_PASSWORD: Optional[str]
+    AUTH_LDAP_MODIFY_BATCH_SIZE: Union[int, EnvError]
+    AUTH_LDAP_NAME_CONTEXT_GROUPS: Optional[str]
+    AUTH_LDAP_NAME_CONTEXT_USERS: Optional[str]
+    AUTH_LDAP_NETWORK_TIMEOUT: Union[int, EnvError]
+    AUTH_LDAP_OU_GROUPS: Optional[str]
+    AUTH_LDAP_OU_USERS: Optional[str]
+    AUTH_LDAP_RETRY_MAX: Union[int, EnvError]
+    AUTH_LDAP_START_TLS: Union[bool, EnvError]
+    AUTH_LDAP_TIMEOUT: Union[int, EnvError]
+    AUTH_LDAP_TLS_CA_CERT_PATH: Optional[Path]
+    AUTH_LDAP_URL: Optional[str]
+    AUTH_SYNC_RECONCILE_INTERVAL: Union[int, EnvError]
+    AUTH_SYNC_STATE_PATH: Optional[Path]
+    BACKUPS_COUNT: Union[int, EnvError]
+    BACKUPS_PATH: Union[Path, EnvError]
+    DATA_AIRNET_OUTPUT_PATH: Union[Path, EnvError]
+    DATA_MANAGED_TABLE_NAMES: Union[tuple[str, ...], EnvError]
+    DB_DSN: Union[str, EnvError]
+    SERVE_BACKUP_INTERVAL: Union[int, EnvError]
+    SERVE_CONVERT_INTERVAL: Union[int, EnvError]
+    SERVE_SOCKET_PATH: Optional[Path]
+    SERVE_SYNC_AZURE_GROUPS: tuple[str, ...]
+    SERVE_SYNC_INTERVAL: Union[int, EnvError]
+    SERVE_SYNC_LDAP_GROUP: Optional[str]
+    VERSION: str
+
+    @classmethod
+    def parse(cls: type[_Settings], env: Env) -> _Settings:
+        """Parse options from environment."""
+
+        def _parse(parser: Callable[[str], Any], name: str) -> Any:  # noqa: ANN401
+            try:
+                return parser(name)
+            except EnvError as e:
+                return e
+
+        table_names = _parse(env.list, "APP_ODS_DATA_MANAGED_TABLE_NAMES")
+
+        return cls(
+            AUTH_AZURE_AUTHORITY=env.str("APP_ODS_AUTH_AZURE_AUTHORITY", default=None),
+            AUTH_AZURE_CLIENT_ID=env.str("APP_ODS_AUTH_AZURE_CLIENT_ID", default=None),
+            AUTH_AZURE_CLIENT_SECRET=env.str("APP_ODS_AUTH_AZURE_CLIENT_SECRET", default=None),
+            AUTH_AZURE_TOKEN_CACHE_PATH=env.path("APP_ODS_AUTH_AZURE_TOKEN_CACHE_PATH", default=None),
+            AUTH_DB_SYNC_IGNORED_USERS=tuple(env.list("APP_ODS_AUTH_DB_SYNC_IGNORED_USERS", default=[])),
+            AUTH_LDAP_BASE_DN=env.str("APP_ODS_AUTH_LDAP_BASE_DN", default=None),
+            AUTH_LDAP_BIND_DN=env.str("APP_ODS_AUTH_LDAP_BIND_DN", default=None),
+            AUTH_LDAP_BIND_PASSWORD=env.str("APP_ODS_AUTH_LDAP_BIND_PASSWORD", default=None),
+            AUTH_LDAP_MODIFY_BATCH_SIZE=_parse(partial(env.int, default=10), "APP_ODS_AUTH_LDAP_MODIFY_BATCH_SIZE"),
+            AUTH_LDAP_NAME_CONTEXT_GROUPS=env.str("APP_ODS_AUTH_LDAP_CXT_GROUPS", default=None),
+            AUTH_LDAP_NAME_CONTEXT_USERS=env.str("APP_ODS_AUTH_LDAP_CXT_USERS", default=None),
+            AUTH_LDAP_NETWORK_TIMEOUT=_parse(partial(env.int, default=10), "APP_ODS_AUTH_LDAP_NETWORK_TIMEOUT"),
+            AUTH_LDAP_OU_GROUPS=env.str("APP_ODS_AUTH_LDAP_OU_GROUPS", default=None),
+            AUTH_LDAP_OU_USERS=env.str("APP_ODS_AUTH_LDAP_OU_USERS", default=None),
+            AUTH_LDAP_RETRY_MAX=_parse(partial(env.int, default=3), "APP_ODS_AUTH_LDAP_RETRY_MAX"),
+            AUTH_LDAP_START_TLS=_parse(partial(env.bool, default=False), "APP_ODS_AUTH_LDAP_START_TLS"),
+            AUTH_LDAP_TIMEOUT=_parse(partial(env.int, default=30), "APP_ODS_AUTH_LDAP_TIMEOUT"),
+            AUTH_LDAP_TLS_CA_CERT_PATH=env.path("APP_ODS_AUTH_LDAP_TLS_CA_CERT_PATH", default=None),
+            AUTH_LDAP_URL=env.str("APP_ODS_AUTH_LDAP_URL", default=None),
+            AUTH_SYNC_RECONCILE_INTERVAL=_parse(
+                partial(env.int, default=86400), "APP_ODS_AUTH_SYNC_RECONCILE_INTERVAL"
+            ),
+            AUTH_SYNC_STATE_PATH=env.path("APP_ODS_AUTH_SYNC_STATE_PATH", default=None),
+            BACKUPS_COUNT=_parse(env.int, "APP_ODS_BACKUPS_COUNT"),
+            BACKUPS_PATH=_parse(env.path, "APP_ODS_BACKUPS_PATH"),
+            DATA_AIRNET_OUTPUT_PATH=_parse(env.path, "APP_ODS_DATA_AIRNET_OUTPUT_PATH"),
+            DATA_MANAGED_TABLE_NAMES=table_names if isinstance(table_names, EnvError) else tuple(table_names),
+            DB_DSN=_parse(env.str, "APP_ODS_DB_DSN"),
+            SERVE_BACKUP_INTERVAL=_parse(partial(env.int, default=86400), "APP_ODS_SERVE_BACKUP_INTERVAL"),
+            SERVE_CONVERT_INTERVAL=_parse(partial(env.int, default=300), "APP_ODS_SERVE_CONVERT_INTERVAL"),
+            SERVE_SOCKET_PATH=env.path("APP_ODS_SERVE_SOCKET_PATH", default=None),
+            SERVE_SYNC_AZURE_GROUPS=tuple(env.list("APP_ODS_SERVE_SYNC_AZURE_GROUPS", default=[])),
+            SERVE_SYNC_INTERVAL=_parse(partial(env.int, default=3600), "APP_ODS_SERVE_SYNC_INTERVAL"),
+            SERVE_SYNC_LDAP_GROUP=env.str("APP_ODS_SERVE_SYNC_LDAP_GROUP", default=None),
+            VERSION=version("ops-data-store"),
+        )
+
+
 class Config:
-    """Application configuration."""
+    """
+    Application configuration.
+
+    Options are parsed from the environment once and shared by all instances in the process.
+    """
+
+    _env: Optional[Env] = None
+    _settings: Optional[_Settings] = None
 
     def __init__(self) -> None:
         """
@@ -17,10 +118,33 @@ class Config:
         To support application tests which may need to manipulate options, such as the application database, variables
         loaded from a possible `.env` file, or that are set as environment variables directly, will be overriden by any
         variables set in a possible `.test.env` file.
+
+        Dotenv files are read, and options parsed, when the first instance is created. Later instances reuse these
+        options, use `reload()` to parse options again.
         """
-        self.env = Env()
-        self.env.read_env()
-        self.env.read_env(".test.env", override=True)
+        if Config._settings is None:
+            Config.reload()
+
+    @classmethod
+    def reload(cls: type[Config]) -> None:
+        """
+        Parse options from the environment again.
+
+        For use where environment variables have changed since options were parsed (e.g. in tests). Dotenv files are
+        only read once per process, so that changes to environment variables are not overridden.
+        """
+        if cls._env is None:
+            cls._env = Env()
+            cls._env.read_env()
+            cls._env.read_env(".test.env", override=True)
+        cls._settings = _Settings.parse(env=cls._env)
+
+    def _get(self, option: str) -> Any:  # noqa: ANN401
+        """Get option value, raising the original error if a required option is not set or invalid."""
+        value = getattr(self._settings, option)
+        if isinstance(value, EnvError):
+            raise EnvError(*value.args)
+        return value
 
     def validate(self) -> None:
         """
@@ -28,21 +152,23 @@ class Config:
 
         `AUTH_*` options are not validated as they are not required to use the core functionality of this application.
         They will be validated at runtime if performing auth related functions.
+
+        `SERVE_*` intervals are validated as they have default values that may be overridden with invalid values.
         """
         try:
-            self.env.str("APP_ODS_DB_DSN")
+            _ = self.DB_DSN
         except EnvError as e:
             msg = "Required config option `DB_DSN` not set."
             raise RuntimeError(msg) from e
 
         try:
-            self.env.list("APP_ODS_DATA_MANAGED_TABLE_NAMES")
+            _ = self.DATA_MANAGED_TABLE_NAMES
         except EnvError as e:
             msg = "Required config option `DATA_MANAGED_TABLE_NAMES` not set."
             raise RuntimeError(msg) from e
 
         try:
-            outputs_path: Path = self.env.path("APP_ODS_DATA_AIRNET_OUTPUT_PATH")
+            outputs_path: Path = self.DATA_AIRNET_OUTPUT_PATH
             if not outputs_path.is_dir():
                 msg = (
                     f"`DATA_AIRNET_OUTPUT_PATH` config value: '{outputs_path.resolve()}' not a directory "
@@ -54,7 +180,7 @@ class Config:
             raise RuntimeError(msg) from e
 
         try:
-            backups_count: int = self.env.int("APP_ODS_BACKUPS_COUNT")
+            backups_count: int = self.BACKUPS_COUNT
             if backups_count < 1:
                 msg = f"`BACKUPS_COUNT` config value: '{backups_count}' must be greater than 0."
                 raise RuntimeError(msg)
@@ -63,7 +189,7 @@ class Config:
             raise RuntimeError(msg) from e
 
         try:
-            backups_path: Path = self.env.path("APP_ODS_BACKUPS_PATH")
+            backups_path: Path = self.BACKUPS_PATH
             if not backups_path.is_dir():
                 msg = f"`BACKUPS_PATH` config value: '{backups_path.resolve()}' not a directory or does not exist."
                 raise RuntimeError(msg)
@@ -71,6 +197,20 @@ class Config:
             msg = "Required config option `BACKUPS_PATH` not set."
             raise RuntimeError(msg) from e
 
+        self._validate_serve_intervals()
+
+    def _validate_serve_intervals(self) -> None:
+        """Validate `SERVE_*_INTERVAL` options are valid numbers of seconds."""
+        for option in ["SERVE_BACKUP_INTERVAL", "SERVE_CONVERT_INTERVAL", "SERVE_SYNC_INTERVAL"]:
+            try:
+                interval: int = getattr(self, option)
+            except EnvError as e:
+                msg = f"Config option `{option}` not a valid number."
+                raise RuntimeError(msg) from e
+            if interval < 0:
+                msg = f"`{option}` config value: '{interval}' must be 0 or greater."
+                raise RuntimeError(msg)
+
     def dump(self) -> dict:
         """Return application configuration as a dictionary."""
         return {
@@ -78,15 +218,25 @@ class Config:
             "AUTH_AZURE_CLIENT_ID": self.AUTH_AZURE_CLIENT_ID,
             "AUTH_AZURE_CLIENT_SECRET": self.AUTH_AZURE_CLIENT_SECRET,
             "AUTH_AZURE_SCOPES": self.AUTH_AZURE_SCOPES,
+            "AUTH_AZURE_TOKEN_CACHE_PATH": self.AUTH_AZURE_TOKEN_CACHE_PATH,
+            "AUTH_DB_SYNC_IGNORED_USERS": self.AUTH_DB_SYNC_IGNORED_USERS,
             "AUTH_LDAP_BASE_DN": self.AUTH_LDAP_BASE_DN,
             "AUTH_LDAP_BIND_DN": self.AUTH_LDAP_BIND_DN,
             "AUTH_LDAP_BIND_PASSWORD": self.AUTH_LDAP_BIND_PASSWORD,
+            "AUTH_LDAP_MODIFY_BATCH_SIZE": self.AUTH_LDAP_MODIFY_BATCH_SIZE,
             "AUTH_LDAP_NAME_CONTEXT_GROUPS": self.AUTH_LDAP_NAME_CONTEXT_GROUPS,
             "AUTH_LDAP_NAME_CONTEXT_USERS": self.AUTH_LDAP_NAME_CONTEXT_USERS,
+            "AUTH_LDAP_NETWORK_TIMEOUT": self.AUTH_LDAP_NETWORK_TIMEOUT,
             "AUTH_LDAP_OU_GROUPS": self.AUTH_LDAP_OU_GROUPS,
             "AUTH_LDAP_OU_USERS": self.AUTH_LDAP_OU_USERS,
+            "AUTH_LDAP_RETRY_MAX": self.AUTH_LDAP_RETRY_MAX,
+            "AUTH_LDAP_START_TLS": self.AUTH_LDAP_START_TLS,
+            "AUTH_LDAP_TIMEOUT": self.AUTH_LDAP_TIMEOUT,
+            "AUTH_LDAP_TLS_CA_CERT_PATH": self.AUTH_LDAP_TLS_CA_CERT_PATH,
             "AUTH_LDAP_URL": self.AUTH_LDAP_URL,
             "AUTH_MS_GRAPH_ENDPOINT": self.AUTH_MS_GRAPH_ENDPOINT,
+            "AUTH_SYNC_RECONCILE_INTERVAL": self.AUTH_SYNC_RECONCILE_INTERVAL,
+            "AUTH_SYNC_STATE_PATH": self.AUTH_SYNC_STATE_PATH,
             "BACKUPS_COUNT": self.BACKUPS_COUNT,
             "BACKUPS_PATH": self.BACKUPS_PATH,
             "DATA_AIRNET_OUTPUT_PATH": self.DATA_AIRNET_OUTPUT_PATH,
@@ -97,6 +247,12 @@ class Config:
             "DATA_MANAGED_TABLE_NAMES": self.DATA_MANAGED_TABLE_NAMES,
             "DATA_QGIS_TABLE_NAMES": self.DATA_QGIS_TABLE_NAMES,
             "DB_DSN": self.DB_DSN,
+            "SERVE_BACKUP_INTERVAL": self.SERVE_BACKUP_INTERVAL,
+            "SERVE_CONVERT_INTERVAL": self.SERVE_CONVERT_INTERVAL,
+            "SERVE_SOCKET_PATH": self.SERVE_SOCKET_PATH,
+            "SERVE_SYNC_AZURE_GROUPS": self.SERVE_SYNC_AZURE_GROUPS,
+            "SERVE_SYNC_INTERVAL": self.SERVE_SYNC_INTERVAL,
+            "SERVE_SYNC_LDAP_GROUP": self.SERVE_SYNC_LDAP_GROUP,
             "VERSION": self.VERSION,
         }
 
@@ -108,7 +264,7 @@ class Config:
         Typically defined as an Azure tenancy specific URL such in the form:
         `https://login.microsoftonline.com/{TENANT_ID}`.
         """
-        return self.env.str("APP_ODS_AUTH_AZURE_AUTHORITY", default=None)
+        return self._get("AUTH_AZURE_AUTHORITY")
 
     @property
     def AUTH_AZURE_CLIENT_ID(self) -> Optional[str]:
@@ -117,7 +273,7 @@ class Config:
 
         As defined by the relevant Application Registration in the Azure Portal.
         """
-        return self.env.str("APP_ODS_AUTH_AZURE_CLIENT_ID", default=None)
+        return self._get("AUTH_AZURE_CLIENT_ID")
 
     @property
     def AUTH_AZURE_CLIENT_SECRET(self) -> Optional[str]:
@@ -126,7 +282,7 @@ class Config:
 
         As defined by the relevant Application Registration in the Azure Portal.
         """
-        return self.env.str("APP_ODS_AUTH_AZURE_CLIENT_SECRET", default=None)
+        return self._get("AUTH_AZURE_CLIENT_SECRET")
 
     @property
     def AUTH_AZURE_SCOPES(self) -> list[str]:
@@ -140,20 +296,47 @@ class Config:
         """
         return ["https://graph.microsoft.com/.default"]
 
+    @property
+    def AUTH_AZURE_TOKEN_CACHE_PATH(self) -> Optional[Path]:
+        """
+        Path to file used to cache Azure access tokens between processes.
+
+        If not set, tokens are only cached in memory for the lifetime of each process.
+        """
+        return self._get("AUTH_AZURE_TOKEN_CACHE_PATH")
+
+    @property
+    def AUTH_DB_SYNC_IGNORED_USERS(self) -> tuple[str, ...]:
+        """
+        Database users never granted or revoked roles when syncing Azure groups to database roles.
+
+        Typically application and test users, which are not members of Azure groups.
+        """
+        return self._get("AUTH_DB_SYNC_IGNORED_USERS")
+
     @property
     def AUTH_LDAP_BASE_DN(self) -> Optional[str]:
         """Distinguished Name (DN) used as common base/root for all LDAP queries."""
-        return self.env.str("APP_ODS_AUTH_LDAP_BASE_DN", default=None)
+        return self._get("AUTH_LDAP_BASE_DN")
 
     @property
     def AUTH_LDAP_BIND_DN(self) -> Optional[str]:
         """Distinguished Name (DN) used for LDAP client binding."""
-        return self.env.str("APP_ODS_AUTH_LDAP_BIND_DN", default=None)
+        return self._get("AUTH_LDAP_BIND_DN")
 
     @property
     def AUTH_LDAP_BIND_PASSWORD(self) -> Optional[str]:
         """Password used for LDAP client binding."""
-        return self.env.str("APP_ODS_AUTH_LDAP_BIND_PASSWORD", default=None)
+        return self._get("AUTH_LDAP_BIND_PASSWORD")
+
+    @property
+    def AUTH_LDAP_MODIFY_BATCH_SIZE(self) -> int:
+        """
+        Number of members added to, or removed from, an LDAP group per request.
+
+        Larger batches need fewer requests but may exceed server request size limits.
+        """
+        return self._get("AUTH_LDAP_MODIFY_BATCH_SIZE")
 
     @property
     def AUTH_LDAP_NAME_CONTEXT_GROUPS(self) -> str:
@@ -162,7 +345,7 @@ class Config:
 
         Typically, `cn`.
         """
-        return self.env.str("APP_ODS_AUTH_LDAP_CXT_GROUPS", default=None)
+        return self._get("AUTH_LDAP_NAME_CONTEXT_GROUPS")
 
     @property
     def AUTH_LDAP_NAME_CONTEXT_USERS(self) -> str:
@@ -171,22 +354,55 @@ class Config:
 
         Typically, either `cn` or `uid`.
         """
-        return self.env.str("APP_ODS_AUTH_LDAP_CXT_USERS", default=None)
+        return self._get("AUTH_LDAP_NAME_CONTEXT_USERS")
+
+    @property
+    def AUTH_LDAP_NETWORK_TIMEOUT(self) -> int:
+        """Seconds to wait when connecting to the LDAP server."""
+        return self._get("AUTH_LDAP_NETWORK_TIMEOUT")
 
     @property
     def AUTH_LDAP_OU_GROUPS(self) -> Optional[str]:
         """Organisational Unit (OU) containing groups."""
-        return self.env.str("APP_ODS_AUTH_LDAP_OU_GROUPS", default=None)
+        return self._get("AUTH_LDAP_OU_GROUPS")
 
     @property
     def AUTH_LDAP_OU_USERS(self) -> Optional[str]:
         """Organisational Unit (OU) containing users (individuals)."""
-        return self.env.str("APP_ODS_AUTH_LDAP_OU_USERS", default=None)
+        return self._get("AUTH_LDAP_OU_USERS")
+
+    @property
+    def AUTH_LDAP_RETRY_MAX(self) -> int:
+        """Number of attempts to reconnect to the LDAP server if the connection is dropped."""
+        return self._get("AUTH_LDAP_RETRY_MAX")
+
+    @property
+    def AUTH_LDAP_START_TLS(self) -> bool:
+        """
+        Whether to secure connections to the LDAP server using StartTLS.
+
+        Not needed if `AUTH_LDAP_URL` uses LDAPS (`ldaps://`).
+        """
+        return self._get("AUTH_LDAP_START_TLS")
+
+    @property
+    def AUTH_LDAP_TIMEOUT(self) -> int:
+        """Seconds to wait for LDAP server responses."""
+        return self._get("AUTH_LDAP_TIMEOUT")
+
+    @property
+    def AUTH_LDAP_TLS_CA_CERT_PATH(self) -> Optional[Path]:
+        """
+        Path to CA certificate(s) used to verify the LDAP server when using StartTLS or LDAPS.
+
+        If not set, the system CA certificates are used.
+        """
+        return self._get("AUTH_LDAP_TLS_CA_CERT_PATH")
 
     @property
     def AUTH_LDAP_URL(self) -> Optional[str]:
         """LDAP server URL."""
-        return self.env.str("APP_ODS_AUTH_LDAP_URL", default=None)
+        return self._get("AUTH_LDAP_URL")
 
     @property
     def AUTH_MS_GRAPH_ENDPOINT(self) -> str:
@@ -197,6 +413,25 @@ class Config:
         """
         return "https://graph.microsoft.com/v1.0"
 
+    @property
+    def AUTH_SYNC_RECONCILE_INTERVAL(self) -> int:
+        """
+        Seconds between full reconciliations when syncing incrementally.
+
+        Incremental syncs only apply changes to Azure groups since the last sync. A full sync is performed if this
+        many seconds have passed since the last full sync, to correct any changes made directly in LDAP.
+        """
+        return self._get("AUTH_SYNC_RECONCILE_INTERVAL")
+
+    @property
+    def AUTH_SYNC_STATE_PATH(self) -> Optional[Path]:
+        """
+        Path to file used to record state between incremental syncs.
+
+        If not set, incremental syncs are disabled.
+        """
+        return self._get("AUTH_SYNC_STATE_PATH")
+
     @property
     def BACKUPS_COUNT(self) -> int:
         """
@@ -204,17 +439,17 @@ class Config:
 
         Applies to per backup series - i.e. if set to `3`, 3 DB and 3 controlled datasets backups will be kept.
         """
-        return self.env.int("APP_ODS_BACKUPS_COUNT")
+        return self._get("BACKUPS_COUNT")
 
     @property
     def BACKUPS_PATH(self) -> Path:
         """Where to store backups."""
-        return self.env.path("APP_ODS_BACKUPS_PATH")
+        return self._get("BACKUPS_PATH")
 
     @property
     def DATA_AIRNET_OUTPUT_PATH(self) -> Path:
         """Where to store outputs from the Air Unit Network utility."""
-        return self.env.path("APP_ODS_DATA_AIRNET_OUTPUT_PATH")
+        return self._get("DATA_AIRNET_OUTPUT_PATH")
 
     @property
     def DATA_AIRNET_ROUTES_TABLE(self) -> str:
@@ -239,7 +474,7 @@ class Config:
     @property
     def DATA_MANAGED_TABLE_NAMES(self) -> list[str]:
         """Names of tables used for controlled datasets."""
-        return self.env.list("APP_ODS_DATA_MANAGED_TABLE_NAMES")
+        return list(self._get("DATA_MANAGED_TABLE_NAMES"))
 
     @property
     def DATA_QGIS_TABLE_NAMES(self) -> list[str]:
@@ -255,9 +490,56 @@ class Config:
 
         Source: https://www.postgresql.org/docs/current/libpq-connect.html#LIBPQ-CONNSTRING-URIS
         """
-        return self.env.str("APP_ODS_DB_DSN")
+        return self._get("DB_DSN")
+
+    @property
+    def SERVE_BACKUP_INTERVAL(self) -> int:
+        """
+        Seconds between backups when running as a daemon (`ods-ctl serve`).
+
+        Set to `0` to disable scheduled backups (they can still be triggered via the control socket).
+        """
+        return self._get("SERVE_BACKUP_INTERVAL")
+
+    @property
+    def SERVE_CONVERT_INTERVAL(self) -> int:
+        """
+        Seconds between Air Unit Network conversions when running as a daemon (`ods-ctl serve`).
+
+        Set to `0` to disable scheduled conversions (they can still be triggered via the control socket).
+        """
+        return self._get("SERVE_CONVERT_INTERVAL")
+
+    @property
+    def SERVE_SOCKET_PATH(self) -> Optional[Path]:
+        """
+        Path to Unix socket used to control the daemon (`ods-ctl serve`).
+
+        If not set, the control socket is disabled.
+        """
+        return self._get("SERVE_SOCKET_PATH")
+
+    @property
+    def SERVE_SYNC_AZURE_GROUPS(self) -> list[str]:
+        """IDs of Azure groups to sync from when running as a daemon (`ods-ctl serve`)."""
+        return list(self._get("SERVE_SYNC_AZURE_GROUPS"))
+
+    @property
+    def SERVE_SYNC_INTERVAL(self) -> int:
+        """
+        Seconds between auth syncs when running as a daemon (`ods-ctl serve`).
+
+        Syncs are only scheduled if `SERVE_SYNC_AZURE_GROUPS` and `SERVE_SYNC_LDAP_GROUP` are set. Set to `0` to
+        disable scheduled syncs (they can still be triggered via the control socket).
+        """
+        return self._get("SERVE_SYNC_INTERVAL")
+
+    @property
+    def SERVE_SYNC_LDAP_GROUP(self) -> Optional[str]:
+        """ID of LDAP group to sync to when running as a daemon (`ods-ctl serve`)."""
+        return self._get("SERVE_SYNC_LDAP_GROUP")
 
     @property
     def VERSION(self) -> str:
         """Application version."""
-        return version("ops-data-store")
+        return self._get("VERSION")
@@ -1,10 +1,17 @@
+from __future__ import annotations
+
+import asyncio
 import logging
 from pathlib import Path
 from sqlite3 import connect as sqlite3_connect
+from typing import Optional
 
 from osgeo.gdal import (
     OF_VECTOR as GDAL_OUTPUT_FORMAT_VECTOR,
 )
+from osgeo.gdal import (
+    Dataset as GDALDataset,
+)
 from osgeo.gdal import (
     OpenEx as GDALOpenDataSource,
 )
@@ -19,6 +26,7 @@ from osgeo.gdal import (
 from ops_data_store.airnet import AirUnitNetworkClient
 from ops_data_store.config import Config
 from ops_data_store.db import DBClient
+from ops_data_store.metrics import Metrics
 from ops_data_store.utils import empty_dir
 
 
@@ -46,6 +54,29 @@ class DataClient:
         self._qgis_styles_table = self.config.DATA_QGIS_TABLE_NAMES[0]
         self.export_tables = [*self._controlled_tables, self._qgis_styles_table]
 
+    def _export_layer(
+        self, source: GDALDataset, target: str, schema: str, table_name: str, access_mode: Optional[str]
+    ) -> None:
+        """
+        Export table to a layer in GeoPackage.
+
+        The output dataset is closed (flushing it to disk) before the layer is considered exported.
+        """
+        with Metrics.timed(f"data.export.{table_name}") as timing:
+            dataset = VectorTranslate(
+                destNameOrDestDS=target,
+                srcDS=source,
+                options=VectorTranslateOptions(
+                    format="GPKG",
+                    layerName=table_name,
+                    SQLStatement=f"SELECT * FROM {schema}.{table_name};",  # noqa: S608
+                    accessMode=access_mode,
+                ),
+            )
+            if dataset is not None:
+                timing.rows = dataset.GetLayerByName(table_name).GetFeatureCount()
+            del dataset
+
     def export(self, path: Path) -> None:
         """
         Save datasets to GeoPackage.
@@ -81,15 +112,12 @@ class DataClient:
             self.logger.info("Access mode for layer: %s is: %s.", table_name, access_mode)
 
             try:
-                VectorTranslate(
-                    destNameOrDestDS=target,
-                    srcDS=source,
-                    options=VectorTranslateOptions(
-                        format="GPKG",
-                        layerName=table_name,
-                        SQLStatement=f"SELECT * FROM {self.config.DATA_MANAGED_SCHEMA_NAME}.{table_name};",  # noqa: S608
-                        accessMode=access_mode,
-                    ),
+                self._export_layer(
+                    source=source,
+                    target=target,
+                    schema=self.config.DATA_MANAGED_SCHEMA_NAME,
+                    table_name=table_name,
+                    access_mode=access_mode,
                 )
             except RuntimeError as e:
                 self.logger.error(e, exc_info=True)
@@ -97,15 +125,8 @@ class DataClient:
                 raise RuntimeError(msg) from e
 
         access_mode = "update"
-        VectorTranslate(
-            destNameOrDestDS=target,
-            srcDS=source,
-            options=VectorTranslateOptions(
-                format="GPKG",
-                layerName=self._qgis_styles_table,
-                SQLStatement=f"SELECT * FROM public.{self._qgis_styles_table};",  # noqa: S608
-                accessMode=access_mode,
-            ),
+        self._export_layer(
+            source=source, target=target, schema="public", table_name=self._qgis_styles_table, access_mode=access_mode
         )
 
         self.logger.info("Fixing layer style references in GeoPackage")
@@ -120,6 +141,8 @@ class DataClient:
         """
         Convert Air Unit datasets to PDF, CSV, GPX and FPL formats.
 
+        Datasets are fetched using concurrent queries to limit the time spent waiting on the database.
+
         Warning: Any existing content within the output path will be removed, and any existing outputs overwritten.
         """
         self.logger.info("Converting Air Unit datasets to output formats.")
@@ -127,7 +150,7 @@ class DataClient:
         self.logger.info("Clearing output directory.")
         empty_dir(path=self.config.DATA_AIRNET_OUTPUT_PATH)
 
-        self.airnet_client.fetch()
+        asyncio.run(self.airnet_client.fetch_async())
         self.airnet_client.export()
 
         self.logger.info("Conversion ok.")
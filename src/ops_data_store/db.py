@@ -1,19 +1,53 @@
 import logging
 import subprocess
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from hashlib import sha256
+from importlib.abc import Traversable
+from importlib.resources import files
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import psycopg
 from psycopg import Cursor
-from psycopg.sql import Composed
+from psycopg.sql import SQL, Composed, Identifier
 
 from ops_data_store.config import Config
+from ops_data_store.metrics import Metrics
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    Database schema migration.
+
+    Migrations are SQL files named `{version}_{name}.sql` (e.g. `0001_controlled_datasets.sql`), where version is a
+    zero padded number used to order migrations.
+    """
+
+    version: str
+    name: str
+    sql: str
+
+    @property
+    def checksum(self) -> str:
+        """SHA256 sum of migration SQL."""
+        return sha256(self.sql.encode()).hexdigest()
+
+    @classmethod
+    def load(cls: type["Migration"], path: Traversable) -> "Migration":
+        """Load migration from SQL file."""
+        version, name = path.name.removesuffix(".sql").split("_", maxsplit=1)
+        return cls(version=version, name=name, sql=path.read_text())
 
 
 class DBClient:
     """Application database client."""
 
+    role_batch_size = 100
+
     def __init__(self) -> None:
         """Create instance."""
         self.config = Config()
@@ -28,64 +62,125 @@ class DBClient:
 
         self._required_extensions: list[str] = ["postgis", "pgcrypto", "fuzzystrmatch"]
         self._required_data_types: list[str] = ["ddm_point"]
-        self._required_functions: list[str] = ["generate_ulid", "geom_as_ddm", "set_updated_at", "set_updated_by"]
+        self._required_functions: list[str] = [
+            "generate_ulid",
+            "generate_ulid_monotonic",
+            "geom_as_ddm_x",
+            "geom_as_ddm_y",
+            "geom_as_ddm",
+            "set_updated_at",
+            "set_updated_by",
+        ]
+
+        self._required_objects: dict[str, list[str]] = {
+            "extension": self._required_extensions,
+            "data type": self._required_data_types,
+            "function": self._required_functions,
+        }
+
+        self._migrations_path: Traversable = files("ops_data_store").joinpath("migrations")
+        self._migrations_table = "public.schema_migrations"
 
         self._custom_data_types: dict[str, str] = {"ddm_point": "CREATE TYPE ddm_point AS (x TEXT, y TEXT);"}
         self._custom_functions: dict[str, str] = {
             "generate_ulid": """
         CREATE OR REPLACE FUNCTION generate_ulid() RETURNS uuid
+            VOLATILE
+            PARALLEL SAFE
         AS $$
-            SELECT (
-                lpad(to_hex(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint), 12, '0') ||
-                encode(gen_random_bytes(10), 'hex')
+            SELECT encode(
+                substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3) ||
+                gen_random_bytes(10),
+                'hex'
             )::uuid;
         $$ LANGUAGE SQL;
             """,
-            "geom_as_ddm": """
-        CREATE OR REPLACE FUNCTION geom_as_ddm(geom GEOMETRY)
-            RETURNS ddm_point
-            IMMUTABLE
-            PARALLEL SAFE
+            "generate_ulid_monotonic": """
+        CREATE OR REPLACE FUNCTION generate_ulid_monotonic() RETURNS uuid
+            VOLATILE
         AS $$
         DECLARE
-            lon FLOAT;
-            lat FLOAT;
-            lon_degree FLOAT;
-            lon_minutes FLOAT;
-            lon_sign TEXT;
-            lat_degree FLOAT;
-            lat_minutes FLOAT;
-            lat_sign TEXT;
-            x TEXT;
-            y TEXT;
+            now_ms BIGINT := floor(extract(epoch FROM clock_timestamp()) * 1000);
+            last_ms BIGINT := COALESCE(NULLIF(current_setting('ods.ulid_last_ms', true), ''), '0')::BIGINT;
+            entropy BYTEA;
+            i INTEGER := 9;
         BEGIN
-            lon := ST_X(geom);
-            lat := ST_Y(geom);
-
-            SELECT FLOOR(ABS(lon)), FLOOR(ABS(lat))
-            INTO lon_degree, lat_degree;
-
-            SELECT ((ABS(lon) - lon_degree) * 60.0), ((ABS(lat) - lat_degree) * 60.0)
-            INTO lon_minutes, lat_minutes;
-
-            IF lon >= 0 THEN
-                lon_sign := 'E';
-            ELSE
-                lon_sign := 'W';
-            END IF;
-
-            IF lat >= 0 THEN
-                lat_sign := 'N';
+            IF now_ms > last_ms THEN
+                entropy := gen_random_bytes(10);
             ELSE
-                lat_sign := 'S';
+                -- same millisecond (or the clock has gone backwards), increment previous random component
+                now_ms := last_ms;
+                entropy := decode(current_setting('ods.ulid_last_entropy'), 'hex');
+                LOOP
+                    IF get_byte(entropy, i) < 255 THEN
+                        entropy := set_byte(entropy, i, get_byte(entropy, i) + 1);
+                        EXIT;
+                    END IF;
+                    entropy := set_byte(entropy, i, 0);
+                    i := i - 1;
+                    IF i < 0 THEN
+                        -- random component exhausted, move to the next millisecond
+                        now_ms := now_ms + 1;
+                        entropy := gen_random_bytes(10);
+                        EXIT;
+                    END IF;
+                END LOOP;
             END IF;
 
-            x := CONCAT(CAST(lon_degree AS TEXT), '° ', TO_CHAR(lon_minutes, 'FM999999.999999'), ''' ', lon_sign);
-            y := CONCAT(CAST(lat_degree AS TEXT), '° ', TO_CHAR(lat_minutes, 'FM999999.999999'), ''' ', lat_sign);
-
-            RETURN (x, y);
+            PERFORM set_config('ods.ulid_last_ms', now_ms::TEXT, false);
+            PERFORM set_config('ods.ulid_last_entropy', encode(entropy, 'hex'), false);
+            RETURN encode(substring(int8send(now_ms) FROM 3) || entropy, 'hex')::uuid;
+        END;
+        $$ LANGUAGE plpgsql;
+            """,
+            "geom_as_ddm_x": """
+        CREATE OR REPLACE FUNCTION geom_as_ddm_x(geom GEOMETRY)
+            RETURNS TEXT
+            IMMUTABLE
+            PARALLEL SAFE
+        AS $$
+        DECLARE
+            lon FLOAT := ST_X(geom);
+            lon_degree FLOAT := FLOOR(ABS(lon));
+        BEGIN
+            RETURN CONCAT(
+                CAST(lon_degree AS TEXT),
+                '° ',
+                TO_CHAR((ABS(lon) - lon_degree) * 60.0, 'FM999999.999999'),
+                ''' ',
+                CASE WHEN lon >= 0 THEN 'E' ELSE 'W' END
+            );
+        END;
+        $$ LANGUAGE plpgsql;
+            """,
+            "geom_as_ddm_y": """
+        CREATE OR REPLACE FUNCTION geom_as_ddm_y(geom GEOMETRY)
+            RETURNS TEXT
+            IMMUTABLE
+            PARALLEL SAFE
+        AS $$
+        DECLARE
+            lat FLOAT := ST_Y(geom);
+            lat_degree FLOAT := FLOOR(ABS(lat));
+        BEGIN
+            RETURN CONCAT(
+                CAST(lat_degree AS TEXT),
+                '° ',
+                TO_CHAR((ABS(lat) - lat_degree) * 60.0, 'FM999999.999999'),
+                ''' ',
+                CASE WHEN lat >= 0 THEN 'N' ELSE 'S' END
+            );
         END;
         $$ LANGUAGE plpgsql;
+            """,
+            "geom_as_ddm": """
+        CREATE OR REPLACE FUNCTION geom_as_ddm(geom GEOMETRY)
+            RETURNS ddm_point
+            IMMUTABLE
+            PARALLEL SAFE
+        AS $$
+            SELECT ROW(geom_as_ddm_x(geom), geom_as_ddm_y(geom))::ddm_point;
+        $$ LANGUAGE SQL;
             """,
             "set_updated_at": """
         CREATE OR REPLACE FUNCTION set_updated_at()
@@ -107,52 +202,143 @@ class DBClient:
             """,
         }
 
-    def _setup_extensions(self, cur: Cursor) -> None:
-        """Create required Postgres extensions."""
-        for extension in self._required_extensions:
-            self.logger.info(f"Setting up required DB extension '{extension}'.")
-            # exempting SQL injection check as extension names are effectively fixed
-            cur.execute(f"CREATE EXTENSION IF NOT EXISTS {extension}")
-            cur.execute(f"SELECT 1 FROM pg_available_extensions WHERE name='{extension}'")  # noqa: S608
-            if cur.fetchone()[0] != 1:  # pragma: no cover - see MAGIC/ops-data-store#43
-                self.logger.error(f"Required extension '{extension}' not found after attempting to create.")
-                msg = f"No. Required extension '{extension}' not found."
-                raise RuntimeError(msg)
-            self.logger.info(f"Required DB extension '{extension}' ok.")
-
-    def _setup_types(self, cur: Cursor) -> None:
-        """Create required Postgres data types."""
-        for data_type in self._required_data_types:
-            self.logger.info(f"Setting up required DB data type '{data_type}'.")
+    def _get_setup_objects(self, cur: Cursor) -> dict[str, set[str]]:
+        """
+        Get required Postgres extensions, data types and functions that exist in the database.
+
+        All object types are checked in a single query to minimise round trips.
+        """
+        cur.execute(
+            """
+            SELECT 'extension', extname FROM pg_extension WHERE extname = ANY(%(extensions)s)
+            UNION ALL
+            SELECT 'data type', typname FROM pg_type WHERE typname = ANY(%(data_types)s)
+            UNION ALL
+            SELECT 'function', proname FROM pg_proc WHERE proname = ANY(%(functions)s);
+        """,
+            {
+                "extensions": self._required_extensions,
+                "data_types": self._required_data_types,
+                "functions": self._required_functions,
+            },
+        )
+        objects: dict[str, set[str]] = {kind: set() for kind in self._required_objects}
+        for kind, name in cur.fetchall():
+            objects[kind].add(name)
+        return objects
+
+    def _plan_setup(self, existing: dict[str, set[str]]) -> list[str]:
+        """
+        Get statements to create required Postgres objects.
+
+        Statements are ordered so extensions are created before the data types and functions that depend on them.
+        Extensions and data types are only created if not in the database. Functions are always (re)created using
+        `CREATE OR REPLACE`, so that definitions here apply to existing databases and are the only source of truth for
+        custom functions. All statements are sent as a single batch.
+        """
+        statements = []
+        for kind, names in self._required_objects.items():
+            for name in names:
+                if name in existing[kind] and kind != "function":
+                    self.logger.info(f"Required DB {kind} '{name}' already exists.")
+                    continue
+                self.logger.info(f"Setting up required DB {kind} '{name}'.")
+                if kind == "extension":
+                    # exempting SQL injection check as extension names are effectively fixed
+                    statements.append(f"CREATE EXTENSION IF NOT EXISTS {name};")
+                elif kind == "data type":
+                    statements.append(self._custom_data_types[name])
+                else:
+                    statements.append(self._custom_functions[name])
+        return statements
+
+    def _verify_setup(self, cur: Cursor) -> None:
+        """
+        Check required Postgres objects exist.
+
+        Raises a RuntimeError for the first missing object.
+        """
+        existing = self._get_setup_objects(cur=cur)
+        for kind, names in self._required_objects.items():
+            for name in names:
+                if name not in existing[kind]:
+                    self.logger.error(f"Required {kind} '{name}' not found after attempting to create.")
+                    msg = f"No. Required {kind} '{name}' not found."
+                    raise RuntimeError(msg)
+                self.logger.info(f"Required DB {kind} '{name}' ok.")
+
+    def _load_migrations(self) -> list[Migration]:
+        """Load available migrations ordered by version."""
+        migrations = [
+            Migration.load(path=path)
+            for path in self._migrations_path.iterdir()
+            if path.is_file() and path.name.endswith(".sql")
+        ]
+        return sorted(migrations, key=lambda migration: migration.version)
+
+    def _get_applied_migrations(self, cur: Cursor) -> dict[str, str]:
+        """
+        Get applied migrations as a mapping of versions to checksums.
+
+        Returns an empty mapping if the migrations table does not yet exist.
+        """
+        cur.execute("SELECT to_regclass(%s) IS NOT NULL;", (self._migrations_table,))
+        if not cur.fetchone()[0]:
+            return {}
+
+        cur.execute(f"SELECT version, checksum FROM {self._migrations_table};")  # noqa: S608
+        return dict(cur.fetchall())
+
+    def _get_pending_migrations(self, cur: Cursor) -> list[Migration]:
+        """Get migrations not yet applied, warning where applied migrations have since been modified."""
+        applied = self._get_applied_migrations(cur=cur)
+        pending = []
+
+        for migration in self._load_migrations():
+            if migration.version not in applied:
+                pending.append(migration)
+                continue
+            if applied[migration.version] != migration.checksum:
+                self.logger.warning(
+                    f"Applied migration '{migration.version}_{migration.name}' has changed since it was applied."
+                )
+
+        return pending
+
+    def _apply_migrations(self, cur: Cursor) -> list[Migration]:
+        """
+        Apply pending migrations.
+
+        An advisory lock is held for the current transaction to prevent concurrent runs applying the same migrations.
+        """
+        cur.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self._migrations_table} (
+                version TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                checksum TEXT NOT NULL,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            );
+        """
+        )
+        cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s));", (self._migrations_table,))
+
+        pending = self._get_pending_migrations(cur=cur)
+        for migration in pending:
+            self.logger.info(f"Applying DB migration '{migration.version}_{migration.name}'.")
+            try:
+                cur.execute(migration.sql)
+            except psycopg.Error as e:
+                self.logger.error(e, exc_info=True)
+                msg = f"No. Migration '{migration.version}_{migration.name}' failed: {e}"
+                raise RuntimeError(msg) from e
             cur.execute(
-                f"""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = '{data_type}') THEN
-                       {self._custom_data_types[data_type]}
-                    END IF;
-                END$$;
-            """  # noqa: S608
+                f"INSERT INTO {self._migrations_table} (version, name, checksum) VALUES (%s, %s, %s);",  # noqa: S608
+                (migration.version, migration.name, migration.checksum),
             )
+            self.logger.info(f"DB migration '{migration.version}_{migration.name}' ok.")
 
-            cur.execute(f"""SELECT 1 FROM pg_type WHERE typname = '{data_type}';""")  # noqa: S608
-            if cur.fetchone()[0] != 1:
-                self.logger.error(f"Required data type '{data_type}' not found after attempting to create.")
-                msg = f"No. Required data type '{data_type}' not found."
-                raise RuntimeError(msg)
-            self.logger.info(f"Required DB data type '{data_type}' ok.")
-
-    def _setup_functions(self, cur: Cursor) -> None:
-        """Create required Postgres functions."""
-        for function in self._required_functions:
-            self.logger.info(f"Setting up required DB function '{function}'.")
-            cur.execute(self._custom_functions[function])
-            cur.execute(f"""SELECT 1 FROM pg_proc WHERE proname = '{function}';""")  # noqa: S608
-            if cur.fetchone()[0] != 1:
-                self.logger.error(f"Required function '{function}' not found after attempting to create.")
-                msg = f"No. Required function '{function}' not found."
-                raise RuntimeError(msg)
-            self.logger.info(f"Required DB function '{function}' ok.")
+        return pending
 
     def check(self) -> None:
         """
@@ -172,27 +358,165 @@ class DBClient:
 
     def setup(self) -> None:
         """
-        Create required Postgres extensions and functions.
+        Create required Postgres extensions and functions and apply any pending migrations.
 
         Though it's expected this command will be run once when setting up a new database, it MUST be assumed it may be
         called multiple times (possibly as part of release automation). This command MUST NOT therefore put existing
         data at risk or return errors for pre-existing objects etc.
 
-        Error handling is intentionally omitted in this command as the underlying exceptions will give useful context
-        should any command fail, and wrapping these exceptions won't provide any benefit.
+        Existing objects are checked, missing objects created, and all objects verified, in a fixed number of queries
+        (rather than per object) to limit round trips to the database. All objects are created, and migrations applied,
+        in a single transaction so a failure leaves the database as it was.
+
+        Error handling is intentionally omitted in this command (other than for migrations) as the underlying
+        exceptions will give useful context should any command fail, and wrapping these exceptions won't provide any
+        benefit.
         """
         self.logger.info("Setting up required database objects.")
 
         with psycopg.connect(conninfo=self._dsn) as conn, conn.cursor() as cur:
-            self._setup_extensions(cur=cur)
-            self._setup_types(cur=cur)
-            self._setup_functions(cur=cur)
+            statements = self._plan_setup(existing=self._get_setup_objects(cur=cur))
+            if statements:
+                cur.execute("\n".join(statements))
+            self._verify_setup(cur=cur)
+            self._apply_migrations(cur=cur)
+
+    def migrations_pending(self) -> list[Migration]:
+        """Get migrations not yet applied to the database."""
+        self.logger.info("Checking for pending DB migrations.")
+        with psycopg.connect(conninfo=self._dsn) as conn, conn.cursor() as cur:
+            return self._get_pending_migrations(cur=cur)
+
+    def migrate(self) -> list[Migration]:
+        """
+        Apply pending migrations to the database.
+
+        Migrations are applied in version order within a single transaction, so either all pending migrations are
+        applied or none are. Applied migrations are recorded in the `public.schema_migrations` table.
+
+        Returns applied migrations.
+        """
+        self.logger.info("Applying pending DB migrations.")
+        with psycopg.connect(conninfo=self._dsn) as conn, conn.cursor() as cur:
+            return self._apply_migrations(cur=cur)
+
+    def check_fk_indexes(self) -> list[tuple[str, str, str]]:
+        """
+        Find foreign keys in the managed schema without a supporting index.
+
+        A foreign key is supported by any non-partial index whose leading key columns are the foreign key columns (in
+        any order). Without such an index, cascading deletes and joins on the foreign key need to scan the table.
+
+        Returns a list of (table, constraint, columns) tuples, which is empty if all foreign keys are indexed.
+        """
+        self.logger.info(f"Checking foreign keys in '{self._schema}' schema have supporting indexes.")
+        with psycopg.connect(self._dsn) as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT c.conrelid::regclass::text, c.conname, (
+                    SELECT string_agg(a.attname, ', ' ORDER BY k.ord)
+                    FROM unnest(c.conkey) WITH ORDINALITY AS k(attnum, ord)
+                    JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+                )
+                FROM pg_constraint c
+                JOIN pg_namespace n ON n.oid = c.connamespace
+                WHERE c.contype = 'f'
+                  AND n.nspname = %s
+                  AND NOT EXISTS (
+                      SELECT 1
+                      FROM pg_index i
+                      WHERE i.indrelid = c.conrelid
+                        AND i.indpred IS NULL
+                        AND i.indnkeyatts >= cardinality(c.conkey)
+                        AND (string_to_array(i.indkey::text, ' ')::int2[])[1:cardinality(c.conkey)] @> c.conkey
+                  )
+                ORDER BY 1, 2;
+            """,
+                (self._schema,),
+            )
+            missing = cur.fetchall()
+
+        for table, constraint, columns in missing:
+            self.logger.warning(f"Foreign key '{constraint}' on '{table}' ({columns}) has no supporting index.")
+        return missing
+
+    def check_roles(self, role_names: list[str]) -> list[str]:
+        """
+        Check which roles (including users) exist.
+
+        All roles are checked in a single query. Returns names of roles that exist.
+        """
+        with Metrics.timed("db.check_roles"), psycopg.connect(self._dsn) as conn, conn.cursor() as cur:
+            cur.execute("SELECT rolname FROM pg_roles WHERE rolname = ANY(%s);", (role_names,))
+            return [row[0] for row in cur.fetchall()]
+
+    def get_role_members(self, role_name: str) -> list[str]:
+        """
+        Get names of users directly granted a role.
+
+        Only roles that can login (users) are included, group roles granted the role are not.
+        """
+        with Metrics.timed("db.get_role_members"), psycopg.connect(self._dsn) as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT m.rolname
+                FROM pg_auth_members am
+                JOIN pg_roles r ON r.oid = am.roleid
+                JOIN pg_roles m ON m.oid = am.member
+                WHERE r.rolname = %s AND m.rolcanlogin
+                ORDER BY 1;
+            """,
+                (role_name,),
+            )
+            return [row[0] for row in cur.fetchall()]
+
+    def set_role_members(self, role_name: str, grant: list[str], revoke: list[str]) -> None:
+        """
+        Grant and revoke a role to/from users.
+
+        Users are granted, or revoked, the role in batches of `role_batch_size` per statement. All statements are sent
+        in a single transaction, so either all users are granted/revoked the role or none are.
+
+        Raises a RuntimeError if any statement fails.
+        """
+        role = Identifier(role_name)
+        statements = []
+        for i in range(0, len(grant), self.role_batch_size):
+            users = SQL(", ").join(Identifier(user) for user in grant[i : i + self.role_batch_size])
+            statements.append(SQL("GRANT {} TO {};").format(role, users))
+        for i in range(0, len(revoke), self.role_batch_size):
+            users = SQL(", ").join(Identifier(user) for user in revoke[i : i + self.role_batch_size])
+            statements.append(SQL("REVOKE {} FROM {};").format(role, users))
+        if not statements:
+            return
+
+        self.logger.info(f"Granting '{role_name}' role to {len(grant)} and revoking from {len(revoke)} users.")
+        try:
+            with (
+                Metrics.timed("db.set_role_members") as timing,
+                psycopg.connect(self._dsn) as conn,
+                conn.cursor() as cur,
+            ):
+                timing.rows = len(grant) + len(revoke)
+                cur.execute(SQL("\n").join(statements))
+        except psycopg.Error as e:
+            self.logger.error(e, exc_info=True)
+            msg = f"Failed to update members of DB role {role_name}, no changes have been made."
+            raise RuntimeError(msg) from e
 
     def execute(self, query: str) -> None:
         """Execute a query against the DB."""
-        with psycopg.connect(self._dsn) as conn, conn.cursor() as cur:
+        with Metrics.timed("db.execute"), psycopg.connect(self._dsn) as conn, conn.cursor() as cur:
             cur.execute(query)
 
+    @staticmethod
+    def _pg_dump(args: list[str], path: Path) -> None:
+        """Run `pg_dump`, recording how long it takes and the size of the file written to `path`."""
+        with Metrics.timed("db.pg_dump") as timing:
+            subprocess.run(args=args, check=True, text=True, capture_output=True)
+            if path.exists():
+                timing.bytes = path.stat().st_size
+
     def dump(self, path: Path) -> None:
         """
         Backup database to a file.
@@ -222,7 +546,7 @@ class DBClient:
                     f"--file={controlled_datasets_path.resolve()}",
                 ]
                 self.logger.info(f"Args: {subprocess_args}")
-                subprocess.run(args=subprocess_args, check=True, text=True, capture_output=True)
+                self._pg_dump(args=subprocess_args, path=controlled_datasets_path)
 
                 self.logger.info("Dumping QGIS layer styles via `pg_dump`.")
                 subprocess_args = [
@@ -232,7 +556,7 @@ class DBClient:
                     f"--file={qgis_styles_path.resolve()}",
                 ]
                 self.logger.info(f"Args: {subprocess_args}")
-                subprocess.run(args=subprocess_args, check=True, text=True, capture_output=True)
+                self._pg_dump(args=subprocess_args, path=qgis_styles_path)
 
                 self.logger.info("Combining dump files.")
                 with path.open(mode="w") as file:
@@ -252,11 +576,109 @@ class DBClient:
             msg = "DB dump failed."
             raise RuntimeError(msg) from e
 
+    @contextmanager
+    def listen(self, channel: str) -> Iterator[psycopg.Connection]:
+        """
+        Open connection listening for notifications on a channel.
+
+        The connection uses autocommit so notifications are delivered as they are received, rather than when a
+        transaction ends. Use the `notifies()` method of the connection to receive notifications.
+        """
+        self.logger.info("Listening for DB notifications on channel '%s'.", channel)
+        with psycopg.connect(self._dsn, autocommit=True) as conn:
+            conn.execute(SQL("LISTEN {}").format(Identifier(channel)))
+            yield conn
+
     def fetch(self, query: Composed) -> list[tuple]:
         """Fetch results from a query."""
         self.logger.info("Fetching from database.")
         self.logger.debug(f"Query: {query}")
 
-        with psycopg.connect(self._dsn) as conn, conn.cursor() as cur:
+        with Metrics.timed("db.fetch") as timing, psycopg.connect(self._dsn) as conn, conn.cursor() as cur:
             cur.execute(query)
-            return cur.fetchall()
+            results = cur.fetchall()
+            timing.rows = len(results)
+            return results
+
+    def stream(self, query: Composed) -> Iterator[tuple]:
+        """
+        Fetch results from a query one row at a time.
+
+        Rows are sent by the server as they are produced, rather than all results being held in memory.
+        """
+        self.logger.info("Streaming from database.")
+        self.logger.debug(f"Query: {query}")
+
+        with Metrics.timed("db.stream") as timing, psycopg.connect(self._dsn) as conn, conn.cursor() as cur:
+            timing.rows = 0
+            for row in cur.stream(query):
+                timing.rows += 1
+                yield row
+
+
+class AsyncDBClient:
+    """
+    Application database client using asynchronous connections.
+
+    Each call uses its own connection, so that independent queries can be run concurrently (e.g. with
+    `asyncio.gather()`), hiding the round trip time to the database for all but one query.
+    """
+
+    def __init__(self) -> None:
+        """Create instance."""
+        self.config = Config()
+
+        self.logger = logging.getLogger("app")
+        self.logger.info("Creating async DB client.")
+
+        self._dsn = self.config.DB_DSN
+
+    async def check(self) -> None:
+        """
+        Check DB can be queried.
+
+        Raises a RuntimeError if test query fails.
+        """
+        self.logger.info("Checking DB connection.")
+        try:
+            async with await psycopg.AsyncConnection.connect(self._dsn) as conn, conn.cursor() as cur:
+                await cur.execute("SELECT 1;")
+                self.logger.info("DB connection ok.")
+        except (psycopg.ProgrammingError, psycopg.OperationalError) as e:
+            self.logger.error(e, exc_info=True)
+            msg = "DB connection failed."
+            raise RuntimeError(msg) from e
+
+    async def execute(self, query: str) -> None:
+        """Execute a query against the DB."""
+        with Metrics.timed("db.execute"):
+            async with await psycopg.AsyncConnection.connect(self._dsn) as conn, conn.cursor() as cur:
+                await cur.execute(query)
+
+    async def fetch(self, query: Composed) -> list[tuple]:
+        """Fetch results from a query."""
+        self.logger.info("Fetching from database.")
+        self.logger.debug(f"Query: {query}")
+
+        with Metrics.timed("db.fetch") as timing:
+            async with await psycopg.AsyncConnection.connect(self._dsn) as conn, conn.cursor() as cur:
+                await cur.execute(query)
+                results = await cur.fetchall()
+                timing.rows = len(results)
+                return results
+
+    async def stream(self, query: Composed) -> AsyncIterator[tuple]:
+        """
+        Fetch results from a query one row at a time.
+
+        Rows are sent by the server as they are produced, rather than all results being held in memory.
+        """
+        self.logger.info("Streaming from database.")
+        self.logger.debug(f"Query: {query}")
+
+        with Metrics.timed("db.stream") as timing:
+            timing.rows = 0
+            async with await psycopg.AsyncConnection.connect(self._dsn) as conn, conn.cursor() as cur:
+                async for row in cur.stream(query):
+                    timing.rows += 1
+                    yield row
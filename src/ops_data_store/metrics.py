@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import ClassVar, Optional
+
+
+@dataclass
+class Timing:
+    """
+    A single timed operation.
+
+    Where relevant, the number of rows (or other items) processed, and bytes read or written, can be set on the timing
+    while the operation runs.
+    """
+
+    name: str
+    duration: float = 0
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+
+
+@dataclass
+class OperationStats:
+    """Combined timings for all operations with the same name."""
+
+    count: int = 0
+    total: float = 0
+    max: float = 0
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+
+    def add(self, timing: Timing) -> None:
+        """Include timing in stats."""
+        self.count += 1
+        self.total += timing.duration
+        self.max = max(self.max, timing.duration)
+        if timing.rows is not None:
+            self.rows = (self.rows or 0) + timing.rows
+        if timing.bytes is not None:
+            self.bytes = (self.bytes or 0) + timing.bytes
+
+    def __str__(self) -> str:
+        """Summarise stats."""
+        summary = f"{self.count} call(s), {self.total:.3f}s total, {self.max:.3f}s max"
+        if self.rows is not None:
+            summary += f", {self.rows} rows"
+        if self.bytes is not None:
+            summary += f", {self.bytes} bytes"
+        return summary
+
+
+class Metrics:
+    """
+    Process-wide record of how long operations take.
+
+    Operations are timed using `timed`, as a context manager or decorator, and named by client and action (e.g.
+    `db.fetch`). Timings are combined by name as they are recorded, so memory use does not grow in long-running
+    processes, such as `serve`.
+
+    Recorded stats are summarised at the end of each CLI command and can optionally be written to a JSON file.
+    """
+
+    _stats: ClassVar[dict[str, OperationStats]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def timed(cls: type[Metrics], name: str) -> Iterator[Timing]:
+        """
+        Time an operation.
+
+        Operations are recorded even if they fail. E.g.:
+
+        ```
+        with Metrics.timed("db.fetch") as timing:
+            results = cur.fetchall()
+            timing.rows = len(results)
+        ```
+        """
+        timing = Timing(name=name)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.duration = time.perf_counter() - start
+            logging.getLogger("app").debug("Timing: %s", timing)
+            with cls._lock:
+                cls._stats.setdefault(name, OperationStats()).add(timing)
+
+    @classmethod
+    def stats(cls: type[Metrics]) -> dict[str, OperationStats]:
+        """Get recorded stats indexed by operation name."""
+        with cls._lock:
+            return {name: OperationStats(**asdict(stats)) for name, stats in sorted(cls._stats.items())}
+
+    @classmethod
+    def reset(cls: type[Metrics]) -> None:
+        """Discard recorded stats."""
+        with cls._lock:
+            cls._stats.clear()
+
+    @classmethod
+    def summary(cls: type[Metrics]) -> list[str]:
+        """Summarise recorded stats, one line per operation."""
+        return [f"{name}: {stats}" for name, stats in cls.stats().items()]
+
+    @classmethod
+    def dump(cls: type[Metrics], path: Path) -> None:
+        """Write recorded stats to a JSON file."""
+        with path.open(mode="w") as file:
+            json.dump({name: asdict(stats) for name, stats in cls.stats().items()}, file, indent=2)
+
+
+class JobMetrics:
+    """
+    Metrics for a run of a CLI command (job), written as an OpenMetrics textfile.
+
+    Textfiles are intended to be read by the Prometheus node_exporter textfile collector, with one file per job. Files
+    include:
+
+    - whether the job succeeded, how long it took and when it last succeeded
+    - the duration, count, rows and bytes of each operation timed during the job (see `Metrics`)
+    - rows exported per table (from `data.export.{table}` operations)
+    - bytes written by the job and the number and size of backup iterations, where set
+
+    When a job fails, the last success timestamp from the previous file (if any) is kept, so alerts can be based on
+    how long it has been since a job last succeeded. Jobs cancelled by the user (e.g. by declining a confirmation) are
+    not failures and leave any existing file unchanged. Files are replaced atomically so partial files are never read.
+
+    Samples are labelled with `ods_job`, rather than `job`, to avoid clashing with the `job` label Prometheus sets for
+    each scrape target.
+    """
+
+    prefix = "ods"
+
+    def __init__(self, job: str, path: Optional[Path] = None) -> None:
+        """Create instance, metrics are only written if a path is given."""
+        self.job = job
+        self.path = path
+
+        self.bytes_written: Optional[int] = None
+        self.backup_sets: dict[str, tuple[int, int]] = {}
+        self.cancelled = False
+
+    @staticmethod
+    def _labels(**labels: str) -> str:
+        """Format and escape metric labels."""
+        escaped = {
+            key: value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for key, value in labels.items()
+        }
+        return ",".join(f'{key}="{value}"' for key, value in escaped.items())
+
+    def _last_success(self) -> Optional[float]:
+        """Get last success timestamp from existing textfile, if any."""
+        if self.path is None or not self.path.exists():
+            return None
+
+        name = f"{self.prefix}_job_last_success_timestamp_seconds"
+        match = re.search(rf"^{name}{{[^}}]*}} (\S+)$", self.path.read_text(), flags=re.MULTILINE)
+        return float(match.group(1)) if match else None
+
+    def render(self, success: bool, duration: float) -> str:
+        """Format metrics as OpenMetrics text."""
+        job = self._labels(ods_job=self.job)
+        last_success = datetime.now(tz=timezone.utc).timestamp() if success else self._last_success()
+        stats = Metrics.stats()
+
+        families: list[tuple[str, str, list[tuple[str, float]]]] = [
+            ("job_success", "Whether the last run of the job succeeded.", [(job, int(success))]),
+            ("job_duration_seconds", "Duration of the last run of the job.", [(job, duration)]),
+        ]
+        if last_success is not None:
+            families.append(
+                ("job_last_success_timestamp_seconds", "When the job last succeeded.", [(job, last_success)])
+            )
+        if self.bytes_written is not None:
+            families.append(
+                ("job_written_bytes", "Bytes written by the last run of the job.", [(job, self.bytes_written)])
+            )
+
+        operations = {name: self._labels(ods_job=self.job, operation=name) for name in stats}
+        families.extend(
+            [
+                (
+                    "operation_duration_seconds",
+                    "Total duration of operations (stages) in the last run of the job.",
+                    [(operations[name], op.total) for name, op in stats.items()],
+                ),
+                (
+                    "operations",
+                    "Number of operations in the last run of the job.",
+                    [(operations[name], op.count) for name, op in stats.items()],
+                ),
+                (
+                    "operation_rows",
+                    "Rows processed by operations in the last run of the job.",
+                    [(operations[name], op.rows) for name, op in stats.items() if op.rows is not None],
+                ),
+                (
+                    "operation_bytes",
+                    "Bytes processed by operations in the last run of the job.",
+                    [(operations[name], op.bytes) for name, op in stats.items() if op.bytes is not None],
+                ),
+                (
+                    "export_rows",
+                    "Rows exported per table in the last run of the job.",
+                    [
+                        (self._labels(ods_job=self.job, table=name.removeprefix("data.export.")), op.rows)
+                        for name, op in stats.items()
+                        if name.startswith("data.export.") and op.rows is not None
+                    ],
+                ),
+                (
+                    "backup_iterations",
+                    "Number of iterations in each backup set.",
+                    [
+                        (self._labels(ods_job=self.job, set=name), count)
+                        for name, (count, _) in self.backup_sets.items()
+                    ],
+                ),
+                (
+                    "backup_size_bytes",
+                    "Total size of iterations in each backup set.",
+                    [(self._labels(ods_job=self.job, set=name), size) for name, (_, size) in self.backup_sets.items()],
+                ),
+            ]
+        )
+
+        lines = []
+        for name, help_text, samples in families:
+            if not samples:
+                continue
+            lines.append(f"# TYPE {self.prefix}_{name} gauge")
+            lines.append(f"# HELP {self.prefix}_{name} {help_text}")
+            lines.extend(f"{self.prefix}_{name}{{{labels}}} {value}" for labels, value in samples)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, success: bool, duration: float) -> None:
+        """
+        Write metrics to textfile, if set, replacing any existing file atomically.
+
+        Errors writing the file are logged rather than raised, so they do not hide the result of the job.
+        """
+        if self.path is None:
+            return
+
+        logger = logging.getLogger("app")
+        logger.info("Writing job metrics to: %s", self.path.resolve())
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        try:
+            tmp_path.write_text(self.render(success=success, duration=duration))
+            tmp_path.replace(self.path)
+        except OSError:
+            logger.error("Failed to write job metrics to: %s", self.path.resolve(), exc_info=True)
+
+    @classmethod
+    @contextmanager
+    def record(cls: type[JobMetrics], job: str, path: Optional[Path] = None) -> Iterator[JobMetrics]:
+        """
+        Time a job and write its metrics once it completes or fails.
+
+        Any error raised by the job is treated as a failure and re-raised once metrics are written, unless the job is
+        marked as cancelled. E.g.:
+
+        ```
+        with JobMetrics.record(job="backup", path=Path("/var/lib/node_exporter/ods_backup.prom")) as job:
+            ...
+            job.bytes_written = 123
+        ```
+        """
+        metrics = cls(job=job, path=path)
+        start = time.perf_counter()
+        success = False
+        try:
+            yield metrics
+            success = True
+        finally:
+            if not metrics.cancelled:
+                metrics.write(success=success, duration=time.perf_counter() - start)
@@ -1,3 +1,10 @@
+-- CONTROLLED DATASETS
+--
+-- Baseline definitions for controlled datasets. Statements are idempotent so this migration can be applied to
+-- instances created before migrations were introduced.
+
+CREATE SCHEMA IF NOT EXISTS controlled;
+
 SET search_path TO controlled, public;
 
 -- DEPOT
@@ -13,8 +20,8 @@ CREATE TABLE IF NOT EXISTS controlled.depot
   geom                       GEOMETRY(Point, 4326),
   lat_dd                     TEXT GENERATED ALWAYS AS (st_y(geom)::text) STORED,
   lon_dd                     TEXT GENERATED ALWAYS AS (st_x(geom)::text) STORED,
-  lat_ddm                    TEXT GENERATED ALWAYS AS ((geom_as_ddm(geom)).y) STORED,
-  lon_ddm                    TEXT GENERATED ALWAYS AS ((geom_as_ddm(geom)).x) STORED,
+  lat_ddm                    TEXT GENERATED ALWAYS AS (geom_as_ddm_y(geom)) STORED,
+  lon_ddm                    TEXT GENERATED ALWAYS AS (geom_as_ddm_x(geom)) STORED,
   name                       TEXT,
   status                     TEXT,
   restrictions               TEXT,
@@ -72,8 +79,8 @@ CREATE TABLE IF NOT EXISTS controlled.instrument
   geom                       GEOMETRY(Point, 4326),
   lat_dd                     TEXT                     GENERATED ALWAYS AS (st_y(geom)::text) STORED,
   lon_dd                     TEXT                     GENERATED ALWAYS AS (st_x(geom)::text) STORED,
-  lat_ddm                    TEXT                     GENERATED ALWAYS AS ((geom_as_ddm(geom)).y) STORED,
-  lon_ddm                    TEXT                     GENERATED ALWAYS AS ((geom_as_ddm(geom)).x) STORED,
+  lat_ddm                    TEXT                     GENERATED ALWAYS AS (geom_as_ddm_y(geom)) STORED,
+  lon_ddm                    TEXT                     GENERATED ALWAYS AS (geom_as_ddm_x(geom)) STORED,
   name                       TEXT,
   other_names                TEXT,
   status                     TEXT,
@@ -136,8 +143,8 @@ CREATE TABLE IF NOT EXISTS controlled.waypoint
   geom             GEOMETRY(Point, 4326),
   lat_dd           TEXT                     GENERATED ALWAYS AS (st_y(geom)::text) STORED,
   lon_dd           TEXT                     GENERATED ALWAYS AS (st_x(geom)::text) STORED,
-  lat_ddm          TEXT                     GENERATED ALWAYS AS ((geom_as_ddm(geom)).y) STORED,
-  lon_ddm          TEXT                     GENERATED ALWAYS AS ((geom_as_ddm(geom)).x) STORED
+  lat_ddm          TEXT                     GENERATED ALWAYS AS (geom_as_ddm_y(geom)) STORED,
+  lon_ddm          TEXT                     GENERATED ALWAYS AS (geom_as_ddm_x(geom)) STORED
 );
 
 CREATE INDEX IF NOT EXISTS waypoint_geom_idx
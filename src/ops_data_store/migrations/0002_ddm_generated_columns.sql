@@ -0,0 +1,35 @@
+-- DDM GENERATED COLUMNS
+--
+-- Recreates DDM generated columns that still derive values from the composite `geom_as_ddm` function to use the
+-- per-coordinate `geom_as_ddm_x` and `geom_as_ddm_y` functions instead.
+--
+-- Generated column expressions cannot be altered in place (before Postgres 17), so affected columns are dropped and
+-- re-added in a single statement per table (causing one rewrite of each table). Re-added columns are placed at the end
+-- of the table. Tables already using the per-coordinate functions are not changed.
+
+DO $$
+DECLARE
+    target RECORD;
+BEGIN
+    FOR target IN
+        SELECT DISTINCT c.relname AS table_name
+        FROM pg_attrdef d
+        JOIN pg_class c ON c.oid = d.adrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_attribute a ON a.attrelid = d.adrelid AND a.attnum = d.adnum
+        WHERE n.nspname = 'controlled'
+          AND a.attname IN ('lat_ddm', 'lon_ddm')
+          AND a.attgenerated = 's'
+          AND pg_get_expr(d.adbin, d.adrelid) LIKE '%geom_as_ddm(%'
+    LOOP
+        RAISE NOTICE 'Recreating DDM generated columns in controlled.%', target.table_name;
+        EXECUTE format(
+            'ALTER TABLE controlled.%I
+                DROP COLUMN lat_ddm,
+                DROP COLUMN lon_ddm,
+                ADD COLUMN lat_ddm TEXT GENERATED ALWAYS AS (geom_as_ddm_y(geom)) STORED,
+                ADD COLUMN lon_ddm TEXT GENERATED ALWAYS AS (geom_as_ddm_x(geom)) STORED',
+            target.table_name
+        );
+    END LOOP;
+END$$;
@@ -0,0 +1,35 @@
+-- WAYPOINT TRANSFORM INDEX
+--
+-- The `route_insert` trigger matches route vertices to waypoints within 1000 m using
+-- `ST_DWithin(ST_Transform(w.geom, 3857), ST_Transform(points.geom, 3857), 1000)`. As the waypoint side of this
+-- predicate is a transformed geometry, the `waypoint_geom_idx` index cannot be used and every insert scans and
+-- transforms all waypoints.
+--
+-- An expression index matching the transformed geometry lets `ST_DWithin` use an index scan for each vertex, without
+-- changing which waypoints are matched.
+--
+-- The `route_update` trigger matches vertices to waypoints by exact equality, which cannot use a GiST index. A
+-- bounding box (`&&`) check is added so candidate waypoints are found via `waypoint_geom_idx` first.
+
+CREATE INDEX IF NOT EXISTS waypoint_geom_3857_idx
+  ON controlled.waypoint USING gist (ST_Transform(geom, 3857));
+
+-- statistics for the indexed expression are only gathered by ANALYZE
+ANALYZE controlled.waypoint;
+
+CREATE OR REPLACE FUNCTION controlled.route_update() RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE controlled.route_container SET id = NEW.id
+        WHERE pid = OLD.pid;
+    DELETE FROM controlled.route_waypoint
+        WHERE route_pid = OLD.pid AND NEW.geom IS NOT NULL;
+    INSERT INTO controlled.route_waypoint (route_pid, waypoint_pid, sequence)
+        (
+            SELECT OLD.pid as route_pid, w.pid as waypoint_pid, points.path[1] AS sequence
+            FROM ST_dumppoints(NEW.geom) AS points
+            JOIN controlled.waypoint w ON w.geom && points.geom AND w.geom = points.geom
+            WHERE NEW.geom IS NOT NULL
+        );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,105 @@
+-- ROUTE GEOMETRY
+--
+-- The `controlled.route` view previously rebuilt the geometry of every route from its waypoints each time it was read.
+-- Route geometries are now stored in the `controlled.route_geom` table, which is kept up to date by triggers on the
+-- `route_waypoint` and `waypoint` tables. Only routes affected by a change are rebuilt.
+--
+-- Triggers are statement level, using transition tables, so a statement changing many rows (such as the `route_insert`
+-- trigger) rebuilds each affected route once.
+--
+-- The rebuild function is a security definer so users who can edit routes do not need write access to the
+-- `route_geom` table.
+
+CREATE TABLE IF NOT EXISTS controlled.route_geom
+(
+  route_pid UUID                     NOT NULL
+    CONSTRAINT route_geom_pk PRIMARY KEY
+    CONSTRAINT route_geom_route_pid_fk REFERENCES controlled.route_container(pid) ON DELETE CASCADE,
+  geom      GEOMETRY(LineString, 4326)
+);
+
+CREATE INDEX IF NOT EXISTS route_geom_geom_idx
+  ON controlled.route_geom USING gist (geom);
+
+CREATE OR REPLACE FUNCTION controlled.route_geom_refresh(route_pids UUID[]) RETURNS VOID
+    SECURITY DEFINER
+    SET search_path = public, pg_temp
+AS $$
+BEGIN
+    DELETE FROM controlled.route_geom WHERE route_pid = ANY(route_pids);
+    INSERT INTO controlled.route_geom (route_pid, geom)
+        SELECT rw.route_pid, st_makeline(w.geom ORDER BY rw.sequence)::geometry(LINESTRING, 4326)
+        FROM controlled.route_waypoint AS rw
+        JOIN controlled.waypoint w ON w.pid = rw.waypoint_pid
+        WHERE rw.route_pid = ANY(route_pids)
+        GROUP BY rw.route_pid;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION controlled.route_waypoint_route_geom() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM controlled.route_geom_refresh(ARRAY(SELECT DISTINCT route_pid FROM new_rows));
+    ELSIF TG_OP = 'UPDATE' THEN
+        PERFORM controlled.route_geom_refresh(ARRAY(
+            SELECT route_pid FROM old_rows UNION SELECT route_pid FROM new_rows
+        ));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM controlled.route_geom_refresh(ARRAY(SELECT DISTINCT route_pid FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER route_waypoint_route_geom_insert_trigger
+  AFTER INSERT
+  ON controlled.route_waypoint
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION controlled.route_waypoint_route_geom();
+
+CREATE OR REPLACE TRIGGER route_waypoint_route_geom_update_trigger
+  AFTER UPDATE
+  ON controlled.route_waypoint
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION controlled.route_waypoint_route_geom();
+
+CREATE OR REPLACE TRIGGER route_waypoint_route_geom_delete_trigger
+  AFTER DELETE
+  ON controlled.route_waypoint
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION controlled.route_waypoint_route_geom();
+
+-- waypoint inserts can't affect routes, deletes cascade to `route_waypoint` and are handled there
+CREATE OR REPLACE FUNCTION controlled.waypoint_route_geom() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM controlled.route_geom_refresh(ARRAY(
+        SELECT DISTINCT rw.route_pid
+        FROM new_rows AS n
+        JOIN old_rows AS o ON o.pid = n.pid
+        JOIN controlled.route_waypoint AS rw ON rw.waypoint_pid = n.pid
+        WHERE n.geom IS DISTINCT FROM o.geom
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- transition tables can't be used with column specific (`UPDATE OF geom`) triggers, changed geometries are filtered
+-- in the trigger function instead
+CREATE OR REPLACE TRIGGER waypoint_route_geom_update_trigger
+  AFTER UPDATE
+  ON controlled.waypoint
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION controlled.waypoint_route_geom();
+
+-- build geometries for existing routes
+SELECT controlled.route_geom_refresh(ARRAY(SELECT pid FROM controlled.route_container));
+
+-- as route geometries can't exist without a route container, a left join replaces the previous full outer join
+CREATE OR REPLACE VIEW controlled.route AS
+    SELECT rc.pid, rc.id, rg.geom
+    FROM controlled.route_container AS rc
+    LEFT JOIN controlled.route_geom rg ON rc.pid = rg.route_pid;
@@ -0,0 +1,13 @@
+-- ROUTE WAYPOINT INDEXES
+--
+-- Foreign keys in `controlled.route_waypoint` are not indexed by Postgres automatically. Without these indexes reading
+-- or rebuilding routes, updating or deleting routes (`WHERE route_pid = ...`) and cascading waypoint deletes all scan
+-- the whole table.
+--
+-- The route index includes the waypoint identifier so waypoints in a route can be read in sequence from the index alone.
+
+CREATE INDEX IF NOT EXISTS route_waypoint_route_pid_sequence_idx
+  ON controlled.route_waypoint (route_pid, sequence) INCLUDE (waypoint_pid);
+
+CREATE INDEX IF NOT EXISTS route_waypoint_waypoint_pid_idx
+  ON controlled.route_waypoint (waypoint_pid);
@@ -0,0 +1,58 @@
+-- GENERATE ULID
+--
+-- `generate_ulid` previously built each value by formatting the timestamp as hex text, padding it, hex encoding random
+-- bytes and concatenating these strings before casting to a UUID. The timestamp and random bytes are now joined as
+-- bytes, with a single hex encoding to cast to a UUID. Generated values use the same layout (a 48 bit millisecond
+-- timestamp followed by 80 random bits).
+--
+-- `generate_ulid_monotonic` is an alternative that, within a session, increments the random component of the previous
+-- value (rather than generating new random bits) when called again within the same millisecond. Values are therefore
+-- strictly ascending within a session (e.g. for bulk inserts), which avoids random insertions into unique indexes.
+
+CREATE OR REPLACE FUNCTION generate_ulid() RETURNS uuid
+    VOLATILE
+    PARALLEL SAFE
+AS $$
+    SELECT encode(
+        substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3) ||
+        gen_random_bytes(10),
+        'hex'
+    )::uuid;
+$$ LANGUAGE SQL;
+
+CREATE OR REPLACE FUNCTION generate_ulid_monotonic() RETURNS uuid
+    VOLATILE
+AS $$
+DECLARE
+    now_ms BIGINT := floor(extract(epoch FROM clock_timestamp()) * 1000);
+    last_ms BIGINT := COALESCE(NULLIF(current_setting('ods.ulid_last_ms', true), ''), '0')::BIGINT;
+    entropy BYTEA;
+    i INTEGER := 9;
+BEGIN
+    IF now_ms > last_ms THEN
+        entropy := gen_random_bytes(10);
+    ELSE
+        -- same millisecond (or the clock has gone backwards), increment previous random component
+        now_ms := last_ms;
+        entropy := decode(current_setting('ods.ulid_last_entropy'), 'hex');
+        LOOP
+            IF get_byte(entropy, i) < 255 THEN
+                entropy := set_byte(entropy, i, get_byte(entropy, i) + 1);
+                EXIT;
+            END IF;
+            entropy := set_byte(entropy, i, 0);
+            i := i - 1;
+            IF i < 0 THEN
+                -- random component exhausted, move to the next millisecond
+                now_ms := now_ms + 1;
+                entropy := gen_random_bytes(10);
+                EXIT;
+            END IF;
+        END LOOP;
+    END IF;
+
+    PERFORM set_config('ods.ulid_last_ms', now_ms::TEXT, false);
+    PERFORM set_config('ods.ulid_last_entropy', encode(entropy, 'hex'), false);
+    RETURN encode(substring(int8send(now_ms) FROM 3) || entropy, 'hex')::uuid;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,33 @@
+-- AIR UNIT NETWORK CHANGE NOTIFICATIONS
+--
+-- Changes to waypoints and routes send a notification on the `airnet_changed` channel, with the name of the changed
+-- table as the payload. The `data watch` CLI command listens on this channel to regenerate Air Unit Network outputs
+-- shortly after edits are made, rather than on a fixed schedule.
+--
+-- Triggers are statement level, so a statement changing many rows sends a single notification. Notifications are only
+-- delivered once the transaction commits, and identical notifications within a transaction are combined by Postgres.
+
+CREATE OR REPLACE FUNCTION controlled.airnet_notify() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('airnet_changed', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER waypoint_airnet_notify_trigger
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE
+  ON controlled.waypoint
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION controlled.airnet_notify();
+
+CREATE OR REPLACE TRIGGER route_container_airnet_notify_trigger
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE
+  ON controlled.route_container
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION controlled.airnet_notify();
+
+CREATE OR REPLACE TRIGGER route_waypoint_airnet_notify_trigger
+  AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE
+  ON controlled.route_waypoint
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION controlled.airnet_notify();
@@ -0,0 +1,21 @@
+-- ROUTE GEOMETRY PERMISSIONS
+--
+-- `controlled.route_geom_refresh` (added in `0004_route_geom`) is a security definer, but kept the default `EXECUTE`
+-- privilege for `PUBLIC`, allowing any role to call it to rewrite route geometries. This privilege is revoked.
+--
+-- So users who edit routes and waypoints can still trigger a refresh, the trigger functions that call it are now also
+-- security definers. Trigger functions can only be called by triggers, so this does not allow other uses. All three
+-- functions use a fixed search path, with the system catalog searched first.
+
+REVOKE EXECUTE ON FUNCTION controlled.route_geom_refresh(UUID[]) FROM PUBLIC;
+
+ALTER FUNCTION controlled.route_geom_refresh(UUID[])
+    SET search_path = pg_catalog, public, pg_temp;
+
+ALTER FUNCTION controlled.route_waypoint_route_geom()
+    SECURITY DEFINER
+    SET search_path = pg_catalog, public, pg_temp;
+
+ALTER FUNCTION controlled.waypoint_route_geom()
+    SECURITY DEFINER
+    SET search_path = pg_catalog, public, pg_temp;
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Callable, Optional
+
+from ops_data_store.auth import AzureClient, IncrementalSyncClient, LDAPClient, SimpleSyncClient
+from ops_data_store.backup import BackupClient
+from ops_data_store.config import Config
+from ops_data_store.data import DataClient
+
+
+@dataclass
+class Job:
+    """
+    Scheduled job.
+
+    Jobs are run every `interval` seconds, or only when triggered if `interval` is `0`.
+    """
+
+    name: str
+    interval: int
+    func: Callable[[], None]
+    next_run: float = 0
+    last_run: Optional[datetime] = None
+    last_status: Optional[str] = None
+    last_duration: Optional[float] = None
+
+    def __str__(self) -> str:
+        """Summary of job state."""
+        interval = f"every {self.interval}s" if self.interval > 0 else "on demand"
+        last_run = self.last_run.isoformat(timespec="seconds") if self.last_run is not None else "never"
+        status = f"{self.last_status} ({self.last_duration:.2f}s)" if self.last_status is not None else "-"
+        return f"{self.name}: {interval}, last run: {last_run}, last status: {status}"
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    """Handle a command sent to the control socket."""
+
+    def handle(self) -> None:
+        """Read command and write response."""
+        command = self.rfile.readline().decode().strip()
+        response = self.server.scheduler.handle_command(command=command)
+        self.wfile.write(f"{response}\n".encode())
+
+
+class JobScheduler:
+    """
+    Application job scheduler.
+
+    Runs backups, Air Unit Network conversions and (optionally) auth syncs on configured intervals within a single,
+    long-running, process (`ods-ctl serve`).
+
+    Clients are created when first needed and kept for later runs, so that start-up costs (imports, GDAL
+    initialisation, Azure access tokens, LDAP binds, etc.) are only paid once, rather than for each run.
+
+    Jobs run one at a time, in the order they become due, or are triggered via the control socket (if configured).
+    """
+
+    def __init__(self) -> None:
+        """Create instance."""
+        self.config = Config()
+
+        self.logger = logging.getLogger("app")
+        self.logger.info("Creating job scheduler.")
+
+        self._queue: Queue[Optional[tuple[str, Optional[Future]]]] = Queue()
+        self._queue_lock = threading.Lock()
+        self._stopped = False
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._socket_path: Optional[Path] = self.config.SERVE_SOCKET_PATH
+
+        self._backup_client: Optional[BackupClient] = None
+        self._data_client: Optional[DataClient] = None
+        self._azure_client: Optional[AzureClient] = None
+        self._ldap_client: Optional[LDAPClient] = None
+
+        jobs = [
+            Job(name="backup", interval=self.config.SERVE_BACKUP_INTERVAL, func=self._backup),
+            Job(name="convert", interval=self.config.SERVE_CONVERT_INTERVAL, func=self._convert),
+        ]
+        if self.config.SERVE_SYNC_AZURE_GROUPS and self.config.SERVE_SYNC_LDAP_GROUP:
+            jobs.append(Job(name="sync", interval=self.config.SERVE_SYNC_INTERVAL, func=self._sync))
+        self.jobs: dict[str, Job] = {job.name: job for job in jobs}
+
+        for job in self.jobs.values():
+            self.logger.info(str(job))
+
+    def _backup(self) -> None:
+        """Create backups using a long-lived backup client."""
+        if self._backup_client is None:
+            self._backup_client = BackupClient()
+        self._backup_client.backup()
+
+    def _convert(self) -> None:
+        """Convert Air Unit datasets using a long-lived data client."""
+        if self._data_client is None:
+            self._data_client = DataClient()
+        self._data_client.convert()
+
+    def _sync(self) -> None:
+        """
+        Sync Azure groups to LDAP using long-lived Azure and LDAP clients.
+
+        A new sync client is needed for each run as it holds state for a single sync.
+
+        If `AUTH_SYNC_STATE_PATH` is set, syncs are incremental.
+        """
+        if self._azure_client is None:
+            self._azure_client = AzureClient()
+        if self._ldap_client is None:
+            self._ldap_client = LDAPClient()
+
+        if self.config.AUTH_SYNC_STATE_PATH is not None:
+            client = IncrementalSyncClient(
+                azure_group_ids=self.config.SERVE_SYNC_AZURE_GROUPS,
+                ldap_group_id=self.config.SERVE_SYNC_LDAP_GROUP,
+                state_path=self.config.AUTH_SYNC_STATE_PATH,
+                reconcile_interval=self.config.AUTH_SYNC_RECONCILE_INTERVAL,
+                azure_client=self._azure_client,
+                ldap_client=self._ldap_client,
+            )
+        else:
+            client = SimpleSyncClient(
+                azure_group_ids=self.config.SERVE_SYNC_AZURE_GROUPS,
+                ldap_group_id=self.config.SERVE_SYNC_LDAP_GROUP,
+                azure_client=self._azure_client,
+                ldap_client=self._ldap_client,
+            )
+        client.sync()
+
+    def _queue_due_jobs(self) -> None:
+        """Queue scheduled jobs that are due to run."""
+        now = time.monotonic()
+        for job in self.jobs.values():
+            if job.interval > 0 and job.next_run <= now:
+                self._queue.put((job.name, None))
+                job.next_run = now + job.interval
+
+    def _seconds_until_due(self) -> Optional[float]:
+        """Time until next scheduled job is due, or None if no jobs are scheduled."""
+        next_runs = [job.next_run for job in self.jobs.values() if job.interval > 0]
+        if not next_runs:
+            return None
+        return max(min(next_runs) - time.monotonic(), 0)
+
+    def _start_control_server(self) -> None:
+        """
+        Listen for commands on control socket.
+
+        Any existing (stale) socket is removed. Access is limited to the application user via file permissions. These
+        are set by a restrictive umask while the socket is created, as setting them after would leave a window where
+        other users could connect.
+        """
+        if self._socket_path is None:
+            self.logger.info("Control socket not configured, skipping.")
+            return
+
+        self.logger.info("Listening for commands on control socket: %s", self._socket_path.resolve())
+        self._socket_path.unlink(missing_ok=True)
+        umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(str(self._socket_path), _ControlHandler)
+        finally:
+            os.umask(umask)
+        self._server.daemon_threads = True
+        self._server.scheduler = self
+
+        thread = threading.Thread(target=self._server.serve_forever, name="control-socket", daemon=True)
+        thread.start()
+
+    def _stop_control_server(self) -> None:
+        """Stop listening for commands and remove control socket."""
+        if self._server is None:
+            return
+
+        self.logger.info("Closing control socket.")
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._socket_path.unlink(missing_ok=True)
+
+    def _fail_pending(self) -> None:
+        """
+        Stop accepting triggered jobs and fail any not yet run.
+
+        So that callers waiting on a triggered job (such as control socket clients) are not left blocked once the
+        scheduler stops.
+        """
+        with self._queue_lock:
+            self._stopped = True
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                break
+            if item is None or item[1] is None:
+                continue
+
+            name, future = item
+            msg = f"Scheduler stopped before job '{name}' ran."
+            future.set_exception(RuntimeError(msg))
+
+    def run_job(self, name: str) -> bool:
+        """
+        Run job and record outcome.
+
+        Errors are logged rather than raised, so a failing job does not stop the scheduler.
+
+        Returns True if the job completed successfully.
+        """
+        job = self.jobs[name]
+        self.logger.info("Running job '%s'.", name)
+
+        job.last_run = datetime.now(tz=timezone.utc)
+        start = time.monotonic()
+        try:
+            job.func()
+            job.last_status = "ok"
+        except Exception as e:
+            self.logger.error(e, exc_info=True)
+            job.last_status = "failed"
+        job.last_duration = time.monotonic() - start
+
+        self.logger.info("Job '%s' %s after %.2f seconds.", name, job.last_status, job.last_duration)
+        return job.last_status == "ok"
+
+    def trigger(self, name: str) -> Future:
+        """
+        Queue job to run as soon as any current job finishes.
+
+        Returns a future which resolves to whether the job completed successfully, or raises a RuntimeError if the
+        scheduler stops before the job runs.
+        """
+        if name not in self.jobs:
+            msg = f"Unknown job '{name}'."
+            raise ValueError(msg)
+
+        future = Future()
+        with self._queue_lock:
+            if self._stopped:
+                msg = "Scheduler is stopping."
+                raise RuntimeError(msg)
+            self._queue.put((name, future))
+        return future
+
+    def handle_command(self, command: str) -> str:
+        """
+        Process command from control socket.
+
+        Supported commands:
+        - `status`: summarise state of each job
+        - `run {job}`: run a job and wait for it to finish
+        """
+        self.logger.info("Control command received: '%s'.", command)
+
+        if command == "status":
+            return "\n".join(str(job) for job in self.jobs.values())
+
+        action, _, name = command.partition(" ")
+        if action != "run":
+            return f"No. Unknown command '{command}'."
+
+        try:
+            future = self.trigger(name=name)
+            result = future.result()
+        except (ValueError, RuntimeError) as e:
+            return f"No. {e}"
+
+        if not result:
+            return f"No. Job '{name}' failed."
+        return f"Ok. Job '{name}' completed."
+
+    def run(self) -> None:
+        """
+        Run jobs until stopped.
+
+        Scheduled jobs first run after their interval has elapsed (i.e. not on start-up).
+
+        Once stopped, triggered jobs not yet run are failed, rather than left waiting.
+        """
+        self._start_control_server()
+
+        now = time.monotonic()
+        for job in self.jobs.values():
+            job.next_run = now + job.interval
+
+        try:
+            while True:
+                self._queue_due_jobs()
+                try:
+                    item = self._queue.get(timeout=self._seconds_until_due())
+                except Empty:
+                    continue
+
+                if item is None:
+                    self.logger.info("Stopping job scheduler.")
+                    break
+
+                name, future = item
+                result = False
+                try:
+                    result = self.run_job(name=name)
+                finally:
+                    if future is not None:
+                        future.set_result(result)
+        finally:
+            self._fail_pending()
+            self._stop_control_server()
+
+    def stop(self) -> None:
+        """
+        Stop scheduler once any current job finishes.
+
+        Safe to call from other threads or signal handlers.
+        """
+        self._queue.put(None)
+
+
+def send_command(path: Path, command: str, timeout: float = 10) -> str:
+    """
+    Send command to a running job scheduler via its control socket.
+
+    Waits up to `timeout` seconds to connect and for a response (e.g. for a triggered job to finish).
+
+    Returns the response from the scheduler, which is empty if the scheduler stopped without responding.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(f"{command}\n".encode())
+        with sock.makefile() as response:
+            return response.read().strip()
@@ -15,14 +15,27 @@ from pytest_mock import MockFixture
 from typer.testing import CliRunner
 
 from ops_data_store.airnet import AirUnitNetworkClient
-from ops_data_store.auth import AzureClient, SimpleSyncClient
+from ops_data_store.auth import (
+    AzureClient,
+    DeltaSyncGroupState,
+    DeltaSyncState,
+    IncrementalSyncClient,
+    LDAPConnection,
+    MultiSyncClient,
+    RoleSyncClient,
+    SimpleSyncClient,
+    SyncDiff,
+)
 from ops_data_store.backup import BackupClient, RollingFileState, RollingFileStateIteration, RollingFileStateMeta
 from ops_data_store.config import Config
 from ops_data_store.data import DataClient
+from ops_data_store.db import DBClient
+from ops_data_store.metrics import Metrics
+from ops_data_store.serve import JobScheduler
 from tests.mocks import (
     data_client_export_touch_path,
     db_client_dump_touch_path,
-    test_check_target_users__ldap_check_users,
+    test_resolve_users__ldap_check_users,
 )
 
 
@@ -101,6 +114,36 @@ def fx_test_auth_ldap_bind_password(fx_test_env: Env) -> str:
     return fx_test_env.str("APP_ODS_AUTH_LDAP_BIND_PASSWORD")
 
 
+@pytest.fixture()
+def fx_test_auth_ldap_modify_batch_size() -> int:
+    """LDAP modify batch size."""
+    return 10
+
+
+@pytest.fixture()
+def fx_test_auth_ldap_network_timeout() -> int:
+    """LDAP network timeout."""
+    return 10
+
+
+@pytest.fixture()
+def fx_test_auth_ldap_retry_max() -> int:
+    """LDAP reconnect attempts."""
+    return 3
+
+
+@pytest.fixture()
+def fx_test_auth_ldap_start_tls() -> bool:
+    """LDAP StartTLS."""
+    return False
+
+
+@pytest.fixture()
+def fx_test_auth_ldap_timeout() -> int:
+    """LDAP timeout."""
+    return 30
+
+
 @pytest.fixture()
 def fx_test_auth_ldap_ou_users(fx_test_env: Env) -> str:
     """LDAP users OU."""
@@ -179,6 +222,54 @@ def fx_test_data_airnet_waypoints_table() -> str:
     return "waypoint"
 
 
+@pytest.fixture()
+def fx_test_auth_sync_reconcile_interval() -> int:
+    """Seconds between full reconciliations for incremental auth syncs."""
+    return 86400
+
+
+@pytest.fixture()
+def fx_test_auth_sync_state_path(fx_test_env: Env) -> Path:
+    """Path for incremental auth sync state file."""
+    return fx_test_env.path("APP_ODS_AUTH_SYNC_STATE_PATH")
+
+
+@pytest.fixture()
+def fx_test_serve_backup_interval() -> int:
+    """Seconds between scheduled backups."""
+    return 86400
+
+
+@pytest.fixture()
+def fx_test_serve_convert_interval() -> int:
+    """Seconds between scheduled conversions."""
+    return 300
+
+
+@pytest.fixture()
+def fx_test_serve_socket_path(fx_test_env: Env) -> Path:
+    """Path for daemon control socket."""
+    return fx_test_env.path("APP_ODS_SERVE_SOCKET_PATH")
+
+
+@pytest.fixture()
+def fx_test_serve_sync_azure_groups(fx_test_env: Env) -> list[str]:
+    """IDs of Azure groups for scheduled syncs."""
+    return fx_test_env.list("APP_ODS_SERVE_SYNC_AZURE_GROUPS")
+
+
+@pytest.fixture()
+def fx_test_serve_sync_interval() -> int:
+    """Seconds between scheduled syncs."""
+    return 3600
+
+
+@pytest.fixture()
+def fx_test_serve_sync_ldap_group(fx_test_env: Env) -> str:
+    """ID of LDAP group for scheduled syncs."""
+    return fx_test_env.str("APP_ODS_SERVE_SYNC_LDAP_GROUP")
+
+
 @pytest.fixture()
 def fx_test_config() -> Config:
     """Provide access to app configuration."""
@@ -198,6 +289,11 @@ def fx_test_config_dict(
     fx_test_auth_ldap_base_dn: str,
     fx_test_auth_ldap_bind_dn: str,
     fx_test_auth_ldap_bind_password: str,
+    fx_test_auth_ldap_modify_batch_size: int,
+    fx_test_auth_ldap_network_timeout: int,
+    fx_test_auth_ldap_retry_max: int,
+    fx_test_auth_ldap_start_tls: bool,
+    fx_test_auth_ldap_timeout: int,
     fx_test_auth_ldap_ou_users: str,
     fx_test_auth_ldap_ou_groups: str,
     fx_test_auth_ldap_name_context_users: str,
@@ -211,6 +307,14 @@ def fx_test_config_dict(
     fx_test_data_airnet_routes_table: str,
     fx_test_data_airnet_route_waypoints_table: str,
     fx_test_data_airnet_waypoints_table: str,
+    fx_test_auth_sync_reconcile_interval: int,
+    fx_test_auth_sync_state_path: Path,
+    fx_test_serve_backup_interval: int,
+    fx_test_serve_convert_interval: int,
+    fx_test_serve_socket_path: Path,
+    fx_test_serve_sync_azure_groups: list[str],
+    fx_test_serve_sync_interval: int,
+    fx_test_serve_sync_ldap_group: str,
 ) -> dict:
     """Config as dict."""
     return {
@@ -218,15 +322,25 @@ def fx_test_config_dict(
         "AUTH_AZURE_CLIENT_ID": fx_test_auth_azure_client_id,
         "AUTH_AZURE_CLIENT_SECRET": fx_test_auth_azure_client_secret,
         "AUTH_AZURE_SCOPES": fx_test_auth_azure_scopes,
+        "AUTH_AZURE_TOKEN_CACHE_PATH": None,
+        "AUTH_DB_SYNC_IGNORED_USERS": (),
         "AUTH_LDAP_BASE_DN": fx_test_auth_ldap_base_dn,
         "AUTH_LDAP_BIND_DN": fx_test_auth_ldap_bind_dn,
         "AUTH_LDAP_BIND_PASSWORD": fx_test_auth_ldap_bind_password,
+        "AUTH_LDAP_MODIFY_BATCH_SIZE": fx_test_auth_ldap_modify_batch_size,
         "AUTH_LDAP_NAME_CONTEXT_GROUPS": fx_test_auth_ldap_name_context_groups,
         "AUTH_LDAP_NAME_CONTEXT_USERS": fx_test_auth_ldap_name_context_users,
+        "AUTH_LDAP_NETWORK_TIMEOUT": fx_test_auth_ldap_network_timeout,
         "AUTH_LDAP_OU_GROUPS": fx_test_auth_ldap_ou_groups,
         "AUTH_LDAP_OU_USERS": fx_test_auth_ldap_ou_users,
+        "AUTH_LDAP_RETRY_MAX": fx_test_auth_ldap_retry_max,
+        "AUTH_LDAP_START_TLS": fx_test_auth_ldap_start_tls,
+        "AUTH_LDAP_TIMEOUT": fx_test_auth_ldap_timeout,
+        "AUTH_LDAP_TLS_CA_CERT_PATH": None,
         "AUTH_LDAP_URL": fx_test_auth_ldap_url,
         "AUTH_MS_GRAPH_ENDPOINT": fx_test_auth_ms_graph_endpoint,
+        "AUTH_SYNC_RECONCILE_INTERVAL": fx_test_auth_sync_reconcile_interval,
+        "AUTH_SYNC_STATE_PATH": fx_test_auth_sync_state_path,
         "BACKUPS_COUNT": fx_test_backups_count,
         "BACKUPS_PATH": fx_test_backups_path,
         "DATA_AIRNET_OUTPUT_PATH": fx_test_data_airnet_output_path,
@@ -237,6 +351,12 @@ def fx_test_config_dict(
         "DATA_MANAGED_TABLE_NAMES": fx_test_data_managed_table_names,
         "DATA_QGIS_TABLE_NAMES": fx_test_data_qgis_table_names,
         "DB_DSN": fx_test_db_dsn,
+        "SERVE_BACKUP_INTERVAL": fx_test_serve_backup_interval,
+        "SERVE_CONVERT_INTERVAL": fx_test_serve_convert_interval,
+        "SERVE_SOCKET_PATH": fx_test_serve_socket_path,
+        "SERVE_SYNC_AZURE_GROUPS": fx_test_serve_sync_azure_groups,
+        "SERVE_SYNC_INTERVAL": fx_test_serve_sync_interval,
+        "SERVE_SYNC_LDAP_GROUP": fx_test_serve_sync_ldap_group,
         "VERSION": fx_test_package_version,
     }
 
@@ -266,9 +386,22 @@ def _fx_mock_azure_client_get_token(mocker: MockFixture) -> None:
 
 
 @pytest.fixture()
-def _fx_mock_ldap_object(mocker: MockFixture) -> None:
-    """Mock LDAP object to avoid binding."""
+def _fx_reset_metrics(mocker: MockFixture) -> None:
+    """Use empty process-wide metrics so each test only sees its own timings."""
+    mocker.patch.object(Metrics, "_stats", {})
+
+
+@pytest.fixture()
+def _fx_reset_ldap_connection(mocker: MockFixture) -> None:
+    """Reset process-wide LDAP connection so each test connects again."""
+    mocker.patch.object(LDAPConnection, "_connection", None)
+
+
+@pytest.fixture()
+def _fx_mock_ldap_object(mocker: MockFixture, _fx_reset_ldap_connection: None) -> None:
+    """Mock LDAP object to avoid binding or sending requests."""
     mocker.patch.object(ldap.ldapobject.LDAPObject, "simple_bind_s", autospec=True)
+    mocker.patch.object(ldap.ldapobject.LDAPObject, "search_ext", autospec=True, return_value=1)
 
 
 @pytest.fixture()
@@ -296,6 +429,19 @@ def fx_mock_ssc_eval_result() -> dict[str, list[str]]:
     }
 
 
+@pytest.fixture()
+def fx_mock_ssc_diff(fx_mock_ssc_eval_result: dict[str, list[str]]) -> SyncDiff:
+    """Mock result of Simple Sync Client evaluation as sync difference."""
+    return SyncDiff(
+        source=set(fx_mock_ssc_eval_result["source"]),
+        target=set(fx_mock_ssc_eval_result["target"]),
+        missing={"bob"},
+        unknown={"connie"},
+        remove={"darren"},
+        dns={"bob": "cn=bob,ou=users,dc=example,dc=com", "darren": "cn=darren,ou=users,dc=example,dc=com"},
+    )
+
+
 @pytest.fixture()
 def fx_mock_ssc(
     mocker: MockFixture, fx_mock_ssc_azure_group_ids: list[str], fx_mock_ssc_ldap_group_id: str
@@ -307,10 +453,73 @@ def fx_mock_ssc(
     return SimpleSyncClient(azure_group_ids=fx_mock_ssc_azure_group_ids, ldap_group_id=fx_mock_ssc_ldap_group_id)
 
 
+@pytest.fixture()
+def fx_mock_rsc(mocker: MockFixture, fx_mock_ssc_azure_group_ids: list[str]) -> RoleSyncClient:
+    """Mock Role Sync Client to avoid calling real Azure client and database."""
+    mocker.patch("ops_data_store.auth.AzureClient", autospec=True)
+    mocker.patch("ops_data_store.auth.DBClient", autospec=True)
+
+    return RoleSyncClient(azure_group_ids=fx_mock_ssc_azure_group_ids, db_role="ods_read")
+
+
+@pytest.fixture()
+def fx_mock_msc(mocker: MockFixture) -> MultiSyncClient:
+    """Mock Multi Sync Client to avoid calling real Azure and LDAP clients."""
+    mocker.patch("ops_data_store.auth.AzureClient", autospec=True)
+    mocker.patch("ops_data_store.auth.LDAPClient", autospec=True)
+
+    return MultiSyncClient(mapping={"abc": ["123", "456"], "def": ["456"]})
+
+
+@pytest.fixture()
+def fx_mock_msc_mapping_path(tmp_path: Path) -> Path:
+    """Mock mapping file for Multi Sync Client."""
+    path = tmp_path / "mapping.json"
+    path.write_text('{"abc": ["123"]}')
+    return path
+
+
+@pytest.fixture()
+def fx_mock_isc_state() -> DeltaSyncState:
+    """Mock previous state for Incremental Sync Client."""
+    return DeltaSyncState(
+        reconciled_at=datetime.now(tz=timezone.utc),
+        groups={
+            "123": DeltaSyncGroupState(
+                delta_link="https://graph.microsoft.com/v1.0/groups/delta?$deltatoken=x",
+                members={"1": "alice@example.com", "4": "darren@example.com"},
+            )
+        },
+    )
+
+
+@pytest.fixture()
+def fx_mock_isc(
+    mocker: MockFixture,
+    tmp_path: Path,
+    fx_mock_ssc_azure_group_ids: list[str],
+    fx_mock_ssc_ldap_group_id: str,
+    fx_mock_isc_state: DeltaSyncState,
+) -> IncrementalSyncClient:
+    """Mock Incremental Sync Client with previous state to avoid calling real Azure and LDAP clients."""
+    mocker.patch("ops_data_store.auth.AzureClient", autospec=True)
+    mocker.patch("ops_data_store.auth.LDAPClient", autospec=True)
+
+    state_path = tmp_path.joinpath("auth-sync.state.json")
+    fx_mock_isc_state.dump(path=state_path, target=fx_mock_ssc_ldap_group_id)
+
+    return IncrementalSyncClient(
+        azure_group_ids=fx_mock_ssc_azure_group_ids,
+        ldap_group_id=fx_mock_ssc_ldap_group_id,
+        state_path=state_path,
+        reconcile_interval=86400,
+    )
+
+
 @pytest.fixture()
 def fx_se_mock_ldap_check_users() -> Callable:
-    """Side effect for `LDAPClient.check_users()` used in the `TestAuth.test_check_target_users`."""
-    return test_check_target_users__ldap_check_users
+    """Side effect for `LDAPClient.check_users()` used in the `TestSimpleSyncClient.test_resolve_users`."""
+    return test_resolve_users__ldap_check_users
 
 
 @pytest.fixture()
@@ -319,6 +528,24 @@ def fx_data_client() -> DataClient:
     return DataClient()
 
 
+@pytest.fixture()
+def fx_db_client_live(fx_test_env: Env) -> DBClient:
+    """
+    App DB client connected to the test database, with required objects and migrations set up.
+
+    Skipped where the test database is not available, other than in Continuous Integration where it must be.
+    """
+    client = DBClient()
+    try:
+        client.check()
+    except RuntimeError:
+        if fx_test_env.bool("CI", False):
+            raise
+        pytest.skip("Test database not available.")
+    client.setup()
+    return client
+
+
 @pytest.fixture()
 def fx_rfs_schema_version() -> str:
     """Rolling file set schema version."""  # noqa: D401
@@ -430,6 +657,22 @@ def fx_backup_client(mocker: MockFixture) -> BackupClient:
     return BackupClient()
 
 
+@pytest.fixture()
+def fx_job_scheduler(mocker: MockFixture, tmp_path: Path) -> JobScheduler:
+    """App job scheduler with mocked clients and control socket in a temporary directory."""
+    mocker.patch("ops_data_store.serve.BackupClient", autospec=True)
+    mocker.patch("ops_data_store.serve.DataClient", autospec=True)
+    mocker.patch("ops_data_store.serve.AzureClient", autospec=True)
+    mocker.patch("ops_data_store.serve.LDAPClient", autospec=True)
+    mocker.patch("ops_data_store.serve.SimpleSyncClient", autospec=True)
+    mocker.patch("ops_data_store.serve.IncrementalSyncClient", autospec=True)
+
+    scheduler = JobScheduler()
+    scheduler._socket_path = tmp_path.joinpath("ods-ctl.sock")
+
+    return scheduler
+
+
 @pytest.fixture()
 def fx_at_wp_start() -> Waypoint:
     """Start/origin waypoint in a travel network."""
@@ -478,6 +721,7 @@ def fx_airnet_client(
     Pre-populated with test waypoint and route.
     """
     mocker.patch("ops_data_store.airnet.DBClient", autospec=True)
+    mocker.patch("ops_data_store.airnet.AsyncDBClient", autospec=True)
 
     client = AirUnitNetworkClient()
     client.network.waypoints.append(fx_at_wp_start)
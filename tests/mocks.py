@@ -1,18 +1,15 @@
 from pathlib import Path
+from typing import Callable
 
 
-def test_check_target_users__ldap_check_users(user_ids: list[str]) -> list[str]:
+def test_resolve_users__ldap_check_users(user_ids: list[str]) -> list[str]:
     """
-    Return pre-defined results if the correct search terms are given.
+    Return pre-defined results for any known users in the search terms given.
 
-    Mocked `LDAPClient.get_users` call for testing the `SimpleSyncClient._check_target_users()` method.
+    Mocked `LDAPClient.check_users` call for testing the `SimpleSyncClient._resolve_users()` method.
     """
-    if "cn=bob" in user_ids:
-        return ["cn=bob,ou=users,dc=example,dc=com"]
-    if "cn=darren" in user_ids:
-        return ["cn=darren,ou=users,dc=example,dc=com"]
-
-    return []
+    known_user_ids = ["cn=bob", "cn=darren"]
+    return [f"{user_id},ou=users,dc=example,dc=com" for user_id in known_user_ids if user_id in user_ids]
 
 
 def data_client_export_touch_path(path: Path) -> None:
@@ -35,3 +32,13 @@ def db_client_dump_touch_path(path: Path) -> None:
     Requires exist_ok=False to ensure pre-existing files are first removed.
     """
     path.touch(exist_ok=False)
+
+
+def listen_two_changes(on_change: Callable[[], None], debounce: float) -> None:
+    """
+    Simulate two sets of changes to waypoints or routes, then stopping.
+
+    Mocked `AirUnitNetworkClient.listen` method.
+    """
+    on_change()
+    on_change()
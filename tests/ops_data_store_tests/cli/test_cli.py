@@ -1,8 +1,15 @@
+import json
+import subprocess
+import sys
 from importlib.metadata import version
+from pathlib import Path
 
+import pytest
+from pytest_mock import MockFixture
 from typer.testing import CliRunner
 
 from ops_data_store.cli import app as cli
+from ops_data_store.metrics import Metrics
 
 
 class TestCli:
@@ -29,3 +36,53 @@ class TestCli:
 
         assert result.exit_code == 0
         assert result.output == f"{version('ops-data-store')}\n"
+
+    @pytest.mark.usefixtures("_fx_reset_metrics")
+    def test_metrics(self, mocker: MockFixture, fx_cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Timed operations are summarised after a command and can be written to a file."""
+        path = tmp_path / "metrics.json"
+
+        def _check() -> None:
+            with Metrics.timed("db.check"):
+                pass
+
+        mock_client = mocker.patch("ops_data_store.cli.db.DBClient", autospec=True)
+        mock_client.return_value.check.side_effect = _check
+
+        result = fx_cli_runner.invoke(app=cli, args=["--metrics-path", str(path), "db", "check"])
+
+        assert result.exit_code == 0
+        assert "=== Timings ===" in result.output
+        assert " * db.check: 1 call(s)" in result.output
+        assert "db.check" in json.loads(path.read_text())
+
+
+class TestCliImports:
+    """Tests for lazily loading CLI sub-apps."""
+
+    @staticmethod
+    def _imported_modules(code: str) -> set[str]:
+        """Top level modules imported when running code, as reported by `python -X importtime`."""
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+        )
+        return {
+            line.split("|")[-1].strip().split(".")[0]
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and "|" in line
+        }
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import ops_data_store.cli",
+            "from ops_data_store.cli import app; app(['--version'])",
+            "from ops_data_store.cli import app; app(['config', 'check'])",
+        ],
+    )
+    def test_no_heavy_imports(self, code: str) -> None:
+        """Commands only import dependencies they need."""
+        heavy = {"osgeo", "bas_air_unit_network_dataset", "msal", "ldap", "requests"}
+        code = f"try:\n    {code}\nexcept SystemExit:\n    pass"
+
+        assert self._imported_modules(code).isdisjoint(heavy)
@@ -1,3 +1,4 @@
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -77,6 +78,124 @@ class TestCliAuthSync:
         assert result.exit_code == 0
         assert "Ok. Sync completed." in result.output
 
+    def test_sync_metrics_textfile(
+        self,
+        mocker: MockFixture,
+        fx_cli_runner: CliRunner,
+        fx_mock_ssc_azure_group_ids: str,
+        fx_mock_ssc_ldap_group_id: str,
+        tmp_path: Path,
+    ):
+        """Sync can run without confirmation and write job metrics to a textfile."""
+        mocker.patch("ops_data_store.cli.auth.SimpleSyncClient", autospec=True)
+        path = tmp_path / "sync.prom"
+
+        result = fx_cli_runner.invoke(
+            app=cli,
+            args=[
+                "auth",
+                "sync",
+                "-ag",
+                fx_mock_ssc_azure_group_ids[0],
+                "-lg",
+                fx_mock_ssc_ldap_group_id,
+                "--yes",
+                "--metrics-textfile",
+                path,
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Continue with these additions and removals" not in result.output
+        assert 'ods_job_success{ods_job="sync"} 1' in path.read_text()
+
+    def test_sync_cancelled_metrics_textfile(
+        self,
+        mocker: MockFixture,
+        fx_cli_runner: CliRunner,
+        fx_mock_ssc_azure_group_ids: str,
+        fx_mock_ssc_ldap_group_id: str,
+        tmp_path: Path,
+    ):
+        """Job metrics are not written if sync is cancelled by user."""
+        mocker.patch("ops_data_store.cli.auth.SimpleSyncClient", autospec=True)
+        path = tmp_path / "sync.prom"
+
+        result = fx_cli_runner.invoke(
+            app=cli,
+            args=[
+                "auth",
+                "sync",
+                "-ag",
+                fx_mock_ssc_azure_group_ids[0],
+                "-lg",
+                fx_mock_ssc_ldap_group_id,
+                "--metrics-textfile",
+                path,
+            ],
+            input="n",
+        )
+
+        assert result.exit_code == 1
+        assert "Ok. Sync aborted." in result.output
+        assert path.exists() is False
+
+    def test_sync_incremental(
+        self,
+        mocker: MockFixture,
+        fx_cli_runner: CliRunner,
+        fx_mock_ssc_azure_group_ids: str,
+        fx_mock_ssc_ldap_group_id: str,
+    ):
+        """Incremental sync succeeds."""
+        mock_client = mocker.patch("ops_data_store.cli.auth.IncrementalSyncClient", autospec=True)
+
+        result = fx_cli_runner.invoke(
+            app=cli,
+            args=[
+                "auth",
+                "sync",
+                "-ag",
+                fx_mock_ssc_azure_group_ids[0],
+                "-lg",
+                fx_mock_ssc_ldap_group_id,
+                "--incremental",
+            ],
+            input="y",
+        )
+
+        assert result.exit_code == 0
+        assert "Ok. Sync completed." in result.output
+        mock_client.return_value.sync.assert_called_once()
+
+    def test_sync_incremental_not_configured(
+        self,
+        mocker: MockFixture,
+        fx_cli_runner: CliRunner,
+        fx_mock_ssc_azure_group_ids: str,
+        fx_mock_ssc_ldap_group_id: str,
+    ):
+        """Incremental sync aborts if sync state path is not configured."""
+        mocker.patch(
+            "ops_data_store.cli.auth.Config.AUTH_SYNC_STATE_PATH", new_callable=mocker.PropertyMock, return_value=None
+        )
+
+        result = fx_cli_runner.invoke(
+            app=cli,
+            args=[
+                "auth",
+                "sync",
+                "-ag",
+                fx_mock_ssc_azure_group_ids[0],
+                "-lg",
+                fx_mock_ssc_ldap_group_id,
+                "--incremental",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "No. Incremental sync not configured" in result.output
+
     def test_sync_fails(
         self,
         mocker: MockFixture,
@@ -98,3 +217,135 @@ class TestCliAuthSync:
 
         assert result.exit_code == 1
         assert "No. Sync Error. Sync aborted" in result.output
+
+
+class TestCliAuthSyncRole:
+    """Tests for `auth sync-role`."""
+
+    def test_ok(
+        self,
+        mocker: MockFixture,
+        fx_cli_runner: CliRunner,
+        fx_mock_ssc_azure_group_ids: list[str],
+        fx_mock_ssc_eval_result: dict[str, list[str]],
+    ) -> None:
+        """Sync succeeds."""
+        mock_client = mocker.patch("ops_data_store.cli.auth.RoleSyncClient", autospec=True)
+        mock_client.return_value.evaluate.return_value = fx_mock_ssc_eval_result
+        mock_client.return_value.sync.return_value = fx_mock_ssc_eval_result
+
+        result = fx_cli_runner.invoke(
+            app=cli, args=["auth", "sync-role", "-ag", fx_mock_ssc_azure_group_ids[0], "-r", "ods_read"], input="y"
+        )
+
+        assert result.exit_code == 0
+        assert "Users not in target database" in result.output
+        assert "Ok. Sync completed." in result.output
+        mock_client.return_value.sync.assert_called_once()
+
+    def test_cancelled(
+        self, mocker: MockFixture, fx_cli_runner: CliRunner, fx_mock_ssc_azure_group_ids: list[str]
+    ) -> None:
+        """Sync aborts if cancelled by user."""
+        mock_client = mocker.patch("ops_data_store.cli.auth.RoleSyncClient", autospec=True)
+
+        result = fx_cli_runner.invoke(
+            app=cli, args=["auth", "sync-role", "-ag", fx_mock_ssc_azure_group_ids[0], "-r", "ods_read"], input="n"
+        )
+
+        assert result.exit_code == 1
+        assert "Ok. Sync aborted." in result.output
+        mock_client.return_value.sync.assert_not_called()
+
+    def test_fails(self, mocker: MockFixture, fx_cli_runner: CliRunner, fx_mock_ssc_azure_group_ids: list[str]) -> None:
+        """Sync fails when error occurs."""
+        mock_client = mocker.patch("ops_data_store.cli.auth.RoleSyncClient", autospec=True)
+        mock_client.return_value.sync.side_effect = RuntimeError("Sync Error.")
+
+        result = fx_cli_runner.invoke(
+            app=cli, args=["auth", "sync-role", "-ag", fx_mock_ssc_azure_group_ids[0], "-r", "ods_read"], input="y"
+        )
+
+        assert result.exit_code == 1
+        assert "No. Sync Error. Sync aborted" in result.output
+
+
+class TestCliAuthSyncAll:
+    """Tests for `auth sync-all`."""
+
+    def test_ok(
+        self,
+        mocker: MockFixture,
+        fx_cli_runner: CliRunner,
+        fx_mock_ssc_eval_result: dict[str, list[str]],
+        fx_mock_msc_mapping_path: Path,
+    ) -> None:
+        """Sync succeeds after a single confirmation."""
+        mock_client = mocker.patch("ops_data_store.cli.auth.MultiSyncClient", autospec=True)
+        mock_client.return_value.evaluate.return_value = {"x": fx_mock_ssc_eval_result, "z": fx_mock_ssc_eval_result}
+        mock_client.return_value.sync.return_value = {"x": fx_mock_ssc_eval_result, "z": fx_mock_ssc_eval_result}
+
+        result = fx_cli_runner.invoke(
+            app=cli, args=["auth", "sync-all", "-m", str(fx_mock_msc_mapping_path)], input="y"
+        )
+
+        assert result.exit_code == 0
+        assert "=== Target LDAP group: z ===" in result.output
+        assert result.output.count("Continue with these additions and removals") == 1
+        assert "Ok. Sync completed." in result.output
+        mock_client.return_value.sync.assert_called_once()
+
+    def test_yes(self, mocker: MockFixture, fx_cli_runner: CliRunner, fx_mock_msc_mapping_path: Path) -> None:
+        """Sync succeeds without confirmation if requested."""
+        mock_client = mocker.patch("ops_data_store.cli.auth.MultiSyncClient", autospec=True)
+
+        result = fx_cli_runner.invoke(app=cli, args=["auth", "sync-all", "-m", str(fx_mock_msc_mapping_path), "--yes"])
+
+        assert result.exit_code == 0
+        assert "Continue with these additions and removals" not in result.output
+        assert "Ok. Sync completed." in result.output
+        mock_client.return_value.sync.assert_called_once()
+
+    def test_metrics_textfile(
+        self, mocker: MockFixture, fx_cli_runner: CliRunner, fx_mock_msc_mapping_path: Path, tmp_path: Path
+    ) -> None:
+        """Sync can write job metrics to a textfile."""
+        mocker.patch("ops_data_store.cli.auth.MultiSyncClient", autospec=True)
+        path = tmp_path / "sync-all.prom"
+
+        result = fx_cli_runner.invoke(
+            app=cli,
+            args=["auth", "sync-all", "-m", str(fx_mock_msc_mapping_path), "--yes", "--metrics-textfile", path],
+        )
+
+        assert result.exit_code == 0
+        assert 'ods_job_success{ods_job="sync-all"} 1' in path.read_text()
+
+    def test_cancelled(self, mocker: MockFixture, fx_cli_runner: CliRunner, fx_mock_msc_mapping_path: Path) -> None:
+        """Sync aborts if cancelled by user."""
+        mock_client = mocker.patch("ops_data_store.cli.auth.MultiSyncClient", autospec=True)
+
+        result = fx_cli_runner.invoke(
+            app=cli, args=["auth", "sync-all", "-m", str(fx_mock_msc_mapping_path)], input="n"
+        )
+
+        assert result.exit_code == 1
+        assert "Ok. Sync aborted." in result.output
+        mock_client.return_value.sync.assert_not_called()
+
+    def test_missing_mapping(self, fx_cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Sync aborts if mapping file does not exist."""
+        result = fx_cli_runner.invoke(app=cli, args=["auth", "sync-all", "-m", str(tmp_path / "x.json")])
+
+        assert result.exit_code == 1
+        assert "does not exist." in result.output
+
+    def test_fails(self, mocker: MockFixture, fx_cli_runner: CliRunner, fx_mock_msc_mapping_path: Path) -> None:
+        """Sync fails when error occurs."""
+        mock_client = mocker.patch("ops_data_store.cli.auth.MultiSyncClient", autospec=True)
+        mock_client.return_value.sync.side_effect = RuntimeError("Sync Error.")
+
+        result = fx_cli_runner.invoke(app=cli, args=["auth", "sync-all", "-m", str(fx_mock_msc_mapping_path), "--yes"])
+
+        assert result.exit_code == 1
+        assert "No. Sync Error. Sync aborted" in result.output
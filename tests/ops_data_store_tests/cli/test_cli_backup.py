@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 from pytest_mock import MockerFixture
 from typer.testing import CliRunner
@@ -16,3 +18,15 @@ class TestCliBackupNow:
 
         assert result.exit_code == 0
         assert "Ok. Complete." in result.output
+
+    def test_metrics_textfile(self, mocker: MockerFixture, fx_cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Can write job metrics to a textfile."""
+        mocker.patch("ops_data_store.cli.backup.BackupClient.backup", return_value=None)
+        path = tmp_path / "backup.prom"
+
+        result = fx_cli_runner.invoke(app=cli, args=["backup", "now", "--metrics-textfile", path])
+
+        assert result.exit_code == 0
+        text = path.read_text()
+        assert 'ods_job_success{ods_job="backup"} 1' in text
+        assert 'ods_backup_iterations{ods_job="backup",set="db"} ' in text
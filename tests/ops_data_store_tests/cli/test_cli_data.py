@@ -2,10 +2,12 @@ from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 import pytest
+from psycopg import OperationalError
 from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
 from ops_data_store.cli import app as cli
+from tests.mocks import listen_two_changes
 
 
 class TestCliDataBackup:
@@ -37,6 +39,19 @@ class TestCliDataBackup:
             assert result.exit_code == 1
             assert "No. Error saving managed datasets." in result.output
 
+    def test_metrics_textfile(self, mocker: MockerFixture, fx_cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Can write job metrics to a textfile, including when export fails."""
+        mocker.patch("ops_data_store.cli.data.DataClient.export", side_effect=RuntimeError("Error"))
+        path = tmp_path / "data-backup.prom"
+
+        result = fx_cli_runner.invoke(
+            app=cli,
+            args=["data", "backup", "--output-path", tmp_path / "x.gpkg", "--metrics-textfile", path],
+        )
+
+        assert result.exit_code == 1
+        assert 'ods_job_success{ods_job="data-backup"} 0' in path.read_text()
+
 
 class TestCliDataConvert:
     """Tests for `data convert`."""
@@ -51,3 +66,51 @@ class TestCliDataConvert:
 
         assert result.exit_code == 0
         assert "Ok. Complete." in result.output
+
+    def test_metrics_textfile(self, mocker: MockerFixture, fx_cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Can write job metrics to a textfile."""
+        mocker.patch("ops_data_store.cli.data.DataClient.convert", return_value=None)
+        path = tmp_path / "convert.prom"
+
+        result = fx_cli_runner.invoke(app=cli, args=["data", "convert", "--metrics-textfile", path])
+
+        assert result.exit_code == 0
+        text = path.read_text()
+        assert 'ods_job_success{ods_job="convert"} 1' in text
+        assert 'ods_job_written_bytes{ods_job="convert"} ' in text
+
+
+class TestCliDataWatch:
+    """Tests for `data watch`."""
+
+    def test_ok(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Converts datasets on start and when changed, until stopped."""
+        mock_convert = mocker.patch("ops_data_store.cli.data.DataClient.convert", return_value=None)
+        mocker.patch("ops_data_store.airnet.AirUnitNetworkClient.listen", side_effect=listen_two_changes)
+
+        result = fx_cli_runner.invoke(app=cli, args=["data", "watch"])
+
+        assert result.exit_code == 0
+        assert mock_convert.call_count == 3
+
+    def test_convert_error(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Conversion errors do not stop watching for changes."""
+        mocker.patch("ops_data_store.cli.data.DataClient.convert", side_effect=RuntimeError("Error"))
+        mock_listen = mocker.patch("ops_data_store.airnet.AirUnitNetworkClient.listen", side_effect=KeyboardInterrupt)
+
+        result = fx_cli_runner.invoke(app=cli, args=["data", "watch"])
+
+        assert result.exit_code == 0
+        assert "No. Error converting routes and waypoints" in result.output
+        assert "Ok. Stopped." in result.output
+        mock_listen.assert_called_once()
+
+    def test_connection_lost(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Aborts if database connection is lost."""
+        mocker.patch("ops_data_store.cli.data.DataClient.convert", return_value=None)
+        mocker.patch("ops_data_store.airnet.AirUnitNetworkClient.listen", side_effect=OperationalError())
+
+        result = fx_cli_runner.invoke(app=cli, args=["data", "watch"])
+
+        assert result.exit_code == 1
+        assert "No. Database connection lost." in result.output
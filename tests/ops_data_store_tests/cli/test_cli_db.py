@@ -2,12 +2,13 @@ from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 
 import pytest
-from psycopg import ProgrammingError
+from psycopg import OperationalError, ProgrammingError
 from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
 from ops_data_store.cli import app as cli
 from ops_data_store.config import Config
+from ops_data_store.db import Migration
 
 
 class TestCliDBCheck:
@@ -54,6 +55,74 @@ class TestCliDBSetup:
         assert "No. Database setup failed." in result.output
 
 
+class TestCliDBMigrate:
+    """Tests for `db migrate`."""
+
+    def test_ok(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Succeeds when migrations are applied."""
+        migration = Migration(version="0001", name="x", sql="SELECT 1;")
+        mocker.patch("ops_data_store.cli.db.DBClient.migrate", return_value=[migration])
+
+        result = fx_cli_runner.invoke(app=cli, args=["db", "migrate"])
+
+        assert result.exit_code == 0
+        assert "Applied migration '0001_x'." in result.output
+        assert "Ok. 1 migration(s) applied." in result.output
+
+    def test_ok_none_pending(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Succeeds when there are no pending migrations."""
+        mocker.patch("ops_data_store.cli.db.DBClient.migrate", return_value=[])
+
+        result = fx_cli_runner.invoke(app=cli, args=["db", "migrate"])
+
+        assert result.exit_code == 0
+        assert "Ok. No pending migrations." in result.output
+
+    def test_fail(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Fails when error occurs."""
+        mocker.patch("ops_data_store.cli.db.DBClient.migrate", side_effect=RuntimeError("Error"))
+
+        result = fx_cli_runner.invoke(app=cli, args=["db", "migrate"])
+
+        assert result.exit_code == 1
+        assert "No. Database migration failed, no migrations have been applied." in result.output
+
+
+class TestCliDBCheckIndexes:
+    """Tests for `db check-indexes`."""
+
+    def test_ok(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Succeeds when all foreign keys are indexed."""
+        mocker.patch("ops_data_store.cli.db.DBClient.check_fk_indexes", return_value=[])
+
+        result = fx_cli_runner.invoke(app=cli, args=["db", "check-indexes"])
+
+        assert result.exit_code == 0
+        assert "Ok. All foreign keys have supporting indexes." in result.output
+
+    def test_missing(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Aborts when foreign keys are not indexed."""
+        mocker.patch(
+            "ops_data_store.cli.db.DBClient.check_fk_indexes",
+            return_value=[("controlled.route_waypoint", "route_waypoint_waypoint_pid_fk", "waypoint_pid")],
+        )
+
+        result = fx_cli_runner.invoke(app=cli, args=["db", "check-indexes"])
+
+        assert result.exit_code == 1
+        assert "Foreign key 'route_waypoint_waypoint_pid_fk' on 'controlled.route_waypoint'" in result.output
+        assert "No. 1 foreign key(s) without supporting indexes." in result.output
+
+    def test_fail(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Aborts when DB is not reachable."""
+        mocker.patch("ops_data_store.cli.db.DBClient.check_fk_indexes", side_effect=OperationalError())
+
+        result = fx_cli_runner.invoke(app=cli, args=["db", "check-indexes"])
+
+        assert result.exit_code == 1
+        assert "No. Database connection failed." in result.output
+
+
 class TestCliDBRun:
     """Tests for `db run`."""
 
@@ -0,0 +1,120 @@
+import socket
+
+from pytest_mock import MockerFixture
+from typer.testing import CliRunner
+
+from ops_data_store.cli import app as cli
+
+
+class TestCliServe:
+    """Tests for `serve`."""
+
+    def test_ok(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Can run scheduler until stopped."""
+        mocker.patch("ops_data_store.cli.serve.signal.signal")
+        mock_scheduler = mocker.patch("ops_data_store.cli.serve.JobScheduler", autospec=True)
+        mock_scheduler.return_value.jobs = {}
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve"])
+
+        assert result.exit_code == 0
+        assert "Ok. Stopped." in result.output
+        mock_scheduler.return_value.run.assert_called_once()
+
+    def test_interrupted(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Scheduler stops cleanly when interrupted."""
+        mocker.patch("ops_data_store.cli.serve.signal.signal")
+        mock_scheduler = mocker.patch("ops_data_store.cli.serve.JobScheduler", autospec=True)
+        mock_scheduler.return_value.jobs = {}
+        mock_scheduler.return_value.run.side_effect = KeyboardInterrupt()
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve"])
+
+        assert result.exit_code == 0
+        assert "Ok. Stopped." in result.output
+
+    def test_invalid_config(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Scheduler not started if config invalid."""
+        mocker.patch("ops_data_store.cli.serve.Config.validate", side_effect=RuntimeError())
+        mock_scheduler = mocker.patch("ops_data_store.cli.serve.JobScheduler", autospec=True)
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve"])
+
+        assert result.exit_code == 1
+        assert "No. Application config is invalid." in result.output
+        mock_scheduler.assert_not_called()
+
+
+class TestCliServeRun:
+    """Tests for `serve run`."""
+
+    def test_ok(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Can trigger job in running scheduler."""
+        mocker.patch("ops_data_store.cli.serve.send_command", return_value="Ok. Job 'backup' completed.")
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve", "run", "backup"])
+
+        assert result.exit_code == 0
+        assert "Ok. Job 'backup' completed." in result.output
+
+    def test_failed(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Failed job aborts."""
+        mocker.patch("ops_data_store.cli.serve.send_command", return_value="No. Job 'backup' failed.")
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve", "run", "backup"])
+
+        assert result.exit_code == 1
+        assert "No. Job 'backup' failed." in result.output
+
+    def test_timeout(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Aborts if job does not finish within timeout."""
+        mock_send_command = mocker.patch("ops_data_store.cli.serve.send_command", side_effect=socket.timeout())
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve", "run", "backup", "--timeout", "5"])
+
+        assert result.exit_code == 1
+        assert "No. No response from `serve` within 5.0 seconds" in result.output
+        assert mock_send_command.call_args.kwargs["timeout"] == 5
+
+    def test_no_response(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Aborts if scheduler stops without responding."""
+        mocker.patch("ops_data_store.cli.serve.send_command", return_value="")
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve", "run", "backup"])
+
+        assert result.exit_code == 1
+        assert "No. No response from `serve`, it may have stopped." in result.output
+
+    def test_not_running(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Aborts if scheduler is not running."""
+        mocker.patch("ops_data_store.cli.serve.send_command", side_effect=FileNotFoundError())
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve", "run", "backup"])
+
+        assert result.exit_code == 1
+        assert "No. Cannot connect to control socket" in result.output
+
+    def test_not_configured(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Aborts if control socket is not configured."""
+        mocker.patch(
+            "ops_data_store.cli.serve.Config.SERVE_SOCKET_PATH", new_callable=mocker.PropertyMock, return_value=None
+        )
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve", "run", "backup"])
+
+        assert result.exit_code == 1
+        assert "No. Control socket not configured" in result.output
+
+
+class TestCliServeStatus:
+    """Tests for `serve status`."""
+
+    def test_ok(self, mocker: MockerFixture, fx_cli_runner: CliRunner) -> None:
+        """Can show status of jobs in running scheduler."""
+        expected = "backup: every 86400s, last run: never, last status: -"
+        mocker.patch("ops_data_store.cli.serve.send_command", return_value=expected)
+
+        result = fx_cli_runner.invoke(app=cli, args=["serve", "status"])
+
+        assert result.exit_code == 0
+        assert expected in result.output
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -8,6 +9,7 @@ from bas_air_unit_network_dataset.models.route import Route
 from bas_air_unit_network_dataset.models.routes import RouteCollection
 from bas_air_unit_network_dataset.models.waypoint import Waypoint
 from bas_air_unit_network_dataset.models.waypoints import WaypointCollection
+from psycopg import Notify
 from pytest_mock import MockFixture
 
 from ops_data_store.airnet import AirUnitNetworkClient
@@ -75,6 +77,98 @@ class TestAirnetClient:
         assert repr(fx_airnet_client.network.waypoints[fx_at_wp_start.fid]) == repr(fx_at_wp_start)
         assert repr(fx_airnet_client.network.routes[fx_at_rt.fid]) == repr(fx_at_rt)
 
+    def test_fetch_async_ok(
+        self, mocker: MockFixture, fx_airnet_client: AirUnitNetworkClient, fx_at_wp_start: Waypoint, fx_at_rt: Route
+    ) -> None:
+        """Fetch using concurrent queries succeeds."""
+        waypoints = [
+            (
+                UUID("018c36a6-ce23-95f4-e9e8-1d4fb9647e54"),
+                "ALPHA",
+                -75.01463335007429,
+                -69.91516669280827,
+                "Alpha",
+                "Foo",
+                datetime.date(2012, 4, 24),
+                "~conwat",
+                4,
+                12000,
+                "There's unlimited juice?",
+                "category1",
+            )
+        ]
+        routes = [(UUID("018c36a6-ce54-904f-52df-a5b8360e0f95"), "01_ALPHA_TO_BRAVO")]
+        route_waypoints = [
+            (UUID("018c36a6-ce54-904f-52df-a5b8360e0f95"), UUID("018c36a6-ce23-95f4-e9e8-1d4fb9647e54"), 1),
+        ]
+        mocker.patch.object(fx_airnet_client.async_db_client, "fetch", side_effect=[waypoints, route_waypoints, routes])
+
+        asyncio.run(fx_airnet_client.fetch_async())
+
+        assert fx_airnet_client.async_db_client.fetch.call_count == 3
+        assert len(fx_airnet_client.network.waypoints) == len(waypoints)
+        assert repr(fx_airnet_client.network.waypoints[fx_at_wp_start.fid]) == repr(fx_at_wp_start)
+        assert len(fx_airnet_client.network.routes) == len(routes)
+        assert fx_airnet_client.network.routes[fx_at_rt.fid].name == fx_at_rt.name
+
+    def test_fetch_repeated(self, mocker: MockFixture, fx_airnet_client: AirUnitNetworkClient) -> None:
+        """Repeated fetches replace, rather than add to, previously fetched data."""
+        waypoints = [
+            (
+                UUID("018c36a6-ce23-95f4-e9e8-1d4fb9647e54"),
+                "ALPHA",
+                -75.01463335007429,
+                -69.91516669280827,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+            )
+        ]
+        mocker.patch.object(fx_airnet_client.db_client, "fetch", side_effect=[waypoints, [], [], waypoints, [], []])
+
+        fx_airnet_client.fetch()
+        fx_airnet_client.fetch()
+
+        assert len(fx_airnet_client.network.waypoints) == len(waypoints)
+        assert len(fx_airnet_client.network.routes) == 0
+
+    def test_wait_for_changes(self, mocker: MockFixture, fx_airnet_client: AirUnitNetworkClient) -> None:
+        """Waits until no further changes are notified."""
+        conn = mocker.MagicMock()
+        conn.notifies.side_effect = [
+            [Notify(channel="airnet_changed", payload="waypoint", pid=1)],
+            [Notify(channel="airnet_changed", payload="route_waypoint", pid=1)],
+            [Notify(channel="airnet_changed", payload="waypoint", pid=1)],
+            [],
+        ]
+
+        result = fx_airnet_client._wait_for_changes(conn=conn, debounce=1)
+
+        assert result == {"waypoint", "route_waypoint"}
+        assert conn.notifies.call_count == 4
+        conn.notifies.assert_called_with(timeout=1, stop_after=1)
+
+    def test_listen(
+        self, mocker: MockFixture, caplog: pytest.LogCaptureFixture, fx_airnet_client: AirUnitNetworkClient
+    ) -> None:
+        """Calls callback once changes settle."""
+        mocker.patch.object(
+            fx_airnet_client, "_wait_for_changes", side_effect=[{"waypoint"}, {"route_container"}, KeyboardInterrupt]
+        )
+        on_change = mocker.Mock()
+
+        with pytest.raises(KeyboardInterrupt):
+            fx_airnet_client.listen(on_change=on_change, debounce=1)
+
+        fx_airnet_client.db_client.listen.assert_called_once_with(channel="airnet_changed")
+        assert on_change.call_count == 2
+        assert "Changes to: waypoint settled." in caplog.text
+
     def test_export_ok(
         self,
         fx_airnet_client: AirUnitNetworkClient,
@@ -1,12 +1,29 @@
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Callable
 from unittest.mock import Mock
 
 import ldap
 import pytest
 import requests_mock
+from ldap.controls import SimplePagedResultsControl
+from msal import SerializableTokenCache
 from pytest_mock import MockFixture
 
-from ops_data_store.auth import AzureClient, LDAPClient, SimpleSyncClient
+from ops_data_store.auth import (
+    AzureClient,
+    DeltaSyncGroupState,
+    DeltaSyncState,
+    GroupMembersDelta,
+    IncrementalSyncClient,
+    LDAPClient,
+    LDAPConnection,
+    MultiSyncClient,
+    RoleSyncClient,
+    SimpleSyncClient,
+    SyncDiff,
+)
 
 
 class TestAzureClient:
@@ -22,29 +39,34 @@ class TestAzureClient:
 
     def test_get_token_silent_ok(self, caplog: pytest.LogCaptureFixture, fx_mock_msal_cca: Mock) -> None:
         """Can acquire access token using valid cache."""
-        expected = "x"
-        fx_mock_msal_cca.return_value.acquire_token_silent.return_value = {"access_token": expected}
+        expected = "eyJ0eXAiOiJKV1QiLCJhbGciOiJSUzI1NiJ9"
+        fx_mock_msal_cca.return_value.acquire_token_silent.return_value = {"access_token": expected, "expires_in": 3599}
 
         client = AzureClient()
         token = client._get_token()
 
         assert "Attempting to acquire access token silently (from cache)." in caplog.text
-        assert f"Access token: {expected}" in caplog.text
+        assert "Access token acquired, expires in 3599 seconds." in caplog.text
+        assert expected not in caplog.text
 
         assert token == expected
 
     def test_get_token_fresh_ok(self, caplog: pytest.LogCaptureFixture, fx_mock_msal_cca: Mock) -> None:
         """Can acquire access token where cache empty."""
-        expected = "x"
+        expected = "eyJ0eXAiOiJKV1QiLCJhbGciOiJSUzI1NiJ9"
         fx_mock_msal_cca.return_value.acquire_token_silent.return_value = None
-        fx_mock_msal_cca.return_value.acquire_token_for_client.return_value = {"access_token": expected}
+        fx_mock_msal_cca.return_value.acquire_token_for_client.return_value = {
+            "access_token": expected,
+            "expires_in": 3599,
+        }
 
         client = AzureClient()
         token = client._get_token()
 
         assert "Attempting to acquire access token silently (from cache)." in caplog.text
         assert "Failed to acquire token silently, attempting to request fresh token." in caplog.text
-        assert f"Access token: {expected}" in caplog.text
+        assert "Access token acquired, expires in 3599 seconds." in caplog.text
+        assert expected not in caplog.text
 
         assert token == expected
 
@@ -63,6 +85,65 @@ class TestAzureClient:
 
         assert str(e.value) == "Failed to acquire Azure token."
 
+    def test_get_token_reused(self, fx_mock_msal_cca: Mock) -> None:
+        """Access token is reused until close to expiry."""
+        expected = "x"
+        fx_mock_msal_cca.return_value.acquire_token_silent.return_value = {"access_token": expected, "expires_in": 3600}
+
+        client = AzureClient()
+        client._get_token()
+        token = client._get_token()
+
+        assert token == expected
+        fx_mock_msal_cca.return_value.acquire_token_silent.assert_called_once()
+
+    def test_get_token_expiring(self, fx_mock_msal_cca: Mock) -> None:
+        """Access token close to expiry is not reused."""
+        fx_mock_msal_cca.return_value.acquire_token_silent.return_value = {"access_token": "x", "expires_in": 60}
+
+        client = AzureClient()
+        client._get_token()
+        client._get_token()
+
+        assert fx_mock_msal_cca.return_value.acquire_token_silent.call_count == 2
+
+    def test_token_cache_file(self, mocker: MockFixture, tmp_path: Path, fx_mock_msal_cca: Mock) -> None:
+        """Token cache is saved to file, only readable by current user, and loaded by later clients."""
+        path = tmp_path.joinpath("azure-token-cache.json")
+        mocker.patch(
+            "ops_data_store.auth.Config.AUTH_AZURE_TOKEN_CACHE_PATH",
+            new_callable=mocker.PropertyMock,
+            return_value=path,
+        )
+        spy_deserialize = mocker.spy(SerializableTokenCache, "deserialize")
+
+        client = AzureClient()
+        client._token_cache.has_state_changed = True
+        client._save_token_cache()
+
+        assert path.exists()
+        assert path.stat().st_mode & 0o777 == 0o600
+        spy_deserialize.assert_not_called()
+
+        AzureClient()
+
+        spy_deserialize.assert_called_once()
+
+    def test_token_cache_unchanged(self, mocker: MockFixture, tmp_path: Path, fx_mock_msal_cca: Mock) -> None:
+        """Token cache is not saved if unchanged."""
+        path = tmp_path.joinpath("azure-token-cache.json")
+        mocker.patch(
+            "ops_data_store.auth.Config.AUTH_AZURE_TOKEN_CACHE_PATH",
+            new_callable=mocker.PropertyMock,
+            return_value=path,
+        )
+        fx_mock_msal_cca.return_value.acquire_token_silent.return_value = {"access_token": "x"}
+
+        client = AzureClient()
+        client._get_token()
+
+        assert not path.exists()
+
     @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
     def test_get_token_mocked(self, fx_azure_client: AzureClient) -> None:
         """Can mock get token method."""
@@ -128,6 +209,260 @@ class TestAzureClient:
 
             assert members == expected
 
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_group_members_paged(self, fx_azure_client: AzureClient) -> None:
+        """Can get group members across multiple pages, skipping members without a UPN."""
+        group_id = "123"
+        url = f"https://graph.microsoft.com/v1.0/groups/{group_id}/members"
+        next_link = f"{url}?$select=userPrincipalName&$top=999&$skiptoken=x"
+
+        mock_response_1 = {
+            "@odata.nextLink": next_link,
+            "value": [{"@odata.type": "#microsoft.graph.user", "userPrincipalName": "foo@example.com"}],
+        }
+        mock_response_2 = {
+            "value": [
+                {"@odata.type": "#microsoft.graph.group"},
+                {"@odata.type": "#microsoft.graph.user", "userPrincipalName": "bar@example.com"},
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(url, [{"json": mock_response_1}, {"json": mock_response_2}])
+
+            members = fx_azure_client.get_group_members(group_id)
+
+            assert m.call_count == 2
+            assert m.request_history[0].qs == {"$select": ["userprincipalname"], "$top": ["999"]}
+            assert "$skiptoken" in m.request_history[1].qs
+
+        assert members == ["foo@example.com", "bar@example.com"]
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_batch(self, fx_azure_client: AzureClient) -> None:
+        """Can make batched requests, split into batches of 20."""
+        urls = {str(i): f"/groups/{i}" for i in range(25)}
+
+        def _respond(request: requests_mock.request._RequestObjectProxy, context: object) -> dict:
+            return {
+                "responses": [
+                    {"id": item["id"], "status": 200, "body": {"id": item["id"]}} for item in request.json()["requests"]
+                ]
+            }
+
+        with requests_mock.Mocker() as m:
+            m.post("https://graph.microsoft.com/v1.0/$batch", json=_respond)
+
+            responses = fx_azure_client._batch(urls)
+
+            assert m.call_count == 2
+            assert len(m.request_history[0].json()["requests"]) == 20
+            assert m.request_history[0].json()["requests"][0] == {"id": "0", "method": "GET", "url": "/groups/0"}
+
+        assert responses.keys() == urls.keys()
+        assert responses["24"]["body"] == {"id": "24"}
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_groups(self, fx_azure_client: AzureClient) -> None:
+        """Can get multiple groups, including those that do not exist."""
+        mock_response = {
+            "responses": [
+                {"id": "123", "status": 200, "body": {"id": "123", "displayName": "foo"}},
+                {"id": "456", "status": 404, "body": {"error": {"code": "Request_ResourceNotFound"}}},
+                {"id": "x", "status": 400, "body": {"error": {"message": "Invalid object identifier 'x'."}}},
+            ]
+        }
+        with requests_mock.Mocker() as m:
+            m.post("https://graph.microsoft.com/v1.0/$batch", json=mock_response)
+
+            groups = fx_azure_client.get_groups(["123", "456", "x"])
+
+        assert groups == {"123": {"id": "123", "displayName": "foo"}, "456": None, "x": None}
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_groups_error(self, fx_azure_client: AzureClient) -> None:
+        """Errors other than missing groups are raised."""
+        mock_response = {"responses": [{"id": "123", "status": 403, "body": {"error": {"code": "Forbidden"}}}]}
+        with requests_mock.Mocker() as m:
+            m.post("https://graph.microsoft.com/v1.0/$batch", json=mock_response)
+
+            with pytest.raises(RuntimeError, match="Failed to get group ID: 123."):
+                fx_azure_client.get_groups(["123"])
+
+    def test_check_groups(self, mocker: MockFixture, fx_azure_client: AzureClient) -> None:
+        """Can check which groups exist."""
+        mocker.patch.object(fx_azure_client, "get_groups", return_value={"123": {"id": "123"}, "456": None})
+
+        assert fx_azure_client.check_groups(["123", "456"]) == ["123"]
+
+    def test_get_group_names(self, mocker: MockFixture, fx_azure_client: AzureClient) -> None:
+        """Can get names of groups that exist."""
+        mocker.patch.object(fx_azure_client, "get_groups", return_value={"123": {"displayName": "foo"}, "456": None})
+
+        assert fx_azure_client.get_group_names(["123", "456"]) == {"123": "foo"}
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_groups_members(self, fx_azure_client: AzureClient) -> None:
+        """Can get members of multiple groups, following further pages."""
+        next_link = "https://graph.microsoft.com/v1.0/groups/456/members?$skiptoken=x"
+        mock_response = {
+            "responses": [
+                {"id": "123", "status": 200, "body": {"value": [{"userPrincipalName": "foo@example.com"}]}},
+                {
+                    "id": "456",
+                    "status": 200,
+                    "body": {"@odata.nextLink": next_link, "value": [{"userPrincipalName": "bar@example.com"}]},
+                },
+            ]
+        }
+        with requests_mock.Mocker() as m:
+            m.post("https://graph.microsoft.com/v1.0/$batch", json=mock_response)
+            m.get(next_link, json={"value": [{"userPrincipalName": "baz@example.com"}]})
+
+            members = fx_azure_client.get_groups_members(["123", "456"])
+
+            assert m.request_history[0].json()["requests"][0]["url"] == (
+                "/groups/123/members?$select=userPrincipalName&$top=999"
+            )
+
+        assert members == {"123": ["foo@example.com"], "456": ["bar@example.com", "baz@example.com"]}
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_groups_members_error(self, fx_azure_client: AzureClient) -> None:
+        """Errors getting group members are raised."""
+        mock_response = {"responses": [{"id": "123", "status": 404, "body": {}}]}
+        with requests_mock.Mocker() as m:
+            m.post("https://graph.microsoft.com/v1.0/$batch", json=mock_response)
+
+            with pytest.raises(RuntimeError, match="Failed to get members of group ID: 123."):
+                fx_azure_client.get_groups_members(["123"])
+
+    def test_get_groups_members_none(self, fx_azure_client: AzureClient) -> None:
+        """Getting members of no groups makes no requests."""
+        assert fx_azure_client.get_groups_members([]) == {}
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_group_members_delta_initial(self, fx_azure_client: AzureClient) -> None:
+        """Can get all members of group using delta query, across pages, skipping non-users."""
+        url = "https://graph.microsoft.com/v1.0/groups/delta"
+        next_link = f"{url}?$skiptoken=x"
+        delta_link = f"{url}?$deltatoken=y"
+
+        mock_response_1 = {
+            "@odata.nextLink": next_link,
+            "value": [{"id": "123", "members@delta": [{"@odata.type": "#microsoft.graph.user", "id": "1"}]}],
+        }
+        mock_response_2 = {
+            "@odata.deltaLink": delta_link,
+            "value": [
+                {
+                    "id": "123",
+                    "members@delta": [
+                        {"@odata.type": "#microsoft.graph.group", "id": "9"},
+                        {"@odata.type": "#microsoft.graph.user", "id": "2"},
+                    ],
+                }
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(url, [{"json": mock_response_1}, {"json": mock_response_2}])
+
+            delta = fx_azure_client.get_group_members_delta("123")
+
+            assert m.request_history[0].qs["$filter"] == ["id eq '123'"]
+
+        assert delta == GroupMembersDelta(added=["1", "2"], removed=[], delta_link=delta_link, full=True)
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_group_members_delta_changes(self, fx_azure_client: AzureClient) -> None:
+        """Can get changes to members of group since previous delta query."""
+        delta_link = "https://graph.microsoft.com/v1.0/groups/delta?$deltatoken=x"
+        mock_response = {
+            "@odata.deltaLink": f"{delta_link}z",
+            "value": [
+                {
+                    "id": "123",
+                    "members@delta": [
+                        {"@odata.type": "#microsoft.graph.user", "id": "1", "@removed": {"reason": "deleted"}},
+                        {"@odata.type": "#microsoft.graph.user", "id": "2"},
+                    ],
+                }
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(delta_link, json=mock_response)
+
+            delta = fx_azure_client.get_group_members_delta("123", delta_link=delta_link)
+
+        assert delta == GroupMembersDelta(added=["2"], removed=["1"], delta_link=f"{delta_link}z", full=False)
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_group_members_delta_expired(self, fx_azure_client: AzureClient) -> None:
+        """Gets all members of group if previous delta link has expired."""
+        url = "https://graph.microsoft.com/v1.0/groups/delta"
+        mock_response = {
+            "@odata.deltaLink": f"{url}?$deltatoken=y",
+            "value": [{"id": "123", "members@delta": [{"id": "1"}]}],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(
+                url,
+                [
+                    {"status_code": 410, "json": {"error": {"code": "syncStateNotFound"}}},
+                    {"json": mock_response},
+                ],
+            )
+
+            delta = fx_azure_client.get_group_members_delta("123", delta_link=f"{url}?$deltatoken=x")
+
+        assert delta.full is True
+        assert delta.added == ["1"]
+
+    def test_get_groups_members_delta(self, mocker: MockFixture, fx_azure_client: AzureClient) -> None:
+        """Can get changes to members of multiple groups."""
+        delta = GroupMembersDelta(added=["1"], removed=[], delta_link="x", full=True)
+        mock_delta = mocker.patch.object(fx_azure_client, "get_group_members_delta", return_value=delta)
+
+        result = fx_azure_client.get_groups_members_delta({"123": None, "456": "y"})
+
+        assert result == {"123": delta, "456": delta}
+        mock_delta.assert_any_call(group_id="456", delta_link="y")
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_users_upns(self, fx_azure_client: AzureClient) -> None:
+        """Can get UPNs of users from IDs using batched requests."""
+        mock_response = {
+            "responses": [
+                {"id": "0", "status": 200, "body": {"value": [{"id": "1", "userPrincipalName": "foo@example.com"}]}}
+            ]
+        }
+        with requests_mock.Mocker() as m:
+            m.post("https://graph.microsoft.com/v1.0/$batch", json=mock_response)
+
+            upns = fx_azure_client.get_users_upns(["1", "2"])
+
+            request = m.request_history[0].json()["requests"][0]
+            assert request["method"] == "POST"
+            assert request["url"] == "/directoryObjects/getByIds"
+            assert request["body"] == {"ids": ["1", "2"], "types": ["user"]}
+
+        assert upns == {"1": "foo@example.com"}
+
+    def test_get_users_upns_none(self, fx_azure_client: AzureClient) -> None:
+        """No requests are made if there are no users."""
+        with requests_mock.Mocker() as m:
+            assert fx_azure_client.get_users_upns([]) == {}
+            assert m.call_count == 0
+
+    @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
+    def test_get_users_upns_fail(self, fx_azure_client: AzureClient) -> None:
+        """Fails if users cannot be looked up."""
+        mock_response = {"responses": [{"id": "0", "status": 400, "body": {"error": {"message": "x"}}}]}
+        with requests_mock.Mocker() as m:
+            m.post("https://graph.microsoft.com/v1.0/$batch", json=mock_response)
+
+            with pytest.raises(RuntimeError, match="Failed to get UPNs of users."):
+                fx_azure_client.get_users_upns(["1"])
+
     @pytest.mark.usefixtures("_fx_mock_azure_client_get_token")
     def test_get_group_name_ok(self, caplog: pytest.LogCaptureFixture, fx_azure_client: AzureClient) -> None:
         """Can get group name."""
@@ -149,6 +484,71 @@ class TestAzureClient:
             assert name == expected
 
 
+class TestLDAPConnection:
+    """Tests for process-wide LDAP connection."""
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_get(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Connection is created, configured and bound once, then reused."""
+        mock_set_option = mocker.spy(ldap.ldapobject.LDAPObject, "set_option")
+        mock_start_tls = mocker.spy(ldap.ldapobject.LDAPObject, "start_tls_s")
+
+        connection = LDAPConnection.get()
+
+        assert isinstance(connection, ldap.ldapobject.ReconnectLDAPObject)
+        assert LDAPConnection.get() is connection
+        assert ldap.ldapobject.LDAPObject.simple_bind_s.call_count == 1
+        assert "LDAP bind successful." in caplog.text
+        assert "Reusing LDAP connection." in caplog.text
+        assert (ldap.OPT_NETWORK_TIMEOUT, 10) in [call.args[1:] for call in mock_set_option.call_args_list]
+        mock_start_tls.assert_not_called()
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_get_start_tls(self, mocker: MockFixture) -> None:
+        """Connection is secured using StartTLS if configured."""
+        mocker.patch(
+            "ops_data_store.auth.Config.AUTH_LDAP_START_TLS", new_callable=mocker.PropertyMock, return_value=True
+        )
+        mock_start_tls = mocker.patch.object(ldap.ldapobject.ReconnectLDAPObject, "start_tls_s")
+
+        LDAPConnection.get()
+
+        mock_start_tls.assert_called_once()
+
+    @pytest.mark.usefixtures("_fx_reset_ldap_connection")
+    def test_get_error(self, mocker: MockFixture) -> None:
+        """Failed connection is not kept, so the next request tries again."""
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "simple_bind_s", side_effect=ldap.LDAPError())
+
+        with pytest.raises(ldap.LDAPError):
+            LDAPConnection.get()
+
+        assert LDAPConnection._connection is None
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_reconnect(self, mocker: MockFixture) -> None:
+        """Connection can be reconnected."""
+        LDAPConnection.get()
+        mock_reconnect = mocker.patch.object(ldap.ldapobject.ReconnectLDAPObject, "reconnect")
+
+        LDAPConnection.reconnect()
+
+        mock_reconnect.assert_called_once()
+        assert mock_reconnect.call_args.kwargs["retry_max"] == 3
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_close(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Connection can be closed."""
+        mock_unbind = mocker.patch.object(ldap.ldapobject.LDAPObject, "unbind_s")
+        LDAPConnection.get()
+
+        LDAPConnection.close()
+
+        mock_unbind.assert_called_once()
+        assert "LDAP unbind successful." in caplog.text
+        assert LDAPConnection._connection is None
+
+
 class TestLDAPClient:
     """Tests for app LDAP client."""
 
@@ -188,6 +588,7 @@ class TestLDAPClient:
 
         assert client._is_bound is True
 
+    @pytest.mark.usefixtures("_fx_reset_ldap_connection")
     def test_bind_error(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
         """Cannot bind when error occurs."""
         mocker.patch.object(ldap.ldapobject.LDAPObject, "simple_bind_s", side_effect=ldap.LDAPError())
@@ -201,6 +602,59 @@ class TestLDAPClient:
         assert str(e.value) == "Failed to connect to LDAP server."
         assert client._is_bound is False
 
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_bind_shared(self) -> None:
+        """Clients share a single connection."""
+        client_1 = LDAPClient()
+        client_1._bind()
+        client_2 = LDAPClient()
+        client_2._bind()
+
+        assert client_1.client is client_2.client
+        assert ldap.ldapobject.LDAPObject.simple_bind_s.call_count == 1
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_search_reconnect(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Searches are retried once reconnected if the connection was dropped."""
+        results = [("cn=foo,ou=users,dc=example,dc=com", {})]
+        mocker.patch.object(
+            ldap.ldapobject.LDAPObject, "result3", side_effect=[ldap.SERVER_DOWN(), (101, results, 1, [])]
+        )
+        client = LDAPClient()
+        client._bind()
+        # patched once bound, as binding calls `reconnect(force=False)` to check the connection is open
+        mock_reconnect = mocker.patch.object(ldap.ldapobject.ReconnectLDAPObject, "reconnect")
+
+        found = client.check_users(user_ids=["cn=foo"])
+
+        assert found == ["cn=foo,ou=users,dc=example,dc=com"]
+        mock_reconnect.assert_called_once()
+        assert "LDAP server connection lost, reconnecting." in caplog.text
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_modify_reconnect(self, mocker: MockFixture) -> None:
+        """Batches in progress when the connection was dropped fail, with later batches sent once reconnected."""
+        group_dn = "cn=admin,ou=groups,dc=example,dc=com"
+        user_dns = [f"cn=user{i},ou=users,dc=example,dc=com" for i in range(3)]
+        mocker.patch(
+            "ops_data_store.auth.Config.AUTH_LDAP_MODIFY_BATCH_SIZE", new_callable=mocker.PropertyMock, return_value=1
+        )
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "modify_ext", side_effect=[1, ldap.SERVER_DOWN(), 2, 3])
+        mocker.patch.object(
+            ldap.ldapobject.LDAPObject,
+            "result3",
+            side_effect=[ldap.SERVER_DOWN(), (103, [], 2, []), (103, [], 3, [])],
+        )
+        client = LDAPClient()
+        client._bind()
+        # patched once bound, as binding calls `reconnect(force=False)` to check the connection is open
+        mock_reconnect = mocker.patch.object(ldap.ldapobject.ReconnectLDAPObject, "reconnect")
+
+        failed = client.add_to_group(group_dn=group_dn, user_dns=user_dns)
+
+        assert failed == [user_dns[0]]
+        mock_reconnect.assert_called_once()
+
     @pytest.mark.usefixtures("_fx_mock_ldap_object")
     def test_verify_bind_ok(self, caplog: pytest.LogCaptureFixture) -> None:
         """Can bind."""
@@ -217,7 +671,7 @@ class TestLDAPClient:
         expected = [f"{user},{base}" for user in search[:-1]]
         results = [(f"{user},{base}", {}) for user in search[:-1]]
 
-        mocker.patch.object(ldap.ldapobject.LDAPObject, "search_s", return_value=results)
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "result3", return_value=(101, results, 1, []))
 
         client = LDAPClient()
         missing_users = client.check_users(user_ids=search)
@@ -239,7 +693,7 @@ class TestLDAPClient:
         expected = [f"{group},{base}" for group in search[:-1]]
         results = [(f"{group},{base}", {}) for group in search[:-1]]
 
-        mocker.patch.object(ldap.ldapobject.LDAPObject, "search_s", return_value=results)
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "result3", return_value=(101, results, 1, []))
 
         client = LDAPClient()
         missing_groups = client.check_groups(group_ids=search)
@@ -253,6 +707,41 @@ class TestLDAPClient:
 
         assert missing_groups == expected
 
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_check_objects_chunked(self, mocker: MockFixture) -> None:
+        """Searches for many objects are split into chunks, sent before any results are collected."""
+        search = ["cn=foo", "cn=bar", "cn=baz"]
+        base = "ou=users,dc=example,dc=com"
+        expected = [f"{user},{base}" for user in search]
+        mock_search = mocker.patch.object(ldap.ldapobject.LDAPObject, "search_ext", side_effect=[1, 2])
+        mock_result = mocker.patch.object(
+            ldap.ldapobject.LDAPObject,
+            "result3",
+            side_effect=[(101, [(expected[0], {}), (expected[1], {})], 1, []), (101, [(expected[2], {})], 2, [])],
+        )
+
+        client = LDAPClient()
+        client.filter_chunk_size = 2
+        results = client._check_objects(base=base, object_ids=search)
+
+        assert results == expected
+        assert [call.kwargs["filterstr"] for call in mock_search.call_args_list] == [
+            "(|(cn=foo)(cn=bar))",
+            "(|(cn=baz))",
+        ]
+        assert [call.args[0] for call in mock_result.call_args_list] == [1, 2]
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_check_objects_escaped(self, mocker: MockFixture) -> None:
+        """Object IDs are escaped in search filters."""
+        mock_search = mocker.patch.object(ldap.ldapobject.LDAPObject, "search_ext", return_value=1)
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "result3", return_value=(101, [], 1, []))
+
+        client = LDAPClient()
+        client._check_objects(base="ou=users,dc=example,dc=com", object_ids=["cn=foo*(bar)"])
+
+        assert mock_search.call_args.kwargs["filterstr"] == "(|(cn=foo\\2a\\28bar\\29))"
+
     @pytest.mark.usefixtures("_fx_mock_ldap_object")
     def test_get_group_members(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
         """Can get group members."""
@@ -262,7 +751,7 @@ class TestLDAPClient:
         expected = ["cn=foo,ou=users,dc=example,dc=com", "cn=bar,ou=users,dc=example,dc=com"]
         results = [(f"{search}", {"member": [member.encode() for member in expected]})]
 
-        mocker.patch.object(ldap.ldapobject.LDAPObject, "search_s", return_value=results)
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "result3", return_value=(101, results, 1, []))
 
         client = LDAPClient()
         members = client.get_group_members(group_dn=search)
@@ -273,6 +762,58 @@ class TestLDAPClient:
 
         assert members == expected
 
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_iter_objects_paged(self, mocker: MockFixture) -> None:
+        """Can search across multiple pages of results, skipping references."""
+        page_1 = [("cn=foo,ou=users,dc=example,dc=com", {}), (None, ["ldap://other.example.com/"])]
+        page_2 = [("cn=bar,ou=users,dc=example,dc=com", {})]
+        control_1 = SimplePagedResultsControl(criticality=False, size=500, cookie=b"x")
+        control_2 = SimplePagedResultsControl(criticality=False, size=500, cookie=b"")
+        mock_search = mocker.patch.object(ldap.ldapobject.LDAPObject, "search_ext", return_value=1)
+        mocker.patch.object(
+            ldap.ldapobject.LDAPObject,
+            "result3",
+            side_effect=[(101, page_1, 1, [control_1]), (101, page_2, 1, [control_2])],
+        )
+
+        client = LDAPClient()
+        results = client._iter_objects(base="ou=users,dc=example,dc=com", ldap_filter="(cn=*)", attributes=["dn"])
+
+        assert [dn for dn, _ in results] == ["cn=foo,ou=users,dc=example,dc=com", "cn=bar,ou=users,dc=example,dc=com"]
+        assert mock_search.call_count == 2
+        assert mock_search.call_args.kwargs["serverctrls"][0].cookie == b"x"
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_get_group_members_ranged(self, mocker: MockFixture) -> None:
+        """Can get group members returned in ranges."""
+        group_dn = "cn=admin,ou=groups,dc=example,dc=com"
+        results_1 = [(group_dn, {"member": [], "member;range=0-1": [b"cn=foo", b"cn=bar"]})]
+        results_2 = [(group_dn, {"member;range=2-3": [b"cn=baz", b"cn=qux"]})]
+        results_3 = [(group_dn, {"member;range=4-*": [b"cn=quux"]})]
+        mocker.patch.object(
+            ldap.ldapobject.LDAPObject,
+            "result3",
+            side_effect=[(101, results, 1, []) for results in [results_1, results_2, results_3]],
+        )
+        mock_search = ldap.ldapobject.LDAPObject.search_ext
+
+        client = LDAPClient()
+        members = client.get_group_members(group_dn=group_dn)
+
+        assert members == ["cn=foo", "cn=bar", "cn=baz", "cn=qux", "cn=quux"]
+        assert mock_search.call_args_list[1].kwargs["attrlist"] == ["member;range=2-*"]
+        assert mock_search.call_args_list[2].args[1:3] == (group_dn, ldap.SCOPE_BASE)
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_get_group_members_empty(self, mocker: MockFixture) -> None:
+        """Group without members returns no members."""
+        results = [("cn=admin,ou=groups,dc=example,dc=com", {})]
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "result3", return_value=(101, results, 1, []))
+
+        client = LDAPClient()
+
+        assert client.get_group_members(group_dn="cn=admin,ou=groups,dc=example,dc=com") == []
+
     @pytest.mark.usefixtures("_fx_mock_ldap_object")
     def test_add_to_group_ok(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
         """Can add users to group."""
@@ -282,11 +823,13 @@ class TestLDAPClient:
         user_dns = ["cn=foo,ou=users,dc=example,dc=com", "cn=bar,ou=users,dc=example,dc=com"]
         result = (103, [], 2, [])
 
-        mocker.patch.object(ldap.ldapobject.LDAPObject, "modify_s", return_value=result)
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "modify_ext", return_value=2)
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "result3", return_value=result)
 
         client = LDAPClient()
-        client.add_to_group(group_dn=group_dn, user_dns=user_dns)
+        failed = client.add_to_group(group_dn=group_dn, user_dns=user_dns)
 
+        assert failed == []
         assert "Attempting to bind to LDAP server." in caplog.text
         assert "LDAP bind successful." in caplog.text
         assert f"Group to add to: {group_dn}" in caplog.text
@@ -308,14 +851,68 @@ class TestLDAPClient:
         user_dns = ["cn=bar,ou=users,dc=example,dc=com"]
         result = (103, [], 2, [])
 
-        mocker.patch.object(ldap.ldapobject.LDAPObject, "modify_s", return_value=result)
+        mock_modify = mocker.patch.object(ldap.ldapobject.LDAPObject, "modify_ext", return_value=2)
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "result3", return_value=result)
 
         client = LDAPClient()
-        client.remove_from_group(
+        failed = client.remove_from_group(
             group_dn=group_dn,
             user_dns=user_dns,
         )
 
+        assert failed == []
+        mock_modify.assert_called_once_with(group_dn, [(ldap.MOD_DELETE, "member", [user_dns[0].encode()])])
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_modify_group_members_pipelined(self, mocker: MockFixture) -> None:
+        """Members are modified in batches, with a limited number awaiting results at once."""
+        group_dn = "cn=admin,ou=groups,dc=example,dc=com"
+        user_dns = [f"cn=user{i},ou=users,dc=example,dc=com" for i in range(5)]
+        mocker.patch(
+            "ops_data_store.auth.Config.AUTH_LDAP_MODIFY_BATCH_SIZE", new_callable=mocker.PropertyMock, return_value=2
+        )
+        manager = mocker.Mock()
+        manager.modify_ext.side_effect = [1, 2, 3]
+        manager.result3.return_value = (103, [], 1, [])
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "modify_ext", manager.modify_ext)
+        mocker.patch.object(ldap.ldapobject.LDAPObject, "result3", manager.result3)
+
+        client = LDAPClient()
+        client.max_modify_in_flight = 2
+        client.add_to_group(group_dn=group_dn, user_dns=user_dns)
+
+        assert [call[0] for call in manager.mock_calls] == [
+            "modify_ext",
+            "modify_ext",
+            "result3",
+            "modify_ext",
+            "result3",
+            "result3",
+        ]
+        assert [len(call.args[1][0][2]) for call in manager.modify_ext.call_args_list] == [2, 2, 1]
+
+    @pytest.mark.usefixtures("_fx_mock_ldap_object")
+    def test_modify_group_members_failed(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Failed batches are returned without stopping other batches."""
+        group_dn = "cn=admin,ou=groups,dc=example,dc=com"
+        user_dns = [f"cn=user{i},ou=users,dc=example,dc=com" for i in range(3)]
+        mocker.patch(
+            "ops_data_store.auth.Config.AUTH_LDAP_MODIFY_BATCH_SIZE", new_callable=mocker.PropertyMock, return_value=1
+        )
+        mock_modify = mocker.patch.object(ldap.ldapobject.LDAPObject, "modify_ext", side_effect=[1, 2, 3])
+        mocker.patch.object(
+            ldap.ldapobject.LDAPObject,
+            "result3",
+            side_effect=[(103, [], 1, []), ldap.TYPE_OR_VALUE_EXISTS(), (103, [], 3, [])],
+        )
+
+        client = LDAPClient()
+        failed = client.add_to_group(group_dn=group_dn, user_dns=user_dns)
+
+        assert failed == [user_dns[1]]
+        assert mock_modify.call_count == 3
+        assert f"Failed to modify members of group: {group_dn}" in caplog.text
+
     def test_remove_from_group_empty(self, caplog: pytest.LogCaptureFixture):
         """Skip removing when no users specified."""
         client = LDAPClient()
@@ -346,11 +943,32 @@ class TestSimpleSyncClient:
 
         assert isinstance(client, SimpleSyncClient)
 
+    def test_init_existing_clients(
+        self, mocker: MockFixture, fx_mock_ssc_azure_group_ids: list[str], fx_mock_ssc_ldap_group_id: str
+    ) -> None:
+        """Can be initialised with existing Azure and LDAP clients."""
+        azure_client_mock = mocker.patch("ops_data_store.auth.AzureClient", autospec=True)
+        ldap_client_mock = mocker.patch("ops_data_store.auth.LDAPClient", autospec=True)
+        azure_client = mocker.Mock()
+        ldap_client = mocker.Mock()
+
+        client = SimpleSyncClient(
+            azure_group_ids=fx_mock_ssc_azure_group_ids,
+            ldap_group_id=fx_mock_ssc_ldap_group_id,
+            azure_client=azure_client,
+            ldap_client=ldap_client,
+        )
+
+        assert client.azure_client is azure_client
+        assert client.ldap_client is ldap_client
+        azure_client_mock.assert_not_called()
+        ldap_client_mock.assert_not_called()
+
     def test_check_groups_exist_ok(self, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient) -> None:
         """Gets LDAP group DN where groups exist."""
         expected = "cn=abc,ou=groups,dc=example,dc=com"
 
-        mocker.patch.object(fx_mock_ssc.azure_client, "check_group", return_value=None)
+        mocker.patch.object(fx_mock_ssc.azure_client, "check_groups", return_value=fx_mock_ssc._source_group_ids)
         mocker.patch.object(fx_mock_ssc.ldap_client, "check_groups", return_value=[expected])
 
         result = fx_mock_ssc._check_groups_exist()
@@ -361,49 +979,68 @@ class TestSimpleSyncClient:
         self, mocker: MockFixture, fx_mock_ssc_azure_group_ids: list[str], fx_mock_ssc: SimpleSyncClient
     ) -> None:
         """Fails where Azure group missing."""
-        mocker.patch.object(
-            fx_mock_ssc.azure_client,
-            "check_group",
-            side_effect=ValueError(f"Group ID: {fx_mock_ssc_azure_group_ids[0]} does not exist."),
-        )
+        mocker.patch.object(fx_mock_ssc.azure_client, "check_groups", return_value=fx_mock_ssc_azure_group_ids[1:])
 
         with pytest.raises(RuntimeError, match=f"Azure group {fx_mock_ssc._source_group_ids[0]} does not exist."):
             fx_mock_ssc._check_groups_exist()
 
     def test_check_groups_exist_missing_ldap(self, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient) -> None:
         """Fails where LDAP group missing."""
+        mocker.patch.object(fx_mock_ssc.azure_client, "check_groups", return_value=fx_mock_ssc._source_group_ids)
         mocker.patch.object(fx_mock_ssc.ldap_client, "check_groups", return_value=[])
 
         with pytest.raises(RuntimeError, match=f"LDAP group {fx_mock_ssc._target_group_id} does not exist."):
             fx_mock_ssc._check_groups_exist()
 
-    def test_check_target_users(
-        self,
-        mocker: MockFixture,
-        fx_mock_ssc_eval_result: dict[str, list[str]],
-        fx_se_mock_ldap_check_users: Callable,
-        fx_mock_ssc: SimpleSyncClient,
+    def test_check_groups_exist_source_members(self, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient) -> None:
+        """Azure groups are not checked where source members are given."""
+        fx_mock_ssc._source_members = {"123": []}
+        mock_check_groups = mocker.patch.object(fx_mock_ssc.azure_client, "check_groups")
+        mocker.patch.object(fx_mock_ssc.ldap_client, "check_groups", return_value=["cn=abc"])
+
+        fx_mock_ssc._check_groups_exist()
+
+        mock_check_groups.assert_not_called()
+
+    def test_get_changes(self, fx_mock_ssc_eval_result: dict[str, list[str]], fx_mock_ssc: SimpleSyncClient) -> None:
+        """Can identify users to add to and remove from target group."""
+        fx_mock_ssc._source_user_ids = set(fx_mock_ssc_eval_result["source"])
+        fx_mock_ssc._target_user_ids = set(fx_mock_ssc_eval_result["target"])
+
+        add_ids, remove_ids = fx_mock_ssc._get_changes()
+
+        assert add_ids == {"bob", "connie"}
+        assert remove_ids == {"darren"}
+
+    def test_resolve_users(
+        self, mocker: MockFixture, fx_se_mock_ldap_check_users: Callable, fx_mock_ssc: SimpleSyncClient
     ) -> None:
         """
-        Can identify users for syncing.
+        Can get DNs for users in a single lookup.
 
         Key to users:
-        - alice: present (in target)
-        - bob: missing (from target)
+        - bob: exists in target
         - connie: unknown (in target)
-        - darren: removed (not in source)
+        - darren: exists in target
         """
-        fx_mock_ssc._source_user_ids = fx_mock_ssc_eval_result["source"]
-        fx_mock_ssc._target_user_ids = fx_mock_ssc_eval_result["target"]
+        mock_check_users = mocker.patch.object(
+            fx_mock_ssc.ldap_client, "check_users", side_effect=fx_se_mock_ldap_check_users
+        )
+
+        result = fx_mock_ssc._resolve_users(user_ids={"bob", "connie", "darren"})
 
-        mocker.patch.object(fx_mock_ssc.ldap_client, "check_users", side_effect=fx_se_mock_ldap_check_users)
+        assert result == {
+            "bob": "cn=bob,ou=users,dc=example,dc=com",
+            "darren": "cn=darren,ou=users,dc=example,dc=com",
+        }
+        mock_check_users.assert_called_once_with(user_ids=["cn=bob", "cn=connie", "cn=darren"])
 
-        fx_mock_ssc._check_target_users()
+    def test_resolve_users_none(self, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient) -> None:
+        """No lookup is made if there are no users."""
+        mock_check_users = mocker.patch.object(fx_mock_ssc.ldap_client, "check_users")
 
-        assert fx_mock_ssc._user_ids_missing_in_target == fx_mock_ssc_eval_result["missing"]
-        assert fx_mock_ssc._user_ids_unknown_in_target == fx_mock_ssc_eval_result["unknown"]
-        assert fx_mock_ssc._target_dns_del == ["cn=darren,ou=users,dc=example,dc=com"]
-        assert fx_mock_ssc._target_dns_add == ["cn=bob,ou=users,dc=example,dc=com"]
+        assert fx_mock_ssc._resolve_users(user_ids=set()) == {}
+        mock_check_users.assert_not_called()
 
     def test_get_source_user_ids(
         self, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient, fx_mock_ssc_eval_result: dict[str, list[str]]
@@ -413,13 +1050,23 @@ class TestSimpleSyncClient:
 
         mocker.patch.object(
             fx_mock_ssc.azure_client,
-            "get_group_members",
-            return_value=[f"{user}@example.com" for user in expected],
+            "get_groups_members",
+            return_value={"123": [f"{user.capitalize()}@example.com" for user in expected]},
         )
 
         fx_mock_ssc._get_source_user_ids()
 
-        assert fx_mock_ssc._source_user_ids == expected
+        assert fx_mock_ssc._source_user_ids == set(expected)
+
+    def test_get_source_user_ids_source_members(self, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient) -> None:
+        """Uses source members where given rather than fetching from Azure."""
+        fx_mock_ssc._source_members = {"123": ["Alice@example.com"]}
+        mock_get_groups_members = mocker.patch.object(fx_mock_ssc.azure_client, "get_groups_members")
+
+        fx_mock_ssc._get_source_user_ids()
+
+        assert fx_mock_ssc._source_user_ids == {"alice"}
+        mock_get_groups_members.assert_not_called()
 
     def test_get_target_user_ids(
         self, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient, fx_mock_ssc_eval_result: dict[str, list[str]]
@@ -435,59 +1082,455 @@ class TestSimpleSyncClient:
 
         fx_mock_ssc._get_target_user_ids()
 
-        assert fx_mock_ssc._target_user_ids == expected
+        assert fx_mock_ssc._target_user_ids == set(expected)
 
     def test_evaluate(
         self,
         caplog: pytest.LogCaptureFixture,
         mocker: MockFixture,
         fx_mock_ssc_eval_result: dict[str, list[str]],
+        fx_se_mock_ldap_check_users: Callable,
         fx_mock_ssc: SimpleSyncClient,
     ) -> None:
         """Can evaluate sync."""
-        fx_mock_ssc._source_user_ids = fx_mock_ssc_eval_result["source"]
-        fx_mock_ssc._target_user_ids = fx_mock_ssc_eval_result["target"]
-        fx_mock_ssc._user_ids_missing_in_target = fx_mock_ssc_eval_result["missing"]
-        fx_mock_ssc._user_ids_unknown_in_target = fx_mock_ssc_eval_result["unknown"]
-
-        mocker.patch.object(fx_mock_ssc, "_check_groups_exist", return_value=None)
-        mocker.patch.object(fx_mock_ssc, "_get_source_user_ids", return_value=None)
-        mocker.patch.object(fx_mock_ssc, "_get_target_user_ids", return_value=None)
-        mocker.patch.object(fx_mock_ssc, "_check_target_users", return_value=None)
+        mocker.patch.object(fx_mock_ssc, "_check_groups_exist", return_value="cn=abc,ou=groups,dc=example,dc=com")
+        mocker.patch.object(
+            fx_mock_ssc.azure_client,
+            "get_groups_members",
+            return_value={"123": [f"{user}@example.com" for user in fx_mock_ssc_eval_result["source"]]},
+        )
+        mocker.patch.object(
+            fx_mock_ssc.ldap_client,
+            "get_group_members",
+            return_value=[f"cn={user},ou=users,dc=example,dc=com" for user in fx_mock_ssc_eval_result["target"]],
+        )
+        mock_check_users = mocker.patch.object(
+            fx_mock_ssc.ldap_client, "check_users", side_effect=fx_se_mock_ldap_check_users
+        )
 
-        assert fx_mock_ssc._evaluated is False
+        assert fx_mock_ssc._diff is None
 
         result = fx_mock_ssc.evaluate()
 
         assert "Evaluating Azure to LDAP group sync." in caplog.text
 
-        assert fx_mock_ssc._user_ids_already_in_target == fx_mock_ssc_eval_result["present"]
-        assert fx_mock_ssc._user_ids_unknown_in_source == fx_mock_ssc_eval_result["remove"]
-        assert fx_mock_ssc._evaluated is True
         assert result == fx_mock_ssc_eval_result
+        assert fx_mock_ssc._diff.dns == {
+            "bob": "cn=bob,ou=users,dc=example,dc=com",
+            "darren": "cn=darren,ou=users,dc=example,dc=com",
+        }
+        mock_check_users.assert_called_once()
 
     def test_sync_ok(
-        self, caplog: pytest.LogCaptureFixture, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient
+        self,
+        caplog: pytest.LogCaptureFixture,
+        mocker: MockFixture,
+        fx_mock_ssc_eval_result: dict[str, list[str]],
+        fx_mock_ssc_diff: SyncDiff,
+        fx_mock_ssc: SimpleSyncClient,
     ) -> None:
-        """Sync succeeds."""
-        mocker.patch.object(fx_mock_ssc.ldap_client, "remove_from_group", return_value=None)
-        mocker.patch.object(fx_mock_ssc.ldap_client, "add_to_group", return_value=None)
-        fx_mock_ssc._evaluated = True
+        """Sync succeeds, reporting result from changes applied."""
+        mock_add = mocker.patch.object(fx_mock_ssc.ldap_client, "add_to_group", return_value=[])
+        mock_remove = mocker.patch.object(fx_mock_ssc.ldap_client, "remove_from_group", return_value=[])
+        mock_evaluate = mocker.spy(fx_mock_ssc, "evaluate")
+        fx_mock_ssc._diff = fx_mock_ssc_diff
 
-        fx_mock_ssc.sync()
+        result = fx_mock_ssc.sync()
 
         assert "Syncing members of Azure groups to LDAP." in caplog.text
+        mock_add.assert_called_once_with(group_dn=None, user_dns=["cn=bob,ou=users,dc=example,dc=com"])
+        mock_remove.assert_called_once_with(group_dn=None, user_dns=["cn=darren,ou=users,dc=example,dc=com"])
+        mock_evaluate.assert_not_called()
+        assert result == {
+            **fx_mock_ssc_eval_result,
+            "target": ["alice", "bob"],
+            "present": ["alice", "bob"],
+            "missing": [],
+            "remove": [],
+        }
 
     def test_sync_not_evaluated(
         self, caplog: pytest.LogCaptureFixture, mocker: MockFixture, fx_mock_ssc: SimpleSyncClient
     ) -> None:
         """Sync runs evaluation if needed."""
-        mocker.patch.object(fx_mock_ssc.ldap_client, "remove_from_group", return_value=None)
-        mocker.patch.object(fx_mock_ssc.ldap_client, "add_to_group", return_value=None)
-        mocker.patch.object(fx_mock_ssc, "evaluate", return_value=None)
-        fx_mock_ssc._evaluated = False
+        mocker.patch.object(fx_mock_ssc.ldap_client, "remove_from_group", return_value=[])
+        mocker.patch.object(fx_mock_ssc.ldap_client, "add_to_group", return_value=[])
+        mocker.patch.object(fx_mock_ssc, "evaluate", side_effect=lambda: setattr(fx_mock_ssc, "_diff", SyncDiff()))
 
         fx_mock_ssc.sync()
 
         assert "Sync not yet evaluated, evaluating first." in caplog.text
         assert "Syncing members of Azure groups to LDAP." in caplog.text
+
+    def test_sync_failed(self, mocker: MockFixture, fx_mock_ssc_diff: SyncDiff, fx_mock_ssc: SimpleSyncClient) -> None:
+        """Sync fails if any users cannot be synced, after trying all users."""
+        mocker.patch.object(fx_mock_ssc.ldap_client, "add_to_group", return_value=["cn=bob,ou=users,dc=example,dc=com"])
+        mock_remove = mocker.patch.object(fx_mock_ssc.ldap_client, "remove_from_group", return_value=[])
+        fx_mock_ssc._diff = fx_mock_ssc_diff
+
+        with pytest.raises(RuntimeError, match="Failed to add 1 and remove 0 users in LDAP group."):
+            fx_mock_ssc.sync()
+
+        mock_remove.assert_called_once()
+        assert fx_mock_ssc._diff.missing == {"bob"}
+        assert fx_mock_ssc._diff.remove == set()
+
+
+class TestSyncDiff:
+    """Tests for sync differences."""
+
+    def test_user_ids(self) -> None:
+        """Can get normalised usernames from UPNs and DNs."""
+        assert SyncDiff.user_id_from_upn("ConWat@example.com") == "conwat"
+        assert SyncDiff.user_id_from_dn("CN=ConWat,OU=Users,DC=example,DC=com") == "conwat"
+
+    def test_applied(self, fx_mock_ssc_diff: SyncDiff) -> None:
+        """Can derive difference once changes are applied."""
+        result = fx_mock_ssc_diff.applied(added={"bob"}, removed=set())
+
+        assert result.target == {"alice", "bob", "darren"}
+        assert result.present == {"alice", "bob"}
+        assert result.missing == set()
+        assert result.remove == {"darren"}
+
+
+class TestRoleSyncClient:
+    """Tests for Azure group to database role sync client."""
+
+    def test_init(
+        self, caplog: pytest.LogCaptureFixture, mocker: MockFixture, fx_mock_ssc_azure_group_ids: list[str]
+    ) -> None:
+        """Can be initialised."""
+        mocker.patch("ops_data_store.auth.AzureClient", autospec=True)
+        mocker.patch("ops_data_store.auth.DBClient", autospec=True)
+
+        client = RoleSyncClient(azure_group_ids=fx_mock_ssc_azure_group_ids, db_role="ods_read")
+
+        assert "Creating role sync client." in caplog.text
+        assert "DB role: ods_read" in caplog.text
+
+        assert isinstance(client, RoleSyncClient)
+
+    def test_check_groups_exist_ok(self, mocker: MockFixture, fx_mock_rsc: RoleSyncClient) -> None:
+        """No error where groups and role exist."""
+        mocker.patch.object(fx_mock_rsc.azure_client, "check_groups", return_value=fx_mock_rsc._source_group_ids)
+        mocker.patch.object(fx_mock_rsc.db_client, "check_roles", return_value=["ods_read"])
+
+        fx_mock_rsc._check_groups_exist()
+
+    def test_check_groups_exist_missing_role(self, mocker: MockFixture, fx_mock_rsc: RoleSyncClient) -> None:
+        """Fails where database role missing."""
+        mocker.patch.object(fx_mock_rsc.azure_client, "check_groups", return_value=fx_mock_rsc._source_group_ids)
+        mocker.patch.object(fx_mock_rsc.db_client, "check_roles", return_value=[])
+
+        with pytest.raises(RuntimeError, match="DB role ods_read does not exist."):
+            fx_mock_rsc._check_groups_exist()
+
+    def test_evaluate(
+        self, mocker: MockFixture, fx_mock_ssc_eval_result: dict[str, list[str]], fx_mock_rsc: RoleSyncClient
+    ) -> None:
+        """
+        Can evaluate sync, ignoring configured users.
+
+        Key to users:
+        - alice: in source and target
+        - bob: in source and database, can be granted role
+        - connie: in source, not in database
+        - darren: in target, can be revoked role
+        - ops_data_store_app: in target, ignored
+        """
+        fx_mock_rsc._ignored_user_ids = {"ops_data_store_app"}
+        mocker.patch.object(fx_mock_rsc.azure_client, "check_groups", return_value=fx_mock_rsc._source_group_ids)
+        mocker.patch.object(
+            fx_mock_rsc.azure_client,
+            "get_groups_members",
+            return_value={"123": [f"{user}@example.com" for user in fx_mock_ssc_eval_result["source"]]},
+        )
+        mocker.patch.object(
+            fx_mock_rsc.db_client, "get_role_members", return_value=["alice", "darren", "ops_data_store_app"]
+        )
+        mock_check_roles = mocker.patch.object(
+            fx_mock_rsc.db_client, "check_roles", side_effect=[["ods_read"], ["bob"]]
+        )
+
+        result = fx_mock_rsc.evaluate()
+
+        assert result == fx_mock_ssc_eval_result
+        mock_check_roles.assert_called_with(role_names=["bob", "connie"])
+
+    def test_evaluate_no_ignored_users(self, mocker: MockFixture, fx_mock_rsc: RoleSyncClient) -> None:
+        """Fails where no users to ignore are set, rather than revoking the role from application users."""
+        mock_get_role_members = mocker.patch.object(fx_mock_rsc.db_client, "get_role_members")
+
+        with pytest.raises(RuntimeError, match="No DB users to ignore, set the `AUTH_DB_SYNC_IGNORED_USERS`"):
+            fx_mock_rsc.evaluate()
+
+        mock_get_role_members.assert_not_called()
+
+    def test_sync(self, mocker: MockFixture, fx_mock_ssc_diff: SyncDiff, fx_mock_rsc: RoleSyncClient) -> None:
+        """Can sync users to role."""
+        fx_mock_rsc._diff = fx_mock_ssc_diff
+        mock_set_role_members = mocker.patch.object(fx_mock_rsc.db_client, "set_role_members")
+
+        result = fx_mock_rsc.sync()
+
+        mock_set_role_members.assert_called_once_with(role_name="ods_read", grant=["bob"], revoke=["darren"])
+        assert result["present"] == ["alice", "bob"]
+        assert result["missing"] == []
+        assert result["remove"] == []
+
+    def test_sync_not_evaluated(self, mocker: MockFixture, fx_mock_rsc: RoleSyncClient) -> None:
+        """Sync is evaluated first if needed."""
+        mock_evaluate = mocker.patch.object(
+            fx_mock_rsc, "evaluate", side_effect=lambda: setattr(fx_mock_rsc, "_diff", SyncDiff())
+        )
+        mocker.patch.object(fx_mock_rsc.db_client, "set_role_members")
+
+        fx_mock_rsc.sync()
+
+        mock_evaluate.assert_called_once()
+
+
+class TestMultiSyncClient:
+    """Tests for multi-target sync client."""
+
+    def test_load_mapping(self, tmp_path: Path) -> None:
+        """Can load mapping from file."""
+        path = tmp_path / "mapping.json"
+        path.write_text('{"abc": ["123", "456"], "def": ["456"]}')
+
+        assert MultiSyncClient.load_mapping(path=path) == {"abc": ["123", "456"], "def": ["456"]}
+
+    @pytest.mark.parametrize("content", ["x", "[]", "{}", '{"abc": []}', '{"abc": "123"}', '{"abc": [1]}'])
+    def test_load_mapping_invalid(self, tmp_path: Path, content: str) -> None:
+        """Invalid mapping files are rejected."""
+        path = tmp_path / "mapping.json"
+        path.write_text(content)
+
+        with pytest.raises(RuntimeError, match="sync mapping file"):
+            MultiSyncClient.load_mapping(path=path)
+
+    def test_evaluate(self, mocker: MockFixture, fx_mock_msc: MultiSyncClient) -> None:
+        """Distinct source groups are fetched once and shared between targets."""
+        mocker.patch.object(fx_mock_msc.azure_client, "check_groups", return_value=["123", "456"])
+        mock_get_groups_members = mocker.patch.object(
+            fx_mock_msc.azure_client,
+            "get_groups_members",
+            return_value={"123": ["alice@example.com"], "456": ["bob@example.com"]},
+        )
+        mock_evaluate = mocker.patch.object(SimpleSyncClient, "evaluate", return_value={"x": []})
+
+        result = fx_mock_msc.evaluate()
+
+        assert result == {"abc": {"x": []}, "def": {"x": []}}
+        mock_get_groups_members.assert_called_once_with(group_ids=["123", "456"])
+        assert mock_evaluate.call_count == 2
+        assert fx_mock_msc._clients["def"]._source_members == {"456": ["bob@example.com"]}
+        assert fx_mock_msc._clients["def"].ldap_client is fx_mock_msc.ldap_client
+
+    def test_evaluate_missing_azure(self, mocker: MockFixture, fx_mock_msc: MultiSyncClient) -> None:
+        """Fails where Azure group missing."""
+        mocker.patch.object(fx_mock_msc.azure_client, "check_groups", return_value=["123"])
+
+        with pytest.raises(RuntimeError, match="Azure group 456 does not exist."):
+            fx_mock_msc.evaluate()
+
+    def test_sync_ok(self, mocker: MockFixture, fx_mock_msc: MultiSyncClient) -> None:
+        """Can sync all targets, evaluating first if needed."""
+        mock_evaluate = mocker.patch.object(
+            fx_mock_msc,
+            "evaluate",
+            side_effect=lambda: fx_mock_msc._clients.update(abc=mocker.Mock(**{"sync.return_value": {"x": []}})),
+        )
+
+        result = fx_mock_msc.sync()
+
+        assert result == {"abc": {"x": []}}
+        mock_evaluate.assert_called_once()
+
+    def test_sync_failed(self, mocker: MockFixture, fx_mock_msc: MultiSyncClient) -> None:
+        """Other targets are synced before failed targets are reported."""
+        fx_mock_msc._clients = {
+            "abc": mocker.Mock(**{"sync.side_effect": RuntimeError("x")}),
+            "def": mocker.Mock(**{"sync.return_value": {"x": []}}),
+        }
+
+        with pytest.raises(RuntimeError, match="Failed to sync LDAP group abc."):
+            fx_mock_msc.sync()
+
+        fx_mock_msc._clients["def"].sync.assert_called_once()
+
+
+class TestDeltaSyncState:
+    """Tests for incremental sync state."""
+
+    def test_load_missing(self, tmp_path: Path) -> None:
+        """Empty state is returned if file does not exist."""
+        state = DeltaSyncState.load(path=tmp_path.joinpath("x.json"), target="abc")
+
+        assert state == DeltaSyncState()
+
+    def test_dump_load(self, tmp_path: Path, fx_mock_isc_state: DeltaSyncState) -> None:
+        """State can be saved and loaded, keeping state for other targets."""
+        path = tmp_path.joinpath("x.json")
+        other = DeltaSyncState(reconciled_at=datetime.now(tz=timezone.utc), groups={"456": DeltaSyncGroupState("y")})
+        other.dump(path=path, target="def")
+
+        fx_mock_isc_state.dump(path=path, target="abc")
+
+        assert DeltaSyncState.load(path=path, target="abc") == fx_mock_isc_state
+        assert DeltaSyncState.load(path=path, target="def") == other
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_dump_created_private(self, mocker: MockFixture, tmp_path: Path, fx_mock_isc_state: DeltaSyncState) -> None:
+        """State file is created only readable by the current user, rather than restricted after writing."""
+        path = tmp_path.joinpath("x.json")
+        mock_open = mocker.patch("ops_data_store.auth.os.open", wraps=os.open)
+        mock_chmod = mocker.patch.object(Path, "chmod")
+
+        fx_mock_isc_state.dump(path=path, target="abc")
+
+        mock_open.assert_called_once_with(path.with_name("x.json.tmp"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        mock_chmod.assert_not_called()
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_user_ids(self, fx_mock_isc_state: DeltaSyncState) -> None:
+        """Members can be returned as usernames."""
+        assert fx_mock_isc_state.user_ids == {"alice", "darren"}
+
+
+class TestIncrementalSyncClient:
+    """Tests for incremental Azure to LDAP group sync client."""
+
+    def test_init(self, fx_mock_isc: IncrementalSyncClient) -> None:
+        """Can be initialised with previous state."""
+        assert isinstance(fx_mock_isc, IncrementalSyncClient)
+        assert fx_mock_isc.reconcile is False
+
+    def test_init_no_state(
+        self,
+        mocker: MockFixture,
+        tmp_path: Path,
+        fx_mock_ssc_azure_group_ids: list[str],
+        fx_mock_ssc_ldap_group_id: str,
+    ) -> None:
+        """Full reconciliation needed if no previous state."""
+        mocker.patch("ops_data_store.auth.AzureClient", autospec=True)
+        mocker.patch("ops_data_store.auth.LDAPClient", autospec=True)
+
+        client = IncrementalSyncClient(
+            azure_group_ids=fx_mock_ssc_azure_group_ids,
+            ldap_group_id=fx_mock_ssc_ldap_group_id,
+            state_path=tmp_path.joinpath("x.json"),
+            reconcile_interval=86400,
+        )
+
+        assert client.reconcile is True
+
+    def test_needs_reconcile(self, fx_mock_isc: IncrementalSyncClient) -> None:
+        """Full reconciliation needed if source groups change or interval has elapsed."""
+        assert fx_mock_isc._needs_reconcile() is False
+
+        fx_mock_isc._source_group_ids = ["123", "456"]
+        assert fx_mock_isc._needs_reconcile() is True
+
+        fx_mock_isc._source_group_ids = ["123"]
+        fx_mock_isc._state.reconciled_at -= timedelta(days=2)
+        assert fx_mock_isc._needs_reconcile() is True
+
+    def test_get_source_user_ids(self, mocker: MockFixture, fx_mock_isc: IncrementalSyncClient) -> None:
+        """Applies changes to previous state, only getting UPNs of new members."""
+        mocker.patch.object(
+            fx_mock_isc.azure_client,
+            "get_groups_members_delta",
+            return_value={"123": GroupMembersDelta(added=["2", "3"], removed=["4"], delta_link="y", full=False)},
+        )
+        mock_upns = mocker.patch.object(
+            fx_mock_isc.azure_client,
+            "get_users_upns",
+            return_value={"2": "bob@example.com", "3": "connie@example.com"},
+        )
+
+        fx_mock_isc._get_source_user_ids()
+
+        mock_upns.assert_called_once_with(user_ids=["2", "3"])
+        assert fx_mock_isc._source_user_ids == {"alice", "bob", "connie"}
+        assert fx_mock_isc._user_ids_added_in_source == {"bob", "connie"}
+        assert fx_mock_isc._user_ids_removed_in_source == {"darren"}
+        assert fx_mock_isc._pending_state.groups["123"].delta_link == "y"
+
+    def test_evaluate(
+        self,
+        mocker: MockFixture,
+        fx_mock_isc: IncrementalSyncClient,
+        fx_se_mock_ldap_check_users: Callable,
+    ) -> None:
+        """
+        Evaluates only changes since last sync.
+
+        Key to users:
+        - alice: present (in source and target, unchanged)
+        - bob: missing (added to source)
+        - connie: unknown (added to source, not in target)
+        - darren: removed (removed from source)
+        - eve: in target but not source, not removed until reconciled
+        """
+        mocker.patch.object(fx_mock_isc.azure_client, "check_groups", return_value=fx_mock_isc._source_group_ids)
+        mocker.patch.object(
+            fx_mock_isc.azure_client,
+            "get_groups_members_delta",
+            return_value={"123": GroupMembersDelta(added=["2", "3"], removed=["4"], delta_link="y", full=False)},
+        )
+        mocker.patch.object(
+            fx_mock_isc.azure_client,
+            "get_users_upns",
+            return_value={"2": "bob@example.com", "3": "connie@example.com"},
+        )
+        mocker.patch.object(
+            fx_mock_isc.ldap_client, "check_groups", return_value=["cn=abc,ou=groups,dc=example,dc=com"]
+        )
+        mocker.patch.object(
+            fx_mock_isc.ldap_client,
+            "get_group_members",
+            return_value=[f"cn={user},ou=users,dc=example,dc=com" for user in ["alice", "darren", "eve"]],
+        )
+        mock_check_users = mocker.patch.object(
+            fx_mock_isc.ldap_client, "check_users", side_effect=fx_se_mock_ldap_check_users
+        )
+
+        result = fx_mock_isc.evaluate()
+
+        assert result["present"] == ["alice"]
+        assert result["missing"] == ["bob"]
+        assert result["unknown"] == ["connie"]
+        assert result["remove"] == ["darren"]
+        mock_check_users.assert_called_once_with(user_ids=["cn=bob", "cn=connie", "cn=darren"])
+
+    def test_sync_saves_state(self, mocker: MockFixture, fx_mock_isc: IncrementalSyncClient) -> None:
+        """State is saved once synced."""
+        pending = DeltaSyncState(reconciled_at=datetime.now(tz=timezone.utc), groups={"123": DeltaSyncGroupState("y")})
+        fx_mock_isc._pending_state = pending
+        fx_mock_isc._diff = SyncDiff()
+        mocker.patch.object(fx_mock_isc.ldap_client, "add_to_group", return_value=[])
+        mocker.patch.object(fx_mock_isc.ldap_client, "remove_from_group", return_value=[])
+
+        fx_mock_isc.sync()
+
+        assert DeltaSyncState.load(path=fx_mock_isc._state_path, target=fx_mock_isc._target_group_id) == pending
+        assert fx_mock_isc._state == pending
+
+    def test_sync_failed_no_state(
+        self, mocker: MockFixture, fx_mock_isc: IncrementalSyncClient, fx_mock_isc_state: DeltaSyncState
+    ) -> None:
+        """State is not saved if any users cannot be synced, so changes are retried."""
+        fx_mock_isc._pending_state = DeltaSyncState(groups={"123": DeltaSyncGroupState("y")})
+        fx_mock_isc._diff = SyncDiff()
+        mocker.patch.object(fx_mock_isc.ldap_client, "add_to_group", return_value=["cn=bob,ou=users,dc=example,dc=com"])
+        mocker.patch.object(fx_mock_isc.ldap_client, "remove_from_group", return_value=[])
+
+        with pytest.raises(RuntimeError):
+            fx_mock_isc.sync()
+
+        assert (
+            DeltaSyncState.load(path=fx_mock_isc._state_path, target=fx_mock_isc._target_group_id) == fx_mock_isc_state
+        )
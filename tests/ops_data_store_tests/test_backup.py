@@ -528,6 +528,28 @@ class TestRollingFile:
             assert expected_file.exists() is True
             assert file_set._state.iteration_count == 1
 
+    def test_sizes(self, fx_rfs_max_iterations: int) -> None:
+        """Can get number and size of iterations in file set."""
+        with TemporaryDirectory() as workspace:
+            workspace_path = Path(workspace)
+            original_file = workspace_path.joinpath("original.txt")
+            file_set = RollingFileSet(
+                workspace_path=workspace_path, base_name="foo.txt", max_iterations=fx_rfs_max_iterations
+            )
+
+            assert file_set.iteration_count == 0
+            assert file_set.size == 0
+            assert file_set.newest_size == 0
+
+            original_file.write_text("test")
+            file_set.add(path=original_file)
+            original_file.write_text("test2")
+            file_set.add(path=original_file)
+
+            assert file_set.iteration_count == 2
+            assert file_set.size == 9
+            assert file_set.newest_size == 5
+
     def test_add_not_file(self, fx_rfs_max_iterations: int) -> None:
         """Errors if not adding a file."""
         with TemporaryDirectory() as workspace:
@@ -555,6 +577,10 @@ class TestBackupClient:
 
         assert isinstance(client, BackupClient)
 
+    def test_backup_sets(self, fx_backup_client: BackupClient):
+        """Can get backup sets."""
+        assert list(fx_backup_client.backup_sets.keys()) == ["db", "data"]
+
     def test_backup(self, caplog: pytest.LogCaptureFixture, fx_backup_client: BackupClient):
         """Can create backups."""
         with TemporaryDirectory() as workspace:
@@ -25,6 +25,22 @@ class TestConfig:
 
         assert True
 
+    def test_shared(self, fx_test_config: Config) -> None:
+        """Options are parsed once and shared between instances."""
+        assert Config()._settings is fx_test_config._settings
+
+    def test_reload(self, fx_test_config: Config) -> None:
+        """Options are only parsed again when reloaded."""
+        db_dsn = environ["APP_ODS_DB_DSN"]
+        environ["APP_ODS_DB_DSN"] = "postgresql://x"
+
+        assert db_dsn == fx_test_config.DB_DSN
+        fx_test_config.reload()
+        assert fx_test_config.DB_DSN == "postgresql://x"
+
+        environ["APP_ODS_DB_DSN"] = db_dsn
+        fx_test_config.reload()
+
 
 class TestConfigVersion:
     """Tests for `VERSION` property."""
@@ -45,22 +61,26 @@ class TestConfigDbDsn:
         """Missing property raises exception."""
         db_dsn = environ["APP_ODS_DB_DSN"]
         del environ["APP_ODS_DB_DSN"]
+        fx_test_config.reload()
 
         with pytest.raises(EnvError):
             # noinspection PyStatementEffect
             fx_test_config.DB_DSN  # noqa: B018
 
         environ["APP_ODS_DB_DSN"] = db_dsn
+        fx_test_config.reload()
 
     def test_validate_error(self, fx_test_config: Config) -> None:
         """Missing property fails validation."""
         db_dsn = environ["APP_ODS_DB_DSN"]
         del environ["APP_ODS_DB_DSN"]
+        fx_test_config.reload()
 
         with pytest.raises(RuntimeError, match="Required config option `DB_DSN` not set."):
             fx_test_config.validate()
 
         environ["APP_ODS_DB_DSN"] = db_dsn
+        fx_test_config.reload()
 
 
 class TestConfigAuthAzureAuthority:
@@ -74,10 +94,12 @@ class TestConfigAuthAzureAuthority:
         """Missing property uses None as default."""
         authority = environ["APP_ODS_AUTH_AZURE_AUTHORITY"]
         del environ["APP_ODS_AUTH_AZURE_AUTHORITY"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_AZURE_AUTHORITY is None
 
         environ["APP_ODS_AUTH_AZURE_AUTHORITY"] = authority
+        fx_test_config.reload()
 
 
 class TestConfigAuthAzureClientId:
@@ -91,10 +113,12 @@ class TestConfigAuthAzureClientId:
         """Missing property uses None as default."""
         client_id = environ["APP_ODS_AUTH_AZURE_CLIENT_ID"]
         del environ["APP_ODS_AUTH_AZURE_CLIENT_ID"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_AZURE_CLIENT_ID is None
 
         environ["APP_ODS_AUTH_AZURE_CLIENT_ID"] = client_id
+        fx_test_config.reload()
 
 
 class TestConfigAuthAzureClientSecret:
@@ -108,10 +132,12 @@ class TestConfigAuthAzureClientSecret:
         """Missing property uses None as default."""
         client_secret = environ["APP_ODS_AUTH_AZURE_CLIENT_SECRET"]
         del environ["APP_ODS_AUTH_AZURE_CLIENT_SECRET"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_AZURE_CLIENT_SECRET is None
 
         environ["APP_ODS_AUTH_AZURE_CLIENT_SECRET"] = client_secret
+        fx_test_config.reload()
 
 
 class TestConfigAuthAzureScopes:
@@ -122,6 +148,43 @@ class TestConfigAuthAzureScopes:
         assert fx_test_auth_azure_scopes == fx_test_config.AUTH_AZURE_SCOPES
 
 
+class TestConfigAuthAzureTokenCachePath:
+    """Tests for `AUTH_AZURE_TOKEN_CACHE_PATH` property."""
+
+    def test_ok(self, fx_test_config: Config) -> None:
+        """Property uses None as default."""
+        assert fx_test_config.AUTH_AZURE_TOKEN_CACHE_PATH is None
+
+    def test_set(self, fx_test_config: Config) -> None:
+        """Property can be set."""
+        expected = Path("./azure-token-cache.json")
+        environ["APP_ODS_AUTH_AZURE_TOKEN_CACHE_PATH"] = str(expected)
+        fx_test_config.reload()
+
+        assert expected == fx_test_config.AUTH_AZURE_TOKEN_CACHE_PATH
+
+        del environ["APP_ODS_AUTH_AZURE_TOKEN_CACHE_PATH"]
+        fx_test_config.reload()
+
+
+class TestConfigAuthDbSyncIgnoredUsers:
+    """Tests for `AUTH_DB_SYNC_IGNORED_USERS` property."""
+
+    def test_ok(self, fx_test_config: Config) -> None:
+        """Property uses no users as default."""
+        assert fx_test_config.AUTH_DB_SYNC_IGNORED_USERS == ()
+
+    def test_set(self, fx_test_config: Config) -> None:
+        """Property can be set."""
+        environ["APP_ODS_AUTH_DB_SYNC_IGNORED_USERS"] = "ops_data_store_app,test_user_ods_read"
+        fx_test_config.reload()
+
+        assert fx_test_config.AUTH_DB_SYNC_IGNORED_USERS == ("ops_data_store_app", "test_user_ods_read")
+
+        del environ["APP_ODS_AUTH_DB_SYNC_IGNORED_USERS"]
+        fx_test_config.reload()
+
+
 class TestConfigAuthMsGraphEndpoint:
     """Tests for `AUTH_MS_GRAPH_ENDPOINT` property."""
 
@@ -130,6 +193,43 @@ class TestConfigAuthMsGraphEndpoint:
         assert fx_test_auth_ms_graph_endpoint == fx_test_config.AUTH_MS_GRAPH_ENDPOINT
 
 
+class TestConfigAuthSyncReconcileInterval:
+    """Tests for `AUTH_SYNC_RECONCILE_INTERVAL` property."""
+
+    def test_ok(self, fx_test_auth_sync_reconcile_interval: int, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_auth_sync_reconcile_interval == fx_test_config.AUTH_SYNC_RECONCILE_INTERVAL
+
+    def test_override(self, fx_test_config: Config) -> None:
+        """Default can be overridden."""
+        environ["APP_ODS_AUTH_SYNC_RECONCILE_INTERVAL"] = "60"
+        fx_test_config.reload()
+
+        assert fx_test_config.AUTH_SYNC_RECONCILE_INTERVAL == 60
+
+        del environ["APP_ODS_AUTH_SYNC_RECONCILE_INTERVAL"]
+        fx_test_config.reload()
+
+
+class TestConfigAuthSyncStatePath:
+    """Tests for `AUTH_SYNC_STATE_PATH` property."""
+
+    def test_ok(self, fx_test_auth_sync_state_path: Path, fx_test_config: Config) -> None:
+        """Property check."""
+        assert fx_test_auth_sync_state_path == fx_test_config.AUTH_SYNC_STATE_PATH
+
+    def test_missing(self, fx_test_config: Config) -> None:
+        """Missing property uses None as default."""
+        path = environ["APP_ODS_AUTH_SYNC_STATE_PATH"]
+        del environ["APP_ODS_AUTH_SYNC_STATE_PATH"]
+        fx_test_config.reload()
+
+        assert fx_test_config.AUTH_SYNC_STATE_PATH is None
+
+        environ["APP_ODS_AUTH_SYNC_STATE_PATH"] = path
+        fx_test_config.reload()
+
+
 class TestConfigAuthLdapUrl:
     """Tests for `AUTH_LDAP_URL` property."""
 
@@ -141,10 +241,12 @@ class TestConfigAuthLdapUrl:
         """Missing property uses None as default."""
         ldap_url = environ["APP_ODS_AUTH_LDAP_URL"]
         del environ["APP_ODS_AUTH_LDAP_URL"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_LDAP_URL is None
 
         environ["APP_ODS_AUTH_LDAP_URL"] = ldap_url
+        fx_test_config.reload()
 
 
 class TestConfigAuthLdapBaseDn:
@@ -158,10 +260,12 @@ class TestConfigAuthLdapBaseDn:
         """Missing property uses None as default."""
         ldap_base_dn = environ["APP_ODS_AUTH_LDAP_BASE_DN"]
         del environ["APP_ODS_AUTH_LDAP_BASE_DN"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_LDAP_BASE_DN is None
 
         environ["APP_ODS_AUTH_LDAP_BASE_DN"] = ldap_base_dn
+        fx_test_config.reload()
 
 
 class TestConfigAuthLdapBindDn:
@@ -175,10 +279,12 @@ class TestConfigAuthLdapBindDn:
         """Missing property uses None as default."""
         ldap_bind_dn = environ["APP_ODS_AUTH_LDAP_BIND_DN"]
         del environ["APP_ODS_AUTH_LDAP_BIND_DN"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_LDAP_BIND_DN is None
 
         environ["APP_ODS_AUTH_LDAP_BIND_DN"] = ldap_bind_dn
+        fx_test_config.reload()
 
 
 class TestConfigAuthLdapBindPassword:
@@ -192,10 +298,121 @@ class TestConfigAuthLdapBindPassword:
         """Missing property uses None as default."""
         ldap_bind_password = environ["APP_ODS_AUTH_LDAP_BIND_PASSWORD"]
         del environ["APP_ODS_AUTH_LDAP_BIND_PASSWORD"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_LDAP_BIND_PASSWORD is None
 
         environ["APP_ODS_AUTH_LDAP_BIND_PASSWORD"] = ldap_bind_password
+        fx_test_config.reload()
+
+
+class TestConfigAuthLdapModifyBatchSize:
+    """Tests for `AUTH_LDAP_MODIFY_BATCH_SIZE` property."""
+
+    def test_ok(self, fx_test_auth_ldap_modify_batch_size: int, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_auth_ldap_modify_batch_size == fx_test_config.AUTH_LDAP_MODIFY_BATCH_SIZE
+
+    def test_override(self, fx_test_config: Config) -> None:
+        """Default can be overridden."""
+        environ["APP_ODS_AUTH_LDAP_MODIFY_BATCH_SIZE"] = "50"
+        fx_test_config.reload()
+
+        assert fx_test_config.AUTH_LDAP_MODIFY_BATCH_SIZE == 50
+
+        del environ["APP_ODS_AUTH_LDAP_MODIFY_BATCH_SIZE"]
+        fx_test_config.reload()
+
+
+class TestConfigAuthLdapNetworkTimeout:
+    """Tests for `AUTH_LDAP_NETWORK_TIMEOUT` property."""
+
+    def test_ok(self, fx_test_auth_ldap_network_timeout: int, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_auth_ldap_network_timeout == fx_test_config.AUTH_LDAP_NETWORK_TIMEOUT
+
+    def test_override(self, fx_test_config: Config) -> None:
+        """Default can be overridden."""
+        environ["APP_ODS_AUTH_LDAP_NETWORK_TIMEOUT"] = "5"
+        fx_test_config.reload()
+
+        assert fx_test_config.AUTH_LDAP_NETWORK_TIMEOUT == 5
+
+        del environ["APP_ODS_AUTH_LDAP_NETWORK_TIMEOUT"]
+        fx_test_config.reload()
+
+
+class TestConfigAuthLdapRetryMax:
+    """Tests for `AUTH_LDAP_RETRY_MAX` property."""
+
+    def test_ok(self, fx_test_auth_ldap_retry_max: int, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_auth_ldap_retry_max == fx_test_config.AUTH_LDAP_RETRY_MAX
+
+    def test_override(self, fx_test_config: Config) -> None:
+        """Default can be overridden."""
+        environ["APP_ODS_AUTH_LDAP_RETRY_MAX"] = "1"
+        fx_test_config.reload()
+
+        assert fx_test_config.AUTH_LDAP_RETRY_MAX == 1
+
+        del environ["APP_ODS_AUTH_LDAP_RETRY_MAX"]
+        fx_test_config.reload()
+
+
+class TestConfigAuthLdapStartTls:
+    """Tests for `AUTH_LDAP_START_TLS` property."""
+
+    def test_ok(self, fx_test_auth_ldap_start_tls: bool, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_auth_ldap_start_tls == fx_test_config.AUTH_LDAP_START_TLS
+
+    def test_override(self, fx_test_config: Config) -> None:
+        """Default can be overridden."""
+        environ["APP_ODS_AUTH_LDAP_START_TLS"] = "true"
+        fx_test_config.reload()
+
+        assert fx_test_config.AUTH_LDAP_START_TLS is True
+
+        del environ["APP_ODS_AUTH_LDAP_START_TLS"]
+        fx_test_config.reload()
+
+
+class TestConfigAuthLdapTimeout:
+    """Tests for `AUTH_LDAP_TIMEOUT` property."""
+
+    def test_ok(self, fx_test_auth_ldap_timeout: int, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_auth_ldap_timeout == fx_test_config.AUTH_LDAP_TIMEOUT
+
+    def test_override(self, fx_test_config: Config) -> None:
+        """Default can be overridden."""
+        environ["APP_ODS_AUTH_LDAP_TIMEOUT"] = "60"
+        fx_test_config.reload()
+
+        assert fx_test_config.AUTH_LDAP_TIMEOUT == 60
+
+        del environ["APP_ODS_AUTH_LDAP_TIMEOUT"]
+        fx_test_config.reload()
+
+
+class TestConfigAuthLdapTlsCaCertPath:
+    """Tests for `AUTH_LDAP_TLS_CA_CERT_PATH` property."""
+
+    def test_ok(self, fx_test_config: Config) -> None:
+        """Property uses None as default."""
+        assert fx_test_config.AUTH_LDAP_TLS_CA_CERT_PATH is None
+
+    def test_set(self, fx_test_config: Config) -> None:
+        """Property can be set."""
+        expected = Path("./ca.pem")
+        environ["APP_ODS_AUTH_LDAP_TLS_CA_CERT_PATH"] = str(expected)
+        fx_test_config.reload()
+
+        assert expected == fx_test_config.AUTH_LDAP_TLS_CA_CERT_PATH
+
+        del environ["APP_ODS_AUTH_LDAP_TLS_CA_CERT_PATH"]
+        fx_test_config.reload()
 
 
 class TestConfigAuthLdapOuUsers:
@@ -209,10 +426,12 @@ class TestConfigAuthLdapOuUsers:
         """Missing property uses None as default."""
         ldap_ou_users = environ["APP_ODS_AUTH_LDAP_OU_USERS"]
         del environ["APP_ODS_AUTH_LDAP_OU_USERS"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_LDAP_OU_USERS is None
 
         environ["APP_ODS_AUTH_LDAP_OU_USERS"] = ldap_ou_users
+        fx_test_config.reload()
 
 
 class TestConfigAuthLdapOuGroups:
@@ -226,10 +445,12 @@ class TestConfigAuthLdapOuGroups:
         """Missing property uses None as default."""
         ldap_ou_groups = environ["APP_ODS_AUTH_LDAP_OU_GROUPS"]
         del environ["APP_ODS_AUTH_LDAP_OU_GROUPS"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_LDAP_OU_GROUPS is None
 
         environ["APP_ODS_AUTH_LDAP_OU_GROUPS"] = ldap_ou_groups
+        fx_test_config.reload()
 
 
 class TestConfigAuthLdapNameContextUsers:
@@ -243,10 +464,12 @@ class TestConfigAuthLdapNameContextUsers:
         """Missing property uses None as default."""
         ldap_name_context_users = environ["APP_ODS_AUTH_LDAP_CXT_USERS"]
         del environ["APP_ODS_AUTH_LDAP_CXT_USERS"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_LDAP_NAME_CONTEXT_USERS is None
 
         environ["APP_ODS_AUTH_LDAP_CXT_USERS"] = ldap_name_context_users
+        fx_test_config.reload()
 
 
 class TestConfigAuthLdapNameContextGroups:
@@ -260,10 +483,12 @@ class TestConfigAuthLdapNameContextGroups:
         """Missing property uses None as default."""
         ldap_name_context_groups = environ["APP_ODS_AUTH_LDAP_CXT_GROUPS"]
         del environ["APP_ODS_AUTH_LDAP_CXT_GROUPS"]
+        fx_test_config.reload()
 
         assert fx_test_config.AUTH_LDAP_NAME_CONTEXT_GROUPS is None
 
         environ["APP_ODS_AUTH_LDAP_CXT_GROUPS"] = ldap_name_context_groups
+        fx_test_config.reload()
 
 
 class TestConfigDataManagedSchemaName:
@@ -285,22 +510,26 @@ class TestConfigDataManagedTableNames:
         """Missing property raises exception."""
         table_names = environ["APP_ODS_DATA_MANAGED_TABLE_NAMES"]
         del environ["APP_ODS_DATA_MANAGED_TABLE_NAMES"]
+        fx_test_config.reload()
 
         with pytest.raises(EnvError):
             # noinspection PyStatementEffect
             fx_test_config.DATA_MANAGED_TABLE_NAMES  # noqa: B018
 
         environ["APP_ODS_DATA_MANAGED_TABLE_NAMES"] = table_names
+        fx_test_config.reload()
 
     def test_validate_error(self, fx_test_config: Config) -> None:
         """Missing property fails validation."""
         table_names = environ["APP_ODS_DATA_MANAGED_TABLE_NAMES"]
         del environ["APP_ODS_DATA_MANAGED_TABLE_NAMES"]
+        fx_test_config.reload()
 
         with pytest.raises(RuntimeError, match="Required config option `DATA_MANAGED_TABLE_NAMES` not set."):
             fx_test_config.validate()
 
         environ["APP_ODS_DATA_MANAGED_TABLE_NAMES"] = table_names
+        fx_test_config.reload()
 
 
 class TestDataQgisTableNames:
@@ -322,27 +551,32 @@ class TestConfigBackupPath:
         """Missing property raises exception."""
         path = environ["APP_ODS_BACKUPS_PATH"]
         del environ["APP_ODS_BACKUPS_PATH"]
+        fx_test_config.reload()
 
         with pytest.raises(EnvError):
             # noinspection PyStatementEffect
             fx_test_config.BACKUPS_PATH  # noqa: B018
 
         environ["APP_ODS_BACKUPS_PATH"] = path
+        fx_test_config.reload()
 
     def test_validate_error_missing(self, fx_test_config: Config) -> None:
         """Missing property fails validation."""
         path = environ["APP_ODS_BACKUPS_PATH"]
         del environ["APP_ODS_BACKUPS_PATH"]
+        fx_test_config.reload()
 
         with pytest.raises(RuntimeError, match="Required config option `BACKUPS_PATH` not set."):
             fx_test_config.validate()
 
         environ["APP_ODS_BACKUPS_PATH"] = path
+        fx_test_config.reload()
 
     def test_validate_error_not_dir(self, fx_test_config: Config) -> None:
         """Missing property fails validation."""
         path = environ["APP_ODS_BACKUPS_PATH"]
         environ["APP_ODS_BACKUPS_PATH"] = "/does-not-exist"
+        fx_test_config.reload()
 
         with pytest.raises(
             RuntimeError, match="`BACKUPS_PATH` config value: '/does-not-exist' not a directory or does not exist."
@@ -350,6 +584,7 @@ class TestConfigBackupPath:
             fx_test_config.validate()
 
         environ["APP_ODS_BACKUPS_PATH"] = path
+        fx_test_config.reload()
 
 
 class TestConfigBackupCount:
@@ -363,32 +598,38 @@ class TestConfigBackupCount:
         """Missing property raises exception."""
         count = environ["APP_ODS_BACKUPS_COUNT"]
         del environ["APP_ODS_BACKUPS_COUNT"]
+        fx_test_config.reload()
 
         with pytest.raises(EnvError):
             # noinspection PyStatementEffect
             fx_test_config.BACKUPS_COUNT  # noqa: B018
 
         environ["APP_ODS_BACKUPS_COUNT"] = count
+        fx_test_config.reload()
 
     def test_validate_error_missing(self, fx_test_config: Config) -> None:
         """Missing property fails validation."""
         count = environ["APP_ODS_BACKUPS_COUNT"]
         del environ["APP_ODS_BACKUPS_COUNT"]
+        fx_test_config.reload()
 
         with pytest.raises(RuntimeError, match="Required config option `BACKUPS_COUNT` not set."):
             fx_test_config.validate()
 
         environ["APP_ODS_BACKUPS_COUNT"] = count
+        fx_test_config.reload()
 
     def test_validate_error_below_one(self, fx_test_config: Config) -> None:
         """Missing property fails validation."""
         count = environ["APP_ODS_BACKUPS_COUNT"]
         environ["APP_ODS_BACKUPS_COUNT"] = "0"
+        fx_test_config.reload()
 
         with pytest.raises(RuntimeError, match="`BACKUPS_COUNT` config value: '0' must be greater than 0."):
             fx_test_config.validate()
 
         environ["APP_ODS_BACKUPS_COUNT"] = count
+        fx_test_config.reload()
 
 
 class TestDataAirnetOutputPath:
@@ -402,27 +643,32 @@ class TestDataAirnetOutputPath:
         """Missing property raises exception."""
         path = environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"]
         del environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"]
+        fx_test_config.reload()
 
         with pytest.raises(EnvError):
             # noinspection PyStatementEffect
             fx_test_config.DATA_AIRNET_OUTPUT_PATH  # noqa: B018
 
         environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"] = path
+        fx_test_config.reload()
 
     def test_validate_error_missing(self, fx_test_config: Config) -> None:
         """Missing property fails validation."""
         path = environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"]
         del environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"]
+        fx_test_config.reload()
 
         with pytest.raises(RuntimeError, match="Required config option `DATA_AIRNET_OUTPUT_PATH` not set."):
             fx_test_config.validate()
 
         environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"] = path
+        fx_test_config.reload()
 
     def test_validate_error_not_dir(self, fx_test_config: Config) -> None:
         """Missing property fails validation."""
         path = environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"]
         environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"] = "/does-not-exist"
+        fx_test_config.reload()
 
         with pytest.raises(
             RuntimeError,
@@ -431,6 +677,7 @@ class TestDataAirnetOutputPath:
             fx_test_config.validate()
 
         environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"] = path
+        fx_test_config.reload()
 
 
 class TestDataAirnetRoutesTable:
@@ -455,3 +702,119 @@ class TestDataAirnetWaypointsTable:
     def test_ok(self, fx_test_data_airnet_waypoints_table: str, fx_test_config: Config) -> None:
         """Property can be read."""
         assert fx_test_data_airnet_waypoints_table == fx_test_config.DATA_AIRNET_WAYPOINTS_TABLE
+
+
+class TestServeBackupInterval:
+    """Tests for `SERVE_BACKUP_INTERVAL` property."""
+
+    def test_ok(self, fx_test_serve_backup_interval: int, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_serve_backup_interval == fx_test_config.SERVE_BACKUP_INTERVAL
+
+    def test_set(self, fx_test_config: Config) -> None:
+        """Property can be set."""
+        environ["APP_ODS_SERVE_BACKUP_INTERVAL"] = "60"
+        fx_test_config.reload()
+
+        assert fx_test_config.SERVE_BACKUP_INTERVAL == 60
+
+        del environ["APP_ODS_SERVE_BACKUP_INTERVAL"]
+        fx_test_config.reload()
+
+    def test_invalid(self, fx_test_config: Config) -> None:
+        """Invalid property fails validation."""
+        environ["APP_ODS_SERVE_BACKUP_INTERVAL"] = "x"
+        fx_test_config.reload()
+
+        with pytest.raises(EnvError):
+            # noinspection PyStatementEffect
+            fx_test_config.SERVE_BACKUP_INTERVAL  # noqa: B018
+        with pytest.raises(RuntimeError, match="Config option `SERVE_BACKUP_INTERVAL` not a valid number."):
+            fx_test_config.validate()
+
+        del environ["APP_ODS_SERVE_BACKUP_INTERVAL"]
+        fx_test_config.reload()
+
+    def test_validate_error(self, fx_test_config: Config) -> None:
+        """Negative property fails validation."""
+        environ["APP_ODS_SERVE_BACKUP_INTERVAL"] = "-1"
+        fx_test_config.reload()
+
+        with pytest.raises(RuntimeError, match="`SERVE_BACKUP_INTERVAL` config value: '-1' must be 0 or greater."):
+            fx_test_config.validate()
+
+        del environ["APP_ODS_SERVE_BACKUP_INTERVAL"]
+        fx_test_config.reload()
+
+
+class TestServeConvertInterval:
+    """Tests for `SERVE_CONVERT_INTERVAL` property."""
+
+    def test_ok(self, fx_test_serve_convert_interval: int, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_serve_convert_interval == fx_test_config.SERVE_CONVERT_INTERVAL
+
+
+class TestServeSocketPath:
+    """Tests for `SERVE_SOCKET_PATH` property."""
+
+    def test_ok(self, fx_test_serve_socket_path: Path, fx_test_config: Config) -> None:
+        """Property check."""
+        assert fx_test_serve_socket_path == fx_test_config.SERVE_SOCKET_PATH
+
+    def test_missing(self, fx_test_config: Config) -> None:
+        """Missing property uses None as default."""
+        path = environ["APP_ODS_SERVE_SOCKET_PATH"]
+        del environ["APP_ODS_SERVE_SOCKET_PATH"]
+        fx_test_config.reload()
+
+        assert fx_test_config.SERVE_SOCKET_PATH is None
+
+        environ["APP_ODS_SERVE_SOCKET_PATH"] = path
+        fx_test_config.reload()
+
+
+class TestServeSyncAzureGroups:
+    """Tests for `SERVE_SYNC_AZURE_GROUPS` property."""
+
+    def test_ok(self, fx_test_serve_sync_azure_groups: list[str], fx_test_config: Config) -> None:
+        """Property check."""
+        assert fx_test_serve_sync_azure_groups == fx_test_config.SERVE_SYNC_AZURE_GROUPS
+
+    def test_missing(self, fx_test_config: Config) -> None:
+        """Missing property uses empty list as default."""
+        groups = environ["APP_ODS_SERVE_SYNC_AZURE_GROUPS"]
+        del environ["APP_ODS_SERVE_SYNC_AZURE_GROUPS"]
+        fx_test_config.reload()
+
+        assert fx_test_config.SERVE_SYNC_AZURE_GROUPS == []
+
+        environ["APP_ODS_SERVE_SYNC_AZURE_GROUPS"] = groups
+        fx_test_config.reload()
+
+
+class TestServeSyncInterval:
+    """Tests for `SERVE_SYNC_INTERVAL` property."""
+
+    def test_ok(self, fx_test_serve_sync_interval: int, fx_test_config: Config) -> None:
+        """Property uses default if not set."""
+        assert fx_test_serve_sync_interval == fx_test_config.SERVE_SYNC_INTERVAL
+
+
+class TestServeSyncLdapGroup:
+    """Tests for `SERVE_SYNC_LDAP_GROUP` property."""
+
+    def test_ok(self, fx_test_serve_sync_ldap_group: str, fx_test_config: Config) -> None:
+        """Property check."""
+        assert fx_test_serve_sync_ldap_group == fx_test_config.SERVE_SYNC_LDAP_GROUP
+
+    def test_missing(self, fx_test_config: Config) -> None:
+        """Missing property uses None as default."""
+        group = environ["APP_ODS_SERVE_SYNC_LDAP_GROUP"]
+        del environ["APP_ODS_SERVE_SYNC_LDAP_GROUP"]
+        fx_test_config.reload()
+
+        assert fx_test_config.SERVE_SYNC_LDAP_GROUP is None
+
+        environ["APP_ODS_SERVE_SYNC_LDAP_GROUP"] = group
+        fx_test_config.reload()
@@ -138,7 +138,7 @@ class TestDataClient:
         caplog: pytest.LogCaptureFixture,
     ):
         """Convert succeeds."""
-        mocker.patch("ops_data_store.data.AirUnitNetworkClient.fetch", return_value=None)
+        mocker.patch("ops_data_store.data.AirUnitNetworkClient.fetch_async", return_value=None)
         mocker.patch("ops_data_store.data.AirUnitNetworkClient.export", return_value=None)
 
         output_path = environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"]
@@ -147,6 +147,7 @@ class TestDataClient:
             workspace_path = Path(workspace)
             test_file = workspace_path.joinpath("test.txt")
             environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"] = str(workspace_path)
+            fx_data_client.config.reload()
 
             # make a test file that will be removed
             test_file.touch()
@@ -159,3 +160,4 @@ class TestDataClient:
         assert "Conversion ok." in caplog.text
 
         environ["APP_ODS_DATA_AIRNET_OUTPUT_PATH"] = output_path
+        fx_data_client.config.reload()
@@ -1,15 +1,44 @@
+import asyncio
 from pathlib import Path
 from subprocess import CalledProcessError
-from unittest.mock import MagicMock
+from tempfile import TemporaryDirectory
+from unittest.mock import AsyncMock, MagicMock
 
-import psycopg
 import pytest
 from psycopg import ProgrammingError
-from psycopg.sql import SQL
+from psycopg.sql import SQL, Identifier
 from pytest_mock import MockFixture
 
-from ops_data_store.db import DBClient
+from ops_data_store.db import AsyncDBClient, DBClient, Migration
 from ops_data_store.db import Path as DBClientPath
+from ops_data_store.metrics import Metrics
+
+
+class TestMigration:
+    """Tests for DB migrations."""
+
+    def test_load(self) -> None:
+        """Can be loaded from a file."""
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "0001_foo_bar.sql"
+            path.write_text("SELECT 1;")
+
+            migration = Migration.load(path=path)
+
+        assert migration.version == "0001"
+        assert migration.name == "foo_bar"
+        assert migration.sql == "SELECT 1;"
+        assert len(migration.checksum) == 64
+
+    def test_bundled(self) -> None:
+        """Bundled migrations have unique versions."""
+        client = DBClient()
+
+        migrations = client._load_migrations()
+
+        assert len(migrations) > 0
+        assert len({migration.version for migration in migrations}) == len(migrations)
+        assert migrations[0].version == "0001"
 
 
 class TestDBClient:
@@ -53,64 +82,230 @@ class TestDBClient:
         with pytest.raises(RuntimeError, match="DB connection failed."):
             client.check()
 
+    @staticmethod
+    def _catalog_rows(client: DBClient) -> list[tuple[str, str]]:
+        """Catalog rows for all required objects."""
+        return [(kind, name) for kind, names in client._required_objects.items() for name in names]
+
     def test_setup_ok(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
-        """Setup succeeds."""
+        """Setup succeeds for a new database."""
+        client = DBClient()
+
         mock_cursor = MagicMock()
         mock_cursor.__enter__.return_value.fetchone.return_value = (1,)
+        mock_cursor.__enter__.return_value.fetchall.side_effect = [[], self._catalog_rows(client), []]
         mock_conn = MagicMock()
         mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
         mocker.patch("psycopg.connect", return_value=mock_conn)
 
-        client = DBClient()
-
         client.setup()
 
         assert "Setting up required database objects." in caplog.text
         assert "Setting up required DB extension 'postgis'." in caplog.text
         assert "Setting up required DB data type 'ddm_point'." in caplog.text
         assert "Setting up required DB function 'generate_ulid'." in caplog.text
+        assert "Setting up required DB function 'geom_as_ddm_x'." in caplog.text
+        assert "Setting up required DB function 'geom_as_ddm_y'." in caplog.text
+        assert "Required DB function 'geom_as_ddm_y' ok." in caplog.text
+        assert "Applying DB migration '0001_controlled_datasets'." in caplog.text
+
+    def test_setup_existing(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Setup does not recreate existing extensions or data types, but does replace functions."""
+        client = DBClient()
+        rows = self._catalog_rows(client)
+
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.fetchone.return_value = (1,)
+        mock_cursor.__enter__.return_value.fetchall.side_effect = [rows, rows, []]
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        client.setup()
+
+        assert "Required DB extension 'postgis' already exists." in caplog.text
+        assert "Setting up required DB extension 'postgis'." not in caplog.text
+        assert "Setting up required DB function 'generate_ulid'." in caplog.text
+        # catalog check, functions, verification, migrations table, migrations lock, migrations table check, applied
+        # migrations and then one statement and one record per migration
+        assert mock_cursor.__enter__.return_value.execute.call_count == 7 + 2 * len(client._load_migrations())
+
+    def test_plan_setup(self) -> None:
+        """Only missing extensions and data types are planned, with extensions first, and all functions."""
+        client = DBClient()
+        existing = {"extension": {"postgis", "pgcrypto"}, "data type": {"ddm_point"}, "function": {"generate_ulid"}}
+
+        statements = client._plan_setup(existing=existing)
+
+        assert statements[0] == "CREATE EXTENSION IF NOT EXISTS fuzzystrmatch;"
+        assert len(statements) == 1 + len(client._required_functions)
+        assert all(statement.strip().startswith("CREATE OR REPLACE FUNCTION") for statement in statements[1:])
+
+    @pytest.mark.parametrize(
+        ("kind", "name"),
+        [("extension", "postgis"), ("data type", "ddm_point"), ("function", "generate_ulid")],
+    )
+    def test_setup_fails(self, mocker: MockFixture, kind: str, name: str) -> None:
+        """Missing objects after setup raise error."""
+        client = DBClient()
+        rows = [row for row in self._catalog_rows(client) if row != (kind, name)]
+
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.fetchall.return_value = rows
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        with pytest.raises(RuntimeError, match=f"No. Required {kind} '{name}' not found."):
+            client.setup()
+
+    def test_migrations_pending(self, mocker: MockFixture) -> None:
+        """Pending migrations exclude those already applied."""
+        client = DBClient()
+        migrations = client._load_migrations()
+
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.fetchone.return_value = (True,)
+        mock_cursor.__enter__.return_value.fetchall.return_value = [(migrations[0].version, migrations[0].checksum)]
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        assert client.migrations_pending() == migrations[1:]
+
+    def test_migrations_pending_changed(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Applied migrations that have since changed are reported."""
+        client = DBClient()
+        migrations = client._load_migrations()
+
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.fetchone.return_value = (True,)
+        mock_cursor.__enter__.return_value.fetchall.return_value = [(migrations[0].version, "x")]
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        client.migrations_pending()
+
+        assert f"Applied migration '{migrations[0].version}_{migrations[0].name}' has changed" in caplog.text
+
+    def test_migrate_ok(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Migrate applies all migrations to a new database."""
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.fetchone.return_value = (False,)
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        client = DBClient()
+
+        applied = client.migrate()
+
+        assert applied == client._load_migrations()
+        assert "Applying DB migration '0001_controlled_datasets'." in caplog.text
+        assert "DB migration '0001_controlled_datasets' ok." in caplog.text
+
+    def test_migrate_fail(self, mocker: MockFixture) -> None:
+        """Failed migration raises error."""
+        client = DBClient()
+        migration = client._load_migrations()[0]
+
+        def _execute(query: str, *args: tuple) -> None:
+            if query == migration.sql:
+                raise ProgrammingError()
+
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.execute.side_effect = _execute
+        mock_cursor.__enter__.return_value.fetchone.return_value = (False,)
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        with pytest.raises(RuntimeError, match=f"No. Migration '{migration.version}_{migration.name}' failed"):
+            client.migrate()
+
+    def test_check_fk_indexes(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Foreign keys without supporting indexes are reported."""
+        missing = [("controlled.route_waypoint", "route_waypoint_waypoint_pid_fk", "waypoint_pid")]
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.fetchall.return_value = missing
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        client = DBClient()
 
-    def test_setup_extensions_fails(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
-        """Failed extensions setup raises error."""
+        assert client.check_fk_indexes() == missing
+        assert "Foreign key 'route_waypoint_waypoint_pid_fk' on 'controlled.route_waypoint'" in caplog.text
+
+    def test_check_roles(self, mocker: MockFixture) -> None:
+        """Existing roles are returned."""
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.fetchall.return_value = [("ods_read",)]
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        client = DBClient()
+
+        assert client.check_roles(role_names=["ods_read", "x"]) == ["ods_read"]
+        mock_cursor.__enter__.return_value.execute.assert_called_once()
+
+    def test_get_role_members(self, mocker: MockFixture) -> None:
+        """Users granted a role are returned."""
         mock_cursor = MagicMock()
-        mock_cursor.__enter__.return_value.fetchone.return_value = (0,)
+        mock_cursor.__enter__.return_value.fetchall.return_value = [("alice",), ("darren",)]
         mock_conn = MagicMock()
         mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
         mocker.patch("psycopg.connect", return_value=mock_conn)
 
         client = DBClient()
 
-        with pytest.raises(RuntimeError, match="No. Required extension 'postgis' not found."):  # noqa: SIM117
-            with psycopg.connect("") as conn, conn.cursor() as cur:
-                client._setup_extensions(cur=cur)
+        assert client.get_role_members(role_name="ods_read") == ["alice", "darren"]
+        assert "pg_auth_members" in mock_cursor.__enter__.return_value.execute.call_args.args[0]
 
-    def test_setup_data_types_fails(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
-        """Failed data types setup raises error."""
+    def test_set_role_members(self, mocker: MockFixture) -> None:
+        """Role is granted and revoked in batches within a single query."""
         mock_cursor = MagicMock()
-        mock_cursor.__enter__.return_value.fetchone.return_value = (0,)
         mock_conn = MagicMock()
         mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
         mocker.patch("psycopg.connect", return_value=mock_conn)
 
         client = DBClient()
+        client.role_batch_size = 2
+
+        client.set_role_members(role_name="ods_read", grant=["alice", "bob", "connie"], revoke=["darren"])
+
+        mock_cursor.__enter__.return_value.execute.assert_called_once()
+        query = mock_cursor.__enter__.return_value.execute.call_args.args[0]
+        assert query.as_string(None).split("\n") == [
+            'GRANT "ods_read" TO "alice", "bob";',
+            'GRANT "ods_read" TO "connie";',
+            'REVOKE "ods_read" FROM "darren";',
+        ]
+
+    def test_set_role_members_none(self, mocker: MockFixture) -> None:
+        """Database is not called if there are no changes."""
+        mock_connect = mocker.patch("psycopg.connect")
+
+        client = DBClient()
+
+        client.set_role_members(role_name="ods_read", grant=[], revoke=[])
 
-        with pytest.raises(RuntimeError, match="No. Required data type 'ddm_point' not found."):  # noqa: SIM117
-            with psycopg.connect("") as conn, conn.cursor() as cur:
-                client._setup_types(cur=cur)
+        mock_connect.assert_not_called()
 
-    def test_setup_functions_fails(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
-        """Failed functions setup raises error."""
+    def test_set_role_members_fail(self, mocker: MockFixture) -> None:
+        """Failed grant or revoke raises error."""
         mock_cursor = MagicMock()
-        mock_cursor.__enter__.return_value.fetchone.return_value = (0,)
+        mock_cursor.__enter__.return_value.execute.side_effect = ProgrammingError("x")
         mock_conn = MagicMock()
         mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
         mocker.patch("psycopg.connect", return_value=mock_conn)
 
         client = DBClient()
 
-        with pytest.raises(RuntimeError, match="No. Required function 'generate_ulid' not found."):  # noqa: SIM117
-            with psycopg.connect("") as conn, conn.cursor() as cur:
-                client._setup_functions(cur=cur)
+        with pytest.raises(RuntimeError, match="Failed to update members of DB role ods_read"):
+            client.set_role_members(role_name="ods_read", grant=["alice"], revoke=[])
 
     def test_execute(self, mocker: MockFixture):
         """Execute succeeds."""
@@ -162,3 +357,142 @@ class TestDBClient:
         client.fetch(query=SQL("SELECT 1;"))
 
         assert "Fetching from database." in caplog.text
+
+    @pytest.mark.usefixtures("_fx_reset_metrics")
+    def test_fetch_timed(self, mocker: MockFixture) -> None:
+        """Fetch is timed with the number of rows returned."""
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.fetchall.return_value = [(1,), (2,)]
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        client = DBClient()
+
+        # noinspection PyTypeChecker
+        client.fetch(query=SQL("SELECT 1;"))
+
+        assert Metrics.stats()["db.fetch"].rows == 2
+
+    def test_listen(self, mocker: MockFixture, caplog: pytest.LogCaptureFixture) -> None:
+        """Listens on channel using an autocommit connection."""
+        mock_conn = MagicMock()
+        mock_connect = mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        client = DBClient()
+
+        with client.listen(channel="x") as conn:
+            assert conn == mock_conn.__enter__.return_value
+
+        assert mock_connect.call_args.kwargs["autocommit"] is True
+        conn.execute.assert_called_once_with(SQL("LISTEN {}").format(Identifier("x")))
+        assert "Listening for DB notifications on channel 'x'." in caplog.text
+
+    def test_stream(self, mocker: MockFixture, caplog: pytest.LogCaptureFixture) -> None:
+        """Stream yields rows."""
+        mock_cursor = MagicMock()
+        mock_cursor.__enter__.return_value.stream.return_value = iter([(1,), (2,)])
+        mock_conn = MagicMock()
+        mock_conn.__enter__.return_value.cursor.return_value = mock_cursor
+        mocker.patch("psycopg.connect", return_value=mock_conn)
+
+        client = DBClient()
+
+        # noinspection PyTypeChecker
+        assert list(client.stream(query=SQL("SELECT 1;"))) == [(1,), (2,)]
+        assert "Streaming from database." in caplog.text
+
+
+class TestAsyncDBClient:
+    """Tests for app async database client."""
+
+    @staticmethod
+    def _mock_connect(mocker: MockFixture) -> MagicMock:
+        """Mock async connection, returning mock cursor."""
+        mock_cursor = MagicMock()
+        mock_cursor.execute = AsyncMock()
+        mock_cursor.fetchall = AsyncMock()
+        mock_conn = MagicMock()
+        mock_conn.__aenter__.return_value = mock_conn
+        mock_conn.cursor.return_value.__aenter__.return_value = mock_cursor
+        mocker.patch("psycopg.AsyncConnection.connect", new_callable=AsyncMock, return_value=mock_conn)
+        return mock_cursor
+
+    def test_init(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Can be initialised."""
+        client = AsyncDBClient()
+
+        assert "Creating async DB client." in caplog.text
+
+        assert isinstance(client, AsyncDBClient)
+
+    def test_check_ok(self, caplog: pytest.LogCaptureFixture, mocker: MockFixture) -> None:
+        """Check succeeds."""
+        self._mock_connect(mocker=mocker)
+
+        client = AsyncDBClient()
+
+        asyncio.run(client.check())
+
+        assert "DB connection ok." in caplog.text
+
+    def test_check_fail(self, mocker: MockFixture) -> None:
+        """Failed raises error."""
+        mock_cursor = self._mock_connect(mocker=mocker)
+        mock_cursor.execute.side_effect = ProgrammingError
+
+        client = AsyncDBClient()
+
+        with pytest.raises(RuntimeError, match="DB connection failed."):
+            asyncio.run(client.check())
+
+    @pytest.mark.usefixtures("_fx_reset_metrics")
+    def test_execute(self, mocker: MockFixture) -> None:
+        """Execute succeeds and is timed."""
+        mock_cursor = self._mock_connect(mocker=mocker)
+
+        client = AsyncDBClient()
+
+        asyncio.run(client.execute(query="SELECT 1;"))
+
+        mock_cursor.execute.assert_awaited_once_with("SELECT 1;")
+        assert Metrics.stats()["db.execute"].count == 1
+
+    def test_fetch(self, mocker: MockFixture, caplog: pytest.LogCaptureFixture) -> None:
+        """Fetch returns results."""
+        mock_cursor = self._mock_connect(mocker=mocker)
+        mock_cursor.fetchall.return_value = [(1,)]
+
+        client = AsyncDBClient()
+
+        # noinspection PyTypeChecker
+        assert asyncio.run(client.fetch(query=SQL("SELECT 1;"))) == [(1,)]
+        assert "Fetching from database." in caplog.text
+
+    @pytest.mark.usefixtures("_fx_reset_metrics")
+    def test_stream(self, mocker: MockFixture, caplog: pytest.LogCaptureFixture) -> None:
+        """Stream yields rows and is timed with the number of rows yielded."""
+        mock_cursor = self._mock_connect(mocker=mocker)
+        mock_cursor.stream.return_value.__aiter__.return_value = [(1,), (2,)]
+
+        client = AsyncDBClient()
+
+        async def _collect() -> list[tuple]:
+            # noinspection PyTypeChecker
+            return [row async for row in client.stream(query=SQL("SELECT 1;"))]
+
+        assert asyncio.run(_collect()) == [(1,), (2,)]
+        assert "Streaming from database." in caplog.text
+        assert Metrics.stats()["db.stream"].rows == 2
+
+
+@pytest.mark.db
+class TestDBScripts:
+    """Tests for SQL scripts run against the test database."""
+
+    def test_geom_as_ddm(self, fx_db_client_live: DBClient) -> None:
+        """DDM functions give identical results to the original `geom_as_ddm` implementation."""
+        script = Path(__file__).parent.parent / "resources" / "db" / "geom_as_ddm.sql"
+
+        # script raises an exception for any mismatched results
+        fx_db_client_live.execute(query=script.read_text())
@@ -0,0 +1,186 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from ops_data_store.metrics import JobMetrics, Metrics, OperationStats, Timing
+
+
+class TestOperationStats:
+    """Tests for combined operation timings."""
+
+    def test_add(self) -> None:
+        """Timings are combined."""
+        stats = OperationStats()
+
+        stats.add(Timing(name="x", duration=1, rows=2))
+        stats.add(Timing(name="x", duration=3, bytes=4))
+
+        assert stats == OperationStats(count=2, total=4, max=3, rows=2, bytes=4)
+
+    def test_str(self) -> None:
+        """Stats can be summarised."""
+        assert str(OperationStats(count=2, total=4, max=3)) == "2 call(s), 4.000s total, 3.000s max"
+        assert str(OperationStats(count=1, total=1, max=1, rows=2, bytes=3)).endswith(", 2 rows, 3 bytes")
+
+
+@pytest.mark.usefixtures("_fx_reset_metrics")
+class TestMetrics:
+    """Tests for process-wide operation metrics."""
+
+    def test_timed(self) -> None:
+        """Operations can be timed as a context manager."""
+        with Metrics.timed("x") as timing:
+            timing.rows = 2
+
+        stats = Metrics.stats()["x"]
+        assert stats.count == 1
+        assert stats.rows == 2
+        assert stats.total > 0
+
+    def test_timed_decorator(self) -> None:
+        """Operations can be timed as a decorator."""
+
+        @Metrics.timed("x")
+        def _operation() -> None:
+            pass
+
+        _operation()
+        _operation()
+
+        assert Metrics.stats()["x"].count == 2
+
+    def test_timed_fail(self) -> None:
+        """Failed operations are recorded."""
+        with pytest.raises(RuntimeError), Metrics.timed("x"):
+            raise RuntimeError()
+
+        assert Metrics.stats()["x"].count == 1
+
+    def test_reset(self) -> None:
+        """Recorded stats can be discarded."""
+        with Metrics.timed("x"):
+            pass
+
+        Metrics.reset()
+
+        assert Metrics.stats() == {}
+
+    def test_summary(self) -> None:
+        """Stats are summarised per operation, ordered by name."""
+        with Metrics.timed("y"):
+            pass
+        with Metrics.timed("x"):
+            pass
+
+        summary = Metrics.summary()
+
+        assert len(summary) == 2
+        assert summary[0].startswith("x: 1 call(s), ")
+
+    def test_dump(self, tmp_path: Path) -> None:
+        """Stats can be written to a JSON file."""
+        path = tmp_path / "metrics.json"
+        with Metrics.timed("x") as timing:
+            timing.bytes = 1
+
+        Metrics.dump(path=path)
+
+        data = json.loads(path.read_text())
+        assert data["x"]["count"] == 1
+        assert data["x"]["bytes"] == 1
+        assert data["x"]["rows"] is None
+
+
+@pytest.mark.usefixtures("_fx_reset_metrics")
+class TestJobMetrics:
+    """Tests for job metrics textfiles."""
+
+    def test_render(self) -> None:
+        """Job and operation metrics are formatted as OpenMetrics text."""
+        with Metrics.timed("data.export.foo") as timing:
+            timing.rows = 2
+        job = JobMetrics(job="x")
+        job.bytes_written = 3
+        job.backup_sets = {"db": (4, 5)}
+
+        text = job.render(success=True, duration=1.5)
+
+        assert "# TYPE ods_job_success gauge\n# HELP ods_job_success " in text
+        assert 'ods_job_success{ods_job="x"} 1\n' in text
+        assert 'ods_job_duration_seconds{ods_job="x"} 1.5\n' in text
+        assert 'ods_job_last_success_timestamp_seconds{ods_job="x"} ' in text
+        assert 'ods_job_written_bytes{ods_job="x"} 3\n' in text
+        assert 'ods_operations{ods_job="x",operation="data.export.foo"} 1\n' in text
+        assert 'ods_operation_rows{ods_job="x",operation="data.export.foo"} 2\n' in text
+        assert "ods_operation_bytes" not in text
+        assert 'ods_export_rows{ods_job="x",table="foo"} 2\n' in text
+        assert 'ods_backup_iterations{ods_job="x",set="db"} 4\n' in text
+        assert 'ods_backup_size_bytes{ods_job="x",set="db"} 5\n' in text
+        assert text.endswith("# EOF\n")
+
+    def test_render_escape(self) -> None:
+        """Label values are escaped."""
+        text = JobMetrics(job='x"y\\z').render(success=True, duration=1)
+
+        assert 'ods_job_success{ods_job="x\\"y\\\\z"} 1' in text
+
+    def test_record(self, tmp_path: Path) -> None:
+        """Jobs are timed and written to a textfile once complete."""
+        path = tmp_path / "x.prom"
+
+        with JobMetrics.record(job="x", path=path) as job:
+            job.bytes_written = 1
+
+        text = path.read_text()
+        assert 'ods_job_success{ods_job="x"} 1' in text
+        assert 'ods_job_written_bytes{ods_job="x"} 1' in text
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_record_no_path(self) -> None:
+        """Jobs can be recorded without writing a textfile."""
+        with JobMetrics.record(job="x") as job:
+            pass
+
+        assert job.path is None
+
+    def test_record_fail(self, tmp_path: Path) -> None:
+        """Failed jobs are recorded, keeping the last success timestamp from a previous run."""
+        path = tmp_path / "x.prom"
+        with JobMetrics.record(job="x", path=path):
+            pass
+        last_success = JobMetrics(job="x", path=path)._last_success()
+
+        with pytest.raises(RuntimeError), JobMetrics.record(job="x", path=path):
+            raise RuntimeError()
+
+        text = path.read_text()
+        assert 'ods_job_success{ods_job="x"} 0' in text
+        assert f'ods_job_last_success_timestamp_seconds{{ods_job="x"}} {last_success}' in text
+
+    def test_record_fail_never_succeeded(self, tmp_path: Path) -> None:
+        """Last success timestamp is omitted if a job has not previously succeeded."""
+        path = tmp_path / "x.prom"
+
+        with pytest.raises(RuntimeError), JobMetrics.record(job="x", path=path):
+            raise RuntimeError()
+
+        assert "ods_job_last_success_timestamp_seconds" not in path.read_text()
+
+    def test_record_cancelled(self, tmp_path: Path) -> None:
+        """Cancelled jobs are not recorded."""
+        path = tmp_path / "x.prom"
+
+        with JobMetrics.record(job="x", path=path) as job:
+            job.cancelled = True
+
+        assert path.exists() is False
+
+    def test_record_write_error(self, caplog: pytest.LogCaptureFixture, tmp_path: Path) -> None:
+        """Errors writing textfiles are logged without hiding errors from the job."""
+        path = tmp_path / "missing" / "x.prom"
+
+        with pytest.raises(RuntimeError), JobMetrics.record(job="x", path=path):
+            raise RuntimeError()
+
+        assert "Failed to write job metrics to:" in caplog.text
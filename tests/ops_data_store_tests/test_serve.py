@@ -0,0 +1,191 @@
+import os
+import threading
+import time
+
+import pytest
+from pytest_mock import MockFixture
+
+import ops_data_store.serve
+from ops_data_store.serve import Job, JobScheduler, send_command
+
+
+class TestJob:
+    """Tests for scheduled jobs."""
+
+    def test_str(self) -> None:
+        """Job state can be summarised."""
+        job = Job(name="x", interval=60, func=lambda: None)
+
+        assert str(job) == "x: every 60s, last run: never, last status: -"
+
+    def test_str_on_demand(self) -> None:
+        """Jobs without an interval are summarised as on demand."""
+        job = Job(name="x", interval=0, func=lambda: None)
+
+        assert "x: on demand" in str(job)
+
+
+class TestJobScheduler:
+    """Tests for app job scheduler."""
+
+    def test_init(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Can be initialised."""
+        scheduler = JobScheduler()
+
+        assert "Creating job scheduler." in caplog.text
+
+        assert isinstance(scheduler, JobScheduler)
+        assert list(scheduler.jobs.keys()) == ["backup", "convert", "sync"]
+
+    def test_init_no_sync(self, mocker: MockFixture) -> None:
+        """Sync job is not defined if sync groups are not configured."""
+        mocker.patch(
+            "ops_data_store.serve.Config.SERVE_SYNC_LDAP_GROUP", new_callable=mocker.PropertyMock, return_value=None
+        )
+
+        scheduler = JobScheduler()
+
+        assert list(scheduler.jobs.keys()) == ["backup", "convert"]
+
+    @pytest.mark.parametrize("name", ["backup", "convert", "sync"])
+    def test_run_job_ok(self, caplog: pytest.LogCaptureFixture, fx_job_scheduler: JobScheduler, name: str) -> None:
+        """Can run job."""
+        result = fx_job_scheduler.run_job(name=name)
+
+        assert result is True
+        assert fx_job_scheduler.jobs[name].last_status == "ok"
+        assert fx_job_scheduler.jobs[name].last_run is not None
+        assert f"Job '{name}' ok" in caplog.text
+
+    def test_run_job_fail(self, mocker: MockFixture, fx_job_scheduler: JobScheduler) -> None:
+        """Failing job is recorded rather than raised."""
+        mocker.patch.object(fx_job_scheduler.jobs["backup"], "func", side_effect=RuntimeError("x"))
+
+        result = fx_job_scheduler.run_job(name="backup")
+
+        assert result is False
+        assert fx_job_scheduler.jobs["backup"].last_status == "failed"
+
+    def test_sync_incremental(self, fx_job_scheduler: JobScheduler) -> None:
+        """Sync job is incremental if sync state path is configured."""
+        fx_job_scheduler.run_job(name="sync")
+
+        ops_data_store.serve.IncrementalSyncClient.return_value.sync.assert_called_once()
+        ops_data_store.serve.SimpleSyncClient.assert_not_called()
+
+    def test_sync_simple(self, mocker: MockFixture, fx_job_scheduler: JobScheduler) -> None:
+        """Sync job is not incremental if sync state path is not configured."""
+        mocker.patch(
+            "ops_data_store.serve.Config.AUTH_SYNC_STATE_PATH", new_callable=mocker.PropertyMock, return_value=None
+        )
+        fx_job_scheduler.run_job(name="sync")
+
+        ops_data_store.serve.SimpleSyncClient.return_value.sync.assert_called_once()
+        ops_data_store.serve.IncrementalSyncClient.assert_not_called()
+
+    def test_clients_reused(self, fx_job_scheduler: JobScheduler) -> None:
+        """Clients are created once and reused for later runs."""
+        fx_job_scheduler.run_job(name="convert")
+        data_client = fx_job_scheduler._data_client
+        fx_job_scheduler.run_job(name="convert")
+
+        assert fx_job_scheduler._data_client is data_client
+        assert data_client.convert.call_count == 2
+
+    def test_trigger_unknown(self, fx_job_scheduler: JobScheduler) -> None:
+        """Unknown jobs cannot be triggered."""
+        with pytest.raises(ValueError, match="Unknown job 'x'."):
+            fx_job_scheduler.trigger(name="x")
+
+    def test_run_triggered(self, fx_job_scheduler: JobScheduler) -> None:
+        """Triggered jobs are run until stopped."""
+        future = fx_job_scheduler.trigger(name="backup")
+        fx_job_scheduler.stop()
+
+        fx_job_scheduler.run()
+
+        assert future.result() is True
+        assert fx_job_scheduler.jobs["backup"].last_status == "ok"
+        assert fx_job_scheduler.jobs["convert"].last_status is None
+
+    def test_run_stopped_pending(self, fx_job_scheduler: JobScheduler) -> None:
+        """Triggered jobs not run before stopping are failed, and no more jobs can be triggered."""
+        fx_job_scheduler.stop()
+        future = fx_job_scheduler.trigger(name="backup")
+
+        fx_job_scheduler.run()
+
+        with pytest.raises(RuntimeError, match="Scheduler stopped before job 'backup' ran."):
+            future.result(timeout=1)
+        with pytest.raises(RuntimeError, match="Scheduler is stopping."):
+            fx_job_scheduler.trigger(name="backup")
+        assert fx_job_scheduler.jobs["backup"].last_status is None
+
+    def test_run_interrupted(self, mocker: MockFixture, fx_job_scheduler: JobScheduler) -> None:
+        """Triggered job is resolved if interrupted while running."""
+        mocker.patch.object(fx_job_scheduler, "run_job", side_effect=KeyboardInterrupt())
+        future = fx_job_scheduler.trigger(name="backup")
+
+        with pytest.raises(KeyboardInterrupt):
+            fx_job_scheduler.run()
+
+        assert future.result(timeout=1) is False
+
+    def test_run_scheduled(self, fx_job_scheduler: JobScheduler) -> None:
+        """Scheduled jobs are run when due."""
+        fx_job_scheduler.jobs["convert"].interval = 0.1
+
+        thread = threading.Thread(target=fx_job_scheduler.run)
+        thread.start()
+        time.sleep(0.3)
+        fx_job_scheduler.stop()
+        thread.join()
+
+        assert fx_job_scheduler.jobs["convert"].last_status == "ok"
+        assert fx_job_scheduler.jobs["backup"].last_status is None
+
+    def test_handle_command_status(self, fx_job_scheduler: JobScheduler) -> None:
+        """Status command summarises jobs."""
+        result = fx_job_scheduler.handle_command(command="status")
+
+        assert result.splitlines()[0].startswith("backup: every 86400s")
+
+    def test_handle_command_unknown(self, fx_job_scheduler: JobScheduler) -> None:
+        """Unknown commands are rejected."""
+        assert fx_job_scheduler.handle_command(command="x") == "No. Unknown command 'x'."
+        assert fx_job_scheduler.handle_command(command="run x") == "No. Unknown job 'x'."
+
+    def test_handle_command_stopped(self, fx_job_scheduler: JobScheduler) -> None:
+        """Jobs cannot be run once scheduler has stopped."""
+        fx_job_scheduler.stop()
+        fx_job_scheduler.run()
+
+        assert fx_job_scheduler.handle_command(command="run backup") == "No. Scheduler is stopping."
+
+    def test_control_socket(self, fx_job_scheduler: JobScheduler) -> None:
+        """Jobs can be run via control socket."""
+        thread = threading.Thread(target=fx_job_scheduler.run)
+        thread.start()
+        while fx_job_scheduler._server is None:
+            time.sleep(0.01)
+
+        result = send_command(path=fx_job_scheduler._socket_path, command="run backup", timeout=5)
+        fx_job_scheduler.stop()
+        thread.join()
+
+        assert result == "Ok. Job 'backup' completed."
+        assert not fx_job_scheduler._socket_path.exists()
+
+    def test_control_socket_permissions(self, fx_job_scheduler: JobScheduler) -> None:
+        """Control socket is only accessible to the application user from when it is created."""
+        umask = os.umask(0o022)
+        try:
+            fx_job_scheduler._start_control_server()
+            mode = fx_job_scheduler._socket_path.stat().st_mode & 0o777
+            restored_umask = os.umask(0o022)
+            fx_job_scheduler._stop_control_server()
+        finally:
+            os.umask(umask)
+
+        assert mode == 0o600
+        assert restored_umask == 0o022
@@ -0,0 +1,61 @@
+-- GENERATE ULID BENCHMARK
+--
+-- Compares the time to generate 1,000,000 values using the original `generate_ulid` implementation against the
+-- current `generate_ulid` and `generate_ulid_monotonic` functions, and checks values from each function are ordered
+-- as expected. Intended to be run against a development database with `psql` (so timings are shown) after
+-- `ods-ctl db setup`:
+--
+-- $ psql [DSN] -f tests/resources/db/generate_ulid_benchmark.sql
+--
+-- Only temporary objects are created, which are removed when the session ends.
+
+CREATE OR REPLACE FUNCTION pg_temp.generate_ulid_legacy() RETURNS uuid
+AS $$
+    SELECT (
+        lpad(to_hex(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint), 12, '0') ||
+        encode(gen_random_bytes(10), 'hex')
+    )::uuid;
+$$ LANGUAGE SQL;
+
+\timing on
+
+\echo 'Original generate_ulid:'
+SELECT count(DISTINCT pg_temp.generate_ulid_legacy()) FROM generate_series(1, 1000000);
+
+\echo 'Current generate_ulid:'
+SELECT count(DISTINCT generate_ulid()) FROM generate_series(1, 1000000);
+
+\echo 'generate_ulid_monotonic:'
+SELECT count(DISTINCT generate_ulid_monotonic()) FROM generate_series(1, 1000000);
+
+\timing off
+
+DO $$
+DECLARE
+    before_ms BIGINT := floor(extract(epoch FROM clock_timestamp()) * 1000);
+    after_ms BIGINT;
+    unordered INTEGER;
+    wrong_time INTEGER;
+BEGIN
+    CREATE TEMPORARY TABLE generate_ulid_cases AS
+        SELECT i, generate_ulid() AS ulid, generate_ulid_monotonic() AS ulid_monotonic
+        FROM generate_series(1, 100000) AS i;
+    after_ms := floor(extract(epoch FROM clock_timestamp()) * 1000);
+
+    -- timestamp component must be between the start and end of generating values
+    SELECT COUNT(*) INTO wrong_time
+    FROM generate_ulid_cases
+    WHERE ('x' || left(replace(ulid::TEXT, '-', ''), 12))::BIT(48)::BIGINT NOT BETWEEN before_ms AND after_ms;
+
+    -- monotonic values must be strictly ascending in the order they were generated
+    SELECT COUNT(*) INTO unordered
+    FROM (SELECT ulid_monotonic, lag(ulid_monotonic) OVER (ORDER BY i) AS previous FROM generate_ulid_cases) AS c
+    WHERE c.ulid_monotonic <= c.previous;
+
+    IF wrong_time > 0 OR unordered > 0 THEN
+        RAISE EXCEPTION 'generate_ulid: % values with unexpected timestamps, % monotonic values out of order.',
+            wrong_time, unordered;
+    END IF;
+
+    RAISE NOTICE 'generate_ulid: all values have expected timestamps and monotonic values are ascending.';
+END$$;
@@ -0,0 +1,90 @@
+-- GEOM AS DDM REGRESSION CHECKS
+--
+-- Compares the `geom_as_ddm_x`, `geom_as_ddm_y` and `geom_as_ddm` functions against the original plpgsql
+-- implementation of `geom_as_ddm` for a range of edge case and random points. Any difference in output is reported as
+-- an error. Intended to be run against a database after `ods-ctl db setup`:
+--
+-- $ ods-ctl db run --input-path tests/resources/db/geom_as_ddm.sql
+--
+-- Only temporary objects are created, which are removed when the session ends.
+
+CREATE OR REPLACE FUNCTION pg_temp.geom_as_ddm_legacy(geom GEOMETRY)
+    RETURNS ddm_point
+    IMMUTABLE
+    PARALLEL SAFE
+AS $$
+DECLARE
+    lon FLOAT;
+    lat FLOAT;
+    lon_degree FLOAT;
+    lon_minutes FLOAT;
+    lon_sign TEXT;
+    lat_degree FLOAT;
+    lat_minutes FLOAT;
+    lat_sign TEXT;
+    x TEXT;
+    y TEXT;
+BEGIN
+    lon := ST_X(geom);
+    lat := ST_Y(geom);
+
+    SELECT FLOOR(ABS(lon)), FLOOR(ABS(lat))
+    INTO lon_degree, lat_degree;
+
+    SELECT ((ABS(lon) - lon_degree) * 60.0), ((ABS(lat) - lat_degree) * 60.0)
+    INTO lon_minutes, lat_minutes;
+
+    IF lon >= 0 THEN
+        lon_sign := 'E';
+    ELSE
+        lon_sign := 'W';
+    END IF;
+
+    IF lat >= 0 THEN
+        lat_sign := 'N';
+    ELSE
+        lat_sign := 'S';
+    END IF;
+
+    x := CONCAT(CAST(lon_degree AS TEXT), '° ', TO_CHAR(lon_minutes, 'FM999999.999999'), ''' ', lon_sign);
+    y := CONCAT(CAST(lat_degree AS TEXT), '° ', TO_CHAR(lat_minutes, 'FM999999.999999'), ''' ', lat_sign);
+
+    RETURN (x, y);
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TEMPORARY TABLE geom_as_ddm_cases AS
+    -- edge cases: origin, negative zero, poles, anti-meridian, minutes which round up to 60 and tiny fractions
+    SELECT ST_SetSRID(ST_MakePoint(x, y), 4326) AS geom
+    FROM unnest(
+        ARRAY[0, -0.0, 0.5, -0.5, 1, -1, 90, -90, 180, -180, 179.9999999999, -179.9999999999, 63.00384657424354,
+              -63.00384657424354, 67.38243244822651, -67.38243244822651, 10.99999999, -10.99999999, 1e-10, -1e-10,
+              0.016666666666666666, 45.5, -45.5]::FLOAT[]
+    ) AS x
+    CROSS JOIN unnest(ARRAY[0, -0.0, 0.25, -0.25, 89.99999999, -89.99999999, -74.87542396172078, 52.1]::FLOAT[]) AS y
+    UNION ALL
+    -- a null geometry (generated columns are computed for rows without a geometry)
+    SELECT NULL::GEOMETRY
+    UNION ALL
+    -- random points across the full coordinate range
+    SELECT ST_SetSRID(ST_MakePoint(random() * 360 - 180, random() * 180 - 90), 4326)
+    FROM generate_series(1, 100000);
+
+DO $$
+DECLARE
+    mismatches INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO mismatches
+    FROM geom_as_ddm_cases
+    WHERE geom_as_ddm_x(geom) IS DISTINCT FROM (pg_temp.geom_as_ddm_legacy(geom)).x
+       OR geom_as_ddm_y(geom) IS DISTINCT FROM (pg_temp.geom_as_ddm_legacy(geom)).y
+       OR geom_as_ddm(geom) IS DISTINCT FROM pg_temp.geom_as_ddm_legacy(geom);
+
+    IF mismatches > 0 THEN
+        RAISE EXCEPTION 'geom_as_ddm regression: % of % cases differ from original implementation.',
+            mismatches, (SELECT COUNT(*) FROM geom_as_ddm_cases);
+    END IF;
+
+    RAISE NOTICE 'geom_as_ddm regression: all % cases match original implementation.',
+        (SELECT COUNT(*) FROM geom_as_ddm_cases);
+END$$;
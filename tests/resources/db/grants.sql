@@ -37,6 +37,11 @@ GRANT SELECT ON TABLE controlled.route_container TO ods_read;
 GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE controlled.route_waypoint TO ods_write_au;
 GRANT SELECT ON TABLE controlled.route_waypoint TO ods_read;
 
+-- ROUTE GEOMETRY
+
+GRANT SELECT ON TABLE controlled.route_geom TO ods_write_au;
+GRANT SELECT ON TABLE controlled.route_geom TO ods_read;
+
 -- ROUTE
 GRANT SELECT, INSERT, UPDATE, DELETE ON controlled.route TO ods_write_au;
 GRANT SELECT ON controlled.route TO ods_read;
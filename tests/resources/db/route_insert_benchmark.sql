@@ -0,0 +1,39 @@
+-- ROUTE INSERT BENCHMARK
+--
+-- Compares query plans for matching route vertices to waypoints, as in the `route_insert` trigger, with and without the
+-- `waypoint_geom_3857_idx` expression index. Intended to be run against a development database with `psql` (so plans
+-- are shown) after `ods-ctl db setup`:
+--
+-- $ psql [DSN] -f tests/resources/db/route_insert_benchmark.sql
+--
+-- All changes (including synthetic waypoints and the dropped index) are rolled back at the end of the script.
+
+BEGIN;
+
+INSERT INTO controlled.waypoint (id, geom)
+SELECT 'B' || i, ST_SetSRID(ST_MakePoint(random() * 100 - 100, random() * 25 - 85), 4326)
+FROM generate_series(1, 50000) AS i;
+
+ANALYZE controlled.waypoint;
+
+CREATE TEMPORARY TABLE benchmark_route ON COMMIT DROP AS
+SELECT ST_MakeLine(geom ORDER BY pk) AS geom
+FROM (SELECT pk, geom FROM controlled.waypoint ORDER BY random() LIMIT 20) AS w;
+
+\echo 'Vertex to waypoint matching with waypoint_geom_3857_idx:'
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT w.pid AS waypoint_pid, points.path[1] AS sequence
+FROM benchmark_route AS r
+CROSS JOIN LATERAL ST_DumpPoints(r.geom) AS points
+JOIN controlled.waypoint w ON ST_DWithin(ST_Transform(w.geom, 3857), ST_Transform(points.geom, 3857), 1000);
+
+DROP INDEX controlled.waypoint_geom_3857_idx;
+
+\echo 'Vertex to waypoint matching without waypoint_geom_3857_idx (previous behaviour):'
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT w.pid AS waypoint_pid, points.path[1] AS sequence
+FROM benchmark_route AS r
+CROSS JOIN LATERAL ST_DumpPoints(r.geom) AS points
+JOIN controlled.waypoint w ON ST_DWithin(ST_Transform(w.geom, 3857), ST_Transform(points.geom, 3857), 1000);
+
+ROLLBACK;